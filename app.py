@@ -7,9 +7,15 @@ import json
 import pandas as pd
 import io
 from datetime import datetime, timedelta
-from utils.resume_analyzer import ResumeAnalyzer
+from utils.resume_analyzer import ResumeAnalyzer, ANALYSIS_FIELDS
 from utils.resume_builder import ResumeBuilder
-from config.database import get_database_connection, save_resume_data, save_analysis_data, init_database, get_all_analysis
+from utils.render_cache import RenderCache, render_key
+from utils.resume_preview import SectionPreview
+from utils.batch_resumes import MAX_BATCH_RECORDS, missing_fields, record_resume_data, resume_filename, stream_resume_zip
+from utils.skill_index import SKILL_INDEX
+from utils.vector_index import VectorIndex, resume_index_text
+from utils.minhash import minhash_signature
+from config.database import get_database_connection, save_resume_data, save_analysis_data, init_database, get_all_analysis, search_resumes, analysis_record, find_resume_by_render_key
 from config.job_roles import JOB_ROLES
 from dashboard import DashboardManager
 from feedback.feedback import FeedbackManager
@@ -26,10 +32,13 @@ CORS(app, resources={
 
 resume_analyzer = ResumeAnalyzer()  
 resume_builder = ResumeBuilder()    
+render_cache = RenderCache()
+section_preview = SectionPreview()
 dashboard_manager = DashboardManager()
 feedback_manager = FeedbackManager()
 job_roles = JOB_ROLES
 init_database(app)
+vector_index = VectorIndex()
 os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
 
 def load_image(image_name):
@@ -44,6 +53,34 @@ def load_image(image_name):
         print(f"Error loading image {image_name}: {e}")
         return None
 
+def index_resume(resume_id, resume_data):
+    """Add a saved resume to the similar-resume index; failures only log"""
+    try:
+        vector_index.add(resume_id, resume_index_text(resume_data))
+    except Exception as e:
+        print(f"Error indexing resume {resume_id}: {e}")
+
+DOCX_MIMETYPE = 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+
+def send_resume_docx(resume_data, filename, key=None):
+    """DOCX download of resume_data, rendered only if the same data and
+    template are not in the render cache. The ETag is the render key, so a
+    client sending it back in If-None-Match gets a 304 without any render."""
+    if key is None:
+        key = render_key(resume_data)
+    if request.if_none_match.contains(key):
+        response = app.response_class(status=304)
+        response.set_etag(key)
+        return response
+    data, key = render_cache.get_or_render(resume_data, resume_builder.generate_resume)
+    return send_file(
+        io.BytesIO(data),
+        download_name=filename,
+        as_attachment=True,
+        mimetype=DOCX_MIMETYPE,
+        etag=key
+    )
+
 # Category mapping to align frontend with backend JOB_ROLES
 CATEGORY_MAPPING = {
     'Frontend': 'Software Development and Engineering',
@@ -68,6 +105,13 @@ def analyzer_route():
             
             if not file or not category or not role:
                 return jsonify({'status': 'error', 'message': 'Missing required fields: file, category, or role'}), 400
+
+            # Optional comma-separated subset of analysis fields; partial analyses are not persisted
+            fields = [field.strip() for field in request.form.get('fields', '').split(',') if field.strip()] or None
+            if fields:
+                unknown = [field for field in fields if field not in ANALYSIS_FIELDS]
+                if unknown:
+                    return jsonify({'status': 'error', 'message': f'Unknown fields: {", ".join(unknown)}. Available fields: {list(ANALYSIS_FIELDS)}'}), 400
             
             filename = secure_filename(file.filename)
             if not (filename.endswith('.pdf') or filename.endswith('.docx')):
@@ -76,12 +120,12 @@ def analyzer_route():
             text = ""
             if filename.endswith('.pdf'):
                 file.seek(0)
-                text = resume_analyzer.extract_text_from_pdf(file)
+                text = resume_analyzer.extract_text_from_pdf(file, screen_non_resumes=True)
             elif filename.endswith('.docx'):
                 file_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
                 file.save(file_path)
                 try:
-                    text = resume_analyzer.extract_text_from_docx(file_path)
+                    text = resume_analyzer.extract_text_from_docx(file_path, screen_non_resumes=True)
                 finally:
                     if os.path.exists(file_path):
                         os.remove(file_path)
@@ -95,7 +139,9 @@ def analyzer_route():
                 return jsonify({'status': 'error', 'message': f'Invalid category "{category}" or role "{role}" selected. Available categories: {list(job_roles.keys())}'}), 400
 
             role_info = job_roles[mapped_category][role]
-            analysis = resume_analyzer.analyze_resume({'raw_text': text}, role_info)
+            analysis = resume_analyzer.analyze_resume({'raw_text': text}, role_info, fields=fields)
+            if fields:
+                return jsonify({'status': 'success', 'analysis': analysis})
 
             resume_data = {
                 'personal_info': {
@@ -116,16 +162,10 @@ def analyzer_route():
                 'template': ''
             }
             
-            resume_id = save_resume_data(resume_data)
-            analysis_data = {
-                'resume_id': resume_id,
-                'ats_score': analysis['ats_score'],
-                'keyword_match_score': analysis['keyword_match']['score'],
-                'format_score': analysis['format_score'],
-                'section_score': analysis['section_score'],
-                'missing_skills': ','.join(analysis['keyword_match']['missing_skills']),
-                'recommendations': ','.join(analysis['suggestions'])
-            }
+            # Built first so a malformed analysis fails before anything is stored
+            analysis_data = analysis_record(analysis, resume_analyzer.scoring_version)
+            resume_id = save_resume_data(resume_data, minhash=minhash_signature(text), raw_text=text)
+            index_resume(resume_id, resume_data)
             save_analysis_data(resume_id, analysis_data)
             
             session['analytics_data'] = analysis
@@ -218,77 +258,73 @@ def builder_route():
                 'template': template
             }
             
-            resume_buffer = resume_builder.generate_resume(resume_data)
-            if resume_buffer:
-                resume_id = save_resume_data(resume_data)
-                session['selected_resume_id'] = resume_id
-                filename = f"{form_data['personal_info']['full_name'].replace(' ', '_')}_resume.docx"
-                return send_file(
-                    resume_buffer,
-                    download_name=filename,
-                    as_attachment=True,
-                    mimetype='application/vnd.openxmlformats-officedocument.wordprocessingml.document'
-                )
-            else:
-                return jsonify({'status': 'error', 'message': 'Failed to generate resume'}), 500
+            filename = f"{form_data['personal_info']['full_name'].replace(' ', '_')}_resume.docx"
+            key = render_key(resume_data)
+            response = send_resume_docx(resume_data, filename, key)
+            # Revalidations and repeat downloads of the same resume are not stored again
+            resume_id = find_resume_by_render_key(key)
+            if resume_id is None:
+                resume_id = save_resume_data(resume_data, render_key=key)
+                index_resume(resume_id, resume_data)
+            session['selected_resume_id'] = resume_id
+            return response
         except Exception as e:
             return jsonify({'status': 'error', 'message': str(e)}), 500
     form_data = session.get('form_data', {})
     return render_template('builder.html', session=session, form_data=form_data)
 
+@app.route('/builder/preview', methods=['POST'])
+def builder_preview_route():
+    """Live preview: builder form data as per-section HTML fragments, each
+    with a content hash the frontend can compare to skip unchanged sections"""
+    try:
+        payload = request.get_json(silent=True)
+        if not isinstance(payload, dict) or not isinstance(payload.get('form_data', {}), dict):
+            return jsonify({'status': 'error', 'message': 'Expected a JSON object with a form_data object'}), 400
+        template = str(payload.get('template', 'Modern'))
+        sections = section_preview.render(payload.get('form_data', {}), template)
+        return jsonify({'status': 'success', 'template': template, 'sections': sections})
+    except Exception as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 500
+
 @app.route('/generate_resume', methods=['POST'])
 def generate_resume_route():
     try:
         data = request.get_json()
         if not data:
             return jsonify({"error": "No data provided"}), 400
-        required_fields = ['name', 'email', 'phone', 'education', 'experience', 'skills']
-        missing_fields = [field for field in required_fields if not data.get(field)]
-        if missing_fields:
-            return jsonify({"error": f"Missing fields: {', '.join(missing_fields)}"}), 400
-        resume_data = {
-            'personal_info': {
-                'full_name': data['name'],
-                'email': data['email'],
-                'phone': data['phone']
-            },
-            'summary': '',
-            'experience': data['experience'],
-            'education': data['education'],
-            'projects': [],
-            'skills': {
-                'technical': data['skills'],
-                'soft': [],
-                'languages': [],
-                'tools': []
-            },
-            'skills_categories': {
-                'technical': data['skills'],
-                'soft': [],
-                'languages': [],
-                'tools': []
-            },
-            'template': 'Modern'
-        }
-        resume_buffer = resume_builder.generate_resume(resume_data)
-        if resume_buffer:
-            filename = f"{data['name'].replace(' ', '_')}_resume.docx"
-            return send_file(
-                resume_buffer,
-                download_name=filename,
-                as_attachment=True,
-                mimetype='application/vnd.openxmlformats-officedocument.wordprocessingml.document'
-            )
-        else:
-            return jsonify({"error": "Failed to generate resume"}), 500
+        missing = missing_fields(data)
+        if missing:
+            return jsonify({"error": f"Missing fields: {', '.join(missing)}"}), 400
+        resume_data = record_resume_data(data)
+        filename = resume_filename(data)
+        return send_resume_docx(resume_data, filename)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+@app.route('/generate_resume/batch', methods=['POST'])
+def generate_resume_batch_route():
+    """A JSON array of /generate_resume records as a streamed ZIP: one DOCX
+    per record in completion order, then manifest.json with each record's
+    file or error"""
+    records = request.get_json(silent=True)
+    if not isinstance(records, list) or not records:
+        return jsonify({"error": "Expected a non-empty JSON array of records"}), 400
+    if len(records) > MAX_BATCH_RECORDS:
+        return jsonify({"error": f"At most {MAX_BATCH_RECORDS} records per batch"}), 413
+    return app.response_class(
+        stream_resume_zip(records, resume_builder),
+        mimetype='application/zip',
+        headers={'Content-Disposition': 'attachment; filename=resumes.zip'}
+    )
+
 @app.route('/dashboard')
 def dashboard():
     session['page'] = 'dashboard'
     analysis_data = get_all_analysis()
     total_resumes = len(analysis_data)
+    # Re-uploads flagged as near-duplicates of an earlier resume are one candidate
+    unique_candidates = sum(1 for row in analysis_data if row['duplicate_of'] is None)
     avg_ats_score = 0.0
     high_performing = 0
     success_rate = 0.0
@@ -322,7 +358,7 @@ def dashboard():
             skills = eval(skills_str) if skills_str else []
             if isinstance(skills, dict):
                 skills = skills.get('technical', []) + skills.get('soft', [])
-            skill_distribution.update(skills)
+            skill_distribution.update(SKILL_INDEX.count_skills(skills))
         today = datetime.now()
         for row in analysis_data:
             upload_date = datetime.strptime(row['created_at'], '%Y-%m-%d %H:%M:%S')
@@ -347,6 +383,7 @@ def dashboard():
 
     dashboard_data = {
         'total_resumes': total_resumes,
+        'unique_candidates': unique_candidates,
         'avg_ats_score': avg_ats_score,
         'high_performing': high_performing,
         'success_rate': success_rate,
@@ -364,6 +401,73 @@ def select_resume(resume_id):
     session['selected_resume_id'] = resume_id
     return jsonify({'status': 'success'})
 
+@app.route('/similar_resumes')
+def similar_resumes():
+    """Top-k stored resumes most similar to a stored resume (resume_id) or to free text (text)"""
+    try:
+        k = max(1, min(int(request.args.get('k', 10)), 100))
+        resume_id = request.args.get('resume_id', type=int)
+        text = request.args.get('text', '')
+        conn = get_database_connection()
+        exclude = ()
+        if resume_id is not None:
+            row = conn.execute('SELECT * FROM resume_data WHERE id = ?', (resume_id,)).fetchone()
+            if row is None:
+                return jsonify({'status': 'error', 'message': f'Resume {resume_id} not found'}), 404
+            text = resume_index_text(row)
+            exclude = (resume_id,)
+        if not text.strip():
+            return jsonify({'status': 'error', 'message': 'Provide a resume_id or some text to compare against'}), 400
+
+        matches = vector_index.query(text, k=k, exclude=exclude)
+        rows = {}
+        if matches:
+            placeholders = ','.join('?' * len(matches))
+            rows = {row['id']: row for row in conn.execute(
+                f'SELECT id, name, target_role, target_category FROM resume_data WHERE id IN ({placeholders})',
+                [match_id for match_id, _ in matches])}
+        results = [
+            {
+                'resume_id': match_id,
+                'score': round(score * 100, 2),
+                'name': rows[match_id]['name'],
+                'target_role': rows[match_id]['target_role'],
+                'target_category': rows[match_id]['target_category']
+            }
+            for match_id, score in matches if match_id in rows
+        ]
+        return jsonify({'status': 'success', 'results': results})
+    except ValueError:
+        return jsonify({'status': 'error', 'message': 'k must be an integer'}), 400
+    except Exception as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 500
+
+@app.route('/search')
+def search():
+    """Full-text resume search: q, optional role/category filters, limit and the
+    `next` cursor of the previous page as cursor"""
+    query = request.args.get('q', '')
+    if not query.strip():
+        return jsonify({'status': 'error', 'message': 'Missing search query (q)'}), 400
+    try:
+        limit = max(1, min(int(request.args.get('limit', 20)), 100))
+        after = None
+        if request.args.get('cursor'):
+            score, resume_id = request.args['cursor'].rsplit(':', 1)
+            after = (float(score), int(resume_id))
+    except ValueError:
+        return jsonify({'status': 'error', 'message': 'limit must be an integer and cursor a value from a previous page'}), 400
+    try:
+        results, next_cursor = search_resumes(query, role=request.args.get('role'),
+                                              category=request.args.get('category'), after=after, limit=limit)
+        return jsonify({
+            'status': 'success',
+            'results': results,
+            'next': ':'.join(map(repr, next_cursor)) if next_cursor else None
+        })
+    except Exception as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 500
+
 @app.route('/job_search')
 def job_search():
     session['page'] = 'job_search'
@@ -0,0 +1,61 @@
+"""Check streaming DOCX extraction against python-docx and compare cost.
+
+Peak figures are Python-heap peaks from tracemalloc; lxml's own C allocations
+(python-docx's tree) are not included, so they understate the reference.
+
+Run from the repository root: python -m benchmarks.bench_docx_extraction
+"""
+import io
+import time
+import tracemalloc
+
+from docx import Document
+from docx.table import Table, _Cell
+from docx.text.paragraph import Paragraph
+
+from benchmarks.fixtures import make_docx
+from utils.docx_extraction import extract_docx_text
+
+PARAGRAPH_COUNTS = [100, 1000, 5000]
+
+
+def _iter_block_text(parent):
+    for block in parent.iter_inner_content():
+        if isinstance(block, Paragraph):
+            yield block.text
+        elif isinstance(block, Table):
+            # Walk w:tc elements directly; `row.cells` repeats merged cells.
+            for tr in block._tbl.tr_lst:
+                for tc in tr.tc_lst:
+                    yield from _iter_block_text(_Cell(tc, block))
+
+
+def python_docx_text(docx_bytes):
+    """Reference extraction: python-docx object model, body and tables in document order"""
+    doc = Document(io.BytesIO(docx_bytes))
+    return '\n'.join(text for text in _iter_block_text(doc) if text.strip())
+
+
+def _measure(extract, docx_bytes):
+    tracemalloc.start()
+    start = time.perf_counter()
+    text = extract(io.BytesIO(docx_bytes) if extract is extract_docx_text else docx_bytes)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return text, elapsed, peak
+
+
+def main():
+    print(f"{'paragraphs':>10} {'python-docx ms':>15} {'py peak MB':>10} {'streaming ms':>13} {'py peak MB':>10} {'speedup':>8}")
+    for paragraph_count in PARAGRAPH_COUNTS:
+        docx_bytes = make_docx(paragraph_count)
+        expected, reference_time, reference_peak = _measure(python_docx_text, docx_bytes)
+        text, streaming_time, streaming_peak = _measure(extract_docx_text, docx_bytes)
+        assert text == expected, "streaming extraction differs from python-docx"
+        print(f"{paragraph_count:>10} {reference_time * 1000:>15.1f} {reference_peak / 2**20:>10.1f} "
+              f"{streaming_time * 1000:>13.1f} {streaming_peak / 2**20:>10.1f} {reference_time / streaming_time:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+"""Report extraction speed and section-detection yield per PDF backend.
+
+Run from the repository root: python -m benchmarks.bench_extraction_backends
+"""
+import io
+import time
+from statistics import median
+
+from benchmarks.fixtures import make_corpus
+from utils.pdf_extraction import BACKENDS, extract_pdf_text
+from utils.resume_analyzer import ResumeAnalyzer
+
+REPEATS = 5
+SECTIONS = ['summary', 'experience', 'education', 'projects', 'skills']
+
+
+def _section_yield(analyzer, text):
+    found = {
+        'summary': analyzer.extract_summary(text),
+        'experience': analyzer.extract_experience(text),
+        'education': analyzer.extract_education(text),
+        'projects': analyzer.extract_projects(text),
+        'skills': analyzer.extract_skills(text),
+    }
+    return sum(1 for section in SECTIONS if found[section]), len(found['skills'])
+
+
+def main():
+    analyzer = ResumeAnalyzer()
+    extractors = {name: (lambda pdf_bytes, name=name: extract_pdf_text(io.BytesIO(pdf_bytes), backend=name))
+                  for name in BACKENDS}
+    extractors['default strategy'] = lambda pdf_bytes: extract_pdf_text(io.BytesIO(pdf_bytes))
+
+    print(f"{'fixture':<18} {'backend':<17} {'median ms':>10} {'sections':>9} {'skills':>7}")
+    for fixture, pdf_bytes in make_corpus().items():
+        for name, extract in extractors.items():
+            samples = []
+            for _ in range(REPEATS):
+                start = time.perf_counter()
+                text = extract(pdf_bytes)
+                samples.append(time.perf_counter() - start)
+            sections, skills = _section_yield(analyzer, text)
+            print(f"{fixture:<18} {name:<17} {median(samples) * 1000:>10.2f} "
+                  f"{sections:>5}/{len(SECTIONS)} {skills:>7}")
+
+
+if __name__ == '__main__':
+    main()
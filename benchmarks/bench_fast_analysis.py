@@ -0,0 +1,48 @@
+"""Compare the regex fast path (parse=False) with the full spaCy analysis.
+
+Reports per-document latency of both and how often the fast path agrees
+with the parse on each metric.
+
+Run from the repository root: python -m benchmarks.bench_fast_analysis [model]
+`model` defaults to en_core_web_sm and may be a package name or a path.
+"""
+import sys
+import time
+
+from benchmarks.fixtures import RESUME_LINES, make_resume_texts
+from resume_analytics import analyzer
+
+DOC_COUNT = 300
+
+
+def _timed(run, texts):
+    start = time.perf_counter()
+    results = [run(text) for text in texts]
+    return (time.perf_counter() - start) / len(texts), results
+
+
+def main():
+    if len(sys.argv) > 1:
+        analyzer.MODEL_NAME = sys.argv[1]
+    texts = ['\n'.join(RESUME_LINES)] + make_resume_texts(DOC_COUNT - 1)
+
+    fast = analyzer.ResumeAnalyzer(parse=False)
+    fast_latency, fast_results = _timed(fast.analyze_resume, texts)
+    full = analyzer.ResumeAnalyzer()
+    full.analyze_resume(texts[0])  # load the model outside the timings
+    full_latency, full_results = _timed(full.analyze_resume, texts)
+
+    print(f"{DOC_COUNT} docs, model {analyzer.MODEL_NAME}")
+    print(f"{'path':>8} {'us/doc':>10}")
+    print(f"{'parse':>8} {full_latency * 1e6:>10.0f}")
+    print(f"{'fast':>8} {fast_latency * 1e6:>10.0f}   {full_latency / fast_latency:.0f}x faster")
+    print(f"{'metric':>18} {'agreement':>10}")
+    for metric in ('word_count', 'experience_years', 'skills_count', 'sentence_count', 'profile_score'):
+        same = sum(f['metrics'][metric] == p['metrics'][metric] for f, p in zip(fast_results, full_results))
+        print(f"{metric:>18} {same / DOC_COUNT:>10.1%}")
+    same_skills = sum(set(f['skills']) == set(p['skills']) for f, p in zip(fast_results, full_results))
+    print(f"{'skill sets':>18} {same_skills / DOC_COUNT:>10.1%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""/search latency over a large resume_data table.
+
+Fills resumes.db in a temporary directory with synthetic rows (the FTS
+index is maintained by its triggers as they are inserted), then times
+search_resumes for common and rare terms, with a role filter, and deep
+into the results via the keyset cursor.
+
+Run from the repository root: python -m benchmarks.bench_fts_search [rows]
+"""
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+from flask import Flask
+
+from benchmarks.fixtures import make_resume_rows
+from config.database import init_database, search_resumes
+
+QUERIES = [
+    ('common term', 'python', None),
+    ('two terms', 'kubernetes monitoring', None),
+    ('rare term', 'tensorflow figma typography', None),
+    ('role filter', 'python', 'Data Scientist'),
+]
+REPEATS = 5
+INSERT_BATCH = 10000
+
+
+def _fill(count):
+    conn = sqlite3.connect('resumes.db')
+    columns = ('name', 'target_role', 'target_category', 'summary', 'skills', 'experience', 'projects', 'education')
+    sql = f"INSERT INTO resume_data ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+    for offset in range(0, count, INSERT_BATCH):
+        rows = make_resume_rows(min(INSERT_BATCH, count - offset), seed=offset)
+        conn.executemany(sql, [(f"Candidate {offset + i}", row['target_role'], 'Synthetic', row['summary'],
+                                row['skills'], row['experience'], row['projects'], row['education'])
+                               for i, row in enumerate(rows)])
+        conn.commit()
+    conn.close()
+
+
+def _timed(function):
+    best = None
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    app = Flask(__name__)
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        try:
+            init_database()
+            start = time.perf_counter()
+            _fill(count)
+            print(f"{count} rows inserted and indexed in {time.perf_counter() - start:.1f} s")
+
+            print(f"{'query':>14} {'first page ms':>14} {'page 20 ms':>11}")
+            with app.app_context():
+                for label, query, role in QUERIES:
+                    first_time, (_, cursor) = _timed(lambda: search_resumes(query, role=role))
+                    for _ in range(18):
+                        if cursor is None:
+                            break
+                        _, cursor = search_resumes(query, role=role, after=cursor)
+                    deep_time = _timed(lambda: search_resumes(query, role=role, after=cursor))[0] if cursor else 0
+                    print(f"{label:>14} {first_time * 1000:>14.1f} {deep_time * 1000:>11.1f}")
+        finally:
+            os.chdir(cwd)
+
+
+if __name__ == '__main__':
+    main()
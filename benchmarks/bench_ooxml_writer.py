@@ -0,0 +1,91 @@
+"""Direct OOXML writer against python-docx for resume generation.
+
+First checks that both backends produce the same package for every
+template over a set of data variants: the same parts, each either
+byte-identical or equal as canonical XML. Then reports docs/s per backend.
+
+Run from the repository root: python -m benchmarks.bench_ooxml_writer
+"""
+import contextlib
+import copy
+import io
+import sys
+import time
+import zipfile
+
+from lxml import etree
+
+from benchmarks.fixtures import BUILDER_DATA
+from utils.resume_builder import ResumeBuilder
+
+DOCUMENTS = 200
+
+
+def _variants():
+    sparse = copy.deepcopy(BUILDER_DATA)
+    sparse['personal_info'] = {'full_name': '', 'email': '', 'phone': ''}
+    sparse['summary'] = ''
+    sparse['projects'] = []
+    sparse['skills'] = {'technical': ['  '], 'soft': '', 'languages': 'a\n\nb', 'tools': None}
+
+    awkward = copy.deepcopy(BUILDER_DATA)
+    awkward['personal_info']['full_name'] = ' Zoë <O\'Brien> & "Co" '
+    awkward['summary'] = 'tab\there\r\nline two  \n trailing '
+    awkward['experience'][0]['responsibilities'] = ['  ', 'a {x} b', '🚀 shipped']
+    awkward['education'][0]['gpa'] = ''
+    return [BUILDER_DATA, sparse, awkward]
+
+
+def _generate(builder, data, backend):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return builder.generate_resume(copy.deepcopy(data), backend=backend).getvalue()
+
+
+def _compare(expected, actual):
+    """Names of parts that differ between two DOCX packages"""
+    expected, actual = zipfile.ZipFile(io.BytesIO(expected)), zipfile.ZipFile(io.BytesIO(actual))
+    names = set(expected.namelist())
+    differing = sorted(names.symmetric_difference(actual.namelist()))
+    for name in sorted(names.intersection(actual.namelist())):
+        a, b = expected.read(name), actual.read(name)
+        if a != b and (not name.endswith('.xml') or _canonical(a) != _canonical(b)):
+            differing.append(name)
+    return differing
+
+
+def _canonical(xml):
+    return etree.tostring(etree.fromstring(xml), method='c14n')
+
+
+def _per_second(run, count):
+    start = time.perf_counter()
+    for _ in range(count):
+        run()
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    builder = ResumeBuilder()
+    failures = 0
+    for template in builder.plans:
+        for index, variant in enumerate(_variants()):
+            data = dict(variant, template=template)
+            differing = _compare(_generate(builder, data, 'python-docx'), _generate(builder, data, 'ooxml'))
+            if differing:
+                failures += 1
+                print(f"MISMATCH {template} variant {index}: {', '.join(differing)}")
+    print(f"structural comparison: {failures} mismatching documents")
+
+    print(f"{'template':>13} {'python-docx/s':>14} {'ooxml/s':>9} {'speedup':>8}")
+    for template in builder.plans:
+        data = dict(BUILDER_DATA, template=template)
+        with contextlib.redirect_stdout(io.StringIO()):
+            docx = _per_second(lambda: builder.generate_resume(data), DOCUMENTS)
+            ooxml = _per_second(lambda: builder.generate_resume(data, backend='ooxml'), DOCUMENTS * 10)
+        print(f"{template:>13} {docx:>14.1f} {ooxml:>9.1f} {ooxml / docx:>7.1f}x")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+"""Compare sequential and page-parallel PDF extraction latency by page count.
+
+Run from the repository root: python -m benchmarks.bench_pdf_extraction
+"""
+import time
+from statistics import median
+
+from benchmarks.fixtures import make_pdf
+from utils.pdf_extraction import MAX_WORKERS, PyPDF2Backend, _available_cpus, shutdown_pdf_pool
+
+PAGE_COUNTS = [1, 4, 16, 32, 64, 128]
+REPEATS = 3
+
+
+def _time(pdf_bytes, threshold):
+    samples = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        text, _ = PyPDF2Backend(parallel_threshold=threshold).extract(pdf_bytes)
+        samples.append(time.perf_counter() - start)
+    return median(samples), text
+
+
+def main():
+    # Warm the pool so worker start-up is not charged to the first row.
+    PyPDF2Backend(parallel_threshold=1).extract(make_pdf(2))
+    workers = min(MAX_WORKERS, _available_cpus())
+    print(f"pool workers: {workers}" + (" (parallel path disabled, fewer than 2 CPUs)" if workers < 2 else ""))
+    print(f"{'pages':>6} {'sequential ms':>14} {'parallel ms':>12} {'speedup':>8}")
+    for page_count in PAGE_COUNTS:
+        pdf_bytes = make_pdf(page_count)
+        sequential, expected = _time(pdf_bytes, threshold=float('inf'))
+        parallel, text = _time(pdf_bytes, threshold=1)
+        assert text == expected, "parallel extraction changed the output"
+        print(f"{page_count:>6} {sequential * 1000:>14.1f} {parallel * 1000:>12.1f} {sequential / parallel:>7.2f}x")
+    shutdown_pdf_pool()
+
+
+if __name__ == '__main__':
+    main()
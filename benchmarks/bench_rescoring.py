@@ -0,0 +1,82 @@
+"""Throughput of the ATS rescoring job.
+
+Fills resume_analysis in a temporary database with synthetic section scores
+(as the analyzer produces them), checks the vectorized formula against
+ResumeAnalyzer's, then rescores every row with a second set of weights.
+
+Run from the repository root: python -m benchmarks.bench_rescoring [rows]
+"""
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from config.database import SECTION_SCORE_COLUMNS, init_database
+from config.scoring import SCORE_SECTIONS, SCORING_WEIGHTS, scoring_weights
+from utils.rescoring import ats_scores, rescore_analyses
+from utils.resume_analyzer import ResumeAnalyzer
+
+BENCH_VERSION = max(SCORING_WEIGHTS) + 1
+INSERT_BATCH = 100000
+
+
+def _section_scores(rng):
+    return {
+        'contact': 100 - 25 * rng.randint(0, 3),
+        'summary': 100 - 33 * rng.randint(0, 1),
+        'skills': 100 * rng.randint(0, 8) / 8,
+        'experience': 100 - 25 * rng.randint(0, 4),
+        'education': 100 - 25 * rng.randint(0, 3),
+        'format': max(0, 100 - rng.choice([0, 15, 20, 30, 35, 50, 65])),
+    }
+
+
+def _fill(count, rng):
+    conn = sqlite3.connect('resumes.db')
+    columns = ['resume_id', 'ats_score', *(SECTION_SCORE_COLUMNS[section] for section in SCORE_SECTIONS)]
+    sql = f"INSERT INTO resume_analysis ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+    for offset in range(0, count, INSERT_BATCH):
+        rows = []
+        for i in range(offset, min(offset + INSERT_BATCH, count)):
+            scores = _section_scores(rng)
+            rows.append((i, 0, *(scores[section] for section in SCORE_SECTIONS)))
+        conn.executemany(sql, rows)
+        conn.commit()
+    conn.close()
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000000
+    rng = random.Random(0)
+
+    analyzer = ResumeAnalyzer()
+    samples = [_section_scores(rng) for _ in range(10000)]
+    expected = [analyzer._stage_ats_score(None, scores) for scores in samples]
+    vectorized = ats_scores(np.array([[scores[s] for s in SCORE_SECTIONS] for scores in samples]),
+                            scoring_weights())
+    assert vectorized.tolist() == expected, "vectorized ATS formula disagrees with the analyzer"
+
+    SCORING_WEIGHTS[BENCH_VERSION] = dict(zip(SCORE_SECTIONS, (0.15, 0.05, 0.35, 0.25, 0.1, 0.1)))
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        try:
+            init_database()
+            _fill(count, rng)
+            # The rerun finds every row current, so it only reads and recomputes
+            for label in ('new weights', 'rerun'):
+                start = time.perf_counter()
+                rescored, changed, _ = rescore_analyses(version=BENCH_VERSION)
+                elapsed = time.perf_counter() - start
+                print(f"{label}: {rescored} rows rescored, {changed} changed in {elapsed:.1f} s "
+                      f"({rescored / elapsed * 60 / 1e6:.1f}M rows/min)")
+        finally:
+            os.chdir(cwd)
+
+
+if __name__ == '__main__':
+    main()
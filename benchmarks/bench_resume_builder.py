@@ -0,0 +1,41 @@
+"""Resume generation throughput per template.
+
+Reports full generate_resume docs/s and the time spent rendering the
+compiled plan alone, which is what the declarative templates cost before
+any document is written.
+
+Run from the repository root: python -m benchmarks.bench_resume_builder
+"""
+import contextlib
+import io
+import time
+
+from benchmarks.fixtures import BUILDER_DATA
+from utils.resume_builder import ResumeBuilder
+
+DOCUMENTS = 200
+
+
+def _per_second(run, count):
+    start = time.perf_counter()
+    for _ in range(count):
+        run()
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    start = time.perf_counter()
+    builder = ResumeBuilder()
+    print(f"plans compiled and base documents prepared in {(time.perf_counter() - start) * 1000:.0f} ms, "
+          f"{sum(map(len, builder.base_documents.values())) / 1024:.0f} KB")
+    print(f"{'template':>13} {'docs/s':>8} {'plan render us':>15}")
+    for template, plan in builder.plans.items():
+        data = dict(BUILDER_DATA, template=template)
+        with contextlib.redirect_stdout(io.StringIO()):
+            docs = _per_second(lambda: builder.generate_resume(data), DOCUMENTS)
+        renders = _per_second(lambda: plan.render(data), DOCUMENTS * 50)
+        print(f"{template:>13} {docs:>8.1f} {1e6 / renders:>15.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""Peak allocations of the analyzer stages before and after ResumeDocument.
+
+"legacy" runs the stages as they were before ResumeDocument
+(benchmarks/legacy_resume_analyzer.py), each deriving its own lowered copy,
+line split and stripped lines from the text. "shared" builds one
+ResumeDocument and passes it to every current stage. "doc KB" is what a
+ResumeDocument retains; "line lists KB" is what keeping the split, stripped
+and lowered line lists would retain. On a 190 KB text the peak goes from
+about 1.85 MB to 0.67 MB. Timings are close rather than faster because the
+current stages also do alias-aware skill matching.
+
+Run from the repository root: python -m benchmarks.bench_resume_document
+"""
+import time
+import tracemalloc
+
+from benchmarks.fixtures import RESUME_LINES
+from benchmarks.legacy_resume_analyzer import LegacyResumeAnalyzer
+from config.job_roles import JOB_ROLES
+from utils.resume_analyzer import ResumeAnalyzer
+from utils.resume_document import ResumeDocument
+
+REPEATS = [1, 10, 100, 400]
+REQUIRED_SKILLS = JOB_ROLES['Software Development and Engineering']['Backend Developer']['required_skills']
+
+
+def run_stages(analyzer, document):
+    analyzer.detect_document_type(document)
+    analyzer.extract_personal_info(document)
+    analyzer.calculate_keyword_match(document, REQUIRED_SKILLS)
+    analyzer.extract_education(document)
+    analyzer.extract_experience(document)
+    analyzer.extract_projects(document)
+    analyzer.extract_skills(document)
+    analyzer.extract_summary(document)
+    analyzer.check_resume_sections(document)
+    analyzer.check_formatting(document)
+
+
+def _measure(analyzer, text, prepare):
+    start = time.perf_counter()
+    run_stages(analyzer, prepare(text))
+    elapsed = time.perf_counter() - start
+    # Timed separately: tracing every allocation skews the timings
+    tracemalloc.start()
+    run_stages(analyzer, prepare(text))
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def _retained(build, text):
+    tracemalloc.start()
+    kept = build(text)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return size
+
+
+def _line_lists(text):
+    lines = text.split('\n')
+    stripped = [line.strip() for line in lines]
+    return text.lower(), lines, stripped, [line.lower() for line in stripped]
+
+
+def main():
+    legacy, analyzer = LegacyResumeAnalyzer(), ResumeAnalyzer()
+    print(f"{'text KB':>8} {'doc KB':>7} {'line lists KB':>14} {'legacy peak KB':>15} "
+          f"{'shared peak KB':>15} {'legacy ms':>10} {'shared ms':>10}")
+    for repeat in REPEATS:
+        text = '\n'.join(RESUME_LINES * repeat)
+        document_size = _retained(ResumeDocument, text)
+        line_lists_size = _retained(_line_lists, text)
+        legacy_time, legacy_peak = _measure(legacy, text, str)
+        shared_time, shared_peak = _measure(analyzer, text, ResumeDocument)
+        print(f"{len(text) / 1024:>8.1f} {document_size / 1024:>7.1f} {line_lists_size / 1024:>14.1f} "
+              f"{legacy_peak / 1024:>15.1f} {shared_peak / 1024:>15.1f} "
+              f"{legacy_time * 1000:>10.1f} {shared_time * 1000:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
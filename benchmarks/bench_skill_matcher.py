@@ -0,0 +1,83 @@
+"""Cost of skill extraction on top of the spaCy parse.
+
+Compares the parse alone, the parse with the skill_matcher component, and
+the parse followed by the previous extraction: a Python loop building a
+lowercased bigram string per token to test against a fixed set.
+
+Run from the repository root: python -m benchmarks.bench_skill_matcher [model]
+`model` defaults to en_core_web_sm and may be a package name or a path.
+"""
+import sys
+import time
+
+from benchmarks.fixtures import make_resume_texts
+from resume_analytics import analyzer
+
+DOC_COUNT = 500
+REPEATS = 3
+
+LEGACY_SKILLS = {
+    "python", "java", "javascript", "react", "node.js", "sql",
+    "html", "css", "aws", "docker", "kubernetes", "git",
+    "machine learning", "ai", "data science", "analytics"
+}
+
+
+def legacy_skills(doc):
+    skills = set()
+    for token in doc:
+        if token.text.lower() in LEGACY_SKILLS:
+            skills.add(token.text)
+        if token.i < len(doc) - 1:
+            bigram = (token.text + " " + doc[token.i + 1].text).lower()
+            if bigram in LEGACY_SKILLS:
+                skills.add(bigram)
+    return skills
+
+
+def _best(run):
+    samples = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        run()
+        samples.append(time.perf_counter() - start)
+    return min(samples)
+
+
+def main():
+    if len(sys.argv) > 1:
+        analyzer.MODEL_NAME = sys.argv[1]
+    nlp = analyzer.get_nlp()
+    texts = make_resume_texts(DOC_COUNT)
+
+    def parse_only():
+        with nlp.select_pipes(disable=["skill_matcher"]):
+            for _ in nlp.pipe(texts):
+                pass
+
+    def parse_with_matcher():
+        for _ in nlp.pipe(texts):
+            pass
+
+    def parse_with_legacy():
+        with nlp.select_pipes(disable=["skill_matcher"]):
+            for doc in nlp.pipe(texts):
+                legacy_skills(doc)
+
+    docs = list(nlp.pipe(texts))
+    matcher = nlp.get_pipe("skill_matcher")
+    component = _best(lambda: [matcher(doc) for doc in docs])
+    legacy = _best(lambda: [legacy_skills(doc) for doc in docs])
+    print(f"{DOC_COUNT} docs, model {analyzer.MODEL_NAME}, "
+          f"{sum(len(doc._.skills) for doc in docs) / DOC_COUNT:.1f} skills per doc")
+    print(f"{'pipeline':>22} {'total ms':>9} {'extraction ms/doc':>18}")
+    parse = _best(parse_only)
+    print(f"{'parse only':>22} {parse * 1000:>9.1f} {'':>18}")
+    print(f"{'parse + skill_matcher':>22} {_best(parse_with_matcher) * 1000:>9.1f} "
+          f"{component * 1000 / DOC_COUNT:>18.3f}")
+    print(f"{'parse + bigram loop':>22} {_best(parse_with_legacy) * 1000:>9.1f} "
+          f"{legacy * 1000 / DOC_COUNT:>18.3f}")
+
+
+if __name__ == '__main__':
+    main()
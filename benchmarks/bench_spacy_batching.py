@@ -0,0 +1,50 @@
+"""Compare per-text analyze_resume with batched analyze_resumes (nlp.pipe).
+
+Run from the repository root: python -m benchmarks.bench_spacy_batching [model]
+`model` defaults to en_core_web_sm and may be a package name or a path.
+"""
+import sys
+import time
+
+from benchmarks.fixtures import make_resume_texts
+from resume_analytics import analyzer
+from utils.pdf_extraction import _available_cpus
+
+DOC_COUNT = 500
+BATCH_SIZES = [1, 8, 32, 128]
+
+
+def _docs_per_second(run, texts):
+    start = time.perf_counter()
+    results = list(run(texts))
+    elapsed = time.perf_counter() - start
+    return len(results) / elapsed, results
+
+
+def main():
+    if len(sys.argv) > 1:
+        analyzer.MODEL_NAME = sys.argv[1]
+    resume_analyzer = analyzer.ResumeAnalyzer()
+    texts = make_resume_texts(DOC_COUNT)
+    resume_analyzer.analyze_resume(texts[0])  # load the model outside the timings
+
+    def metrics(results):
+        return [result['metrics'] for result in results]
+
+    baseline, expected = _docs_per_second(lambda texts: map(resume_analyzer.analyze_resume, texts), texts)
+    print(f"{DOC_COUNT} docs, model {analyzer.MODEL_NAME}")
+    print(f"{'mode':>24} {'docs/s':>8} {'speedup':>8}")
+    print(f"{'analyze_resume loop':>24} {baseline:>8.1f} {1:>7.2f}x")
+    process_counts = [1] + ([min(4, _available_cpus())] if _available_cpus() > 1 else [])
+    for n_process in process_counts:
+        for batch_size in BATCH_SIZES:
+            rate, results = _docs_per_second(
+                lambda texts: resume_analyzer.analyze_resumes(texts, batch_size=batch_size, n_process=n_process),
+                texts)
+            assert metrics(results) == metrics(expected), "batched analysis changed the results"
+            label = f"batch {batch_size}, {n_process} proc"
+            print(f"{label:>24} {rate:>8.1f} {rate / baseline:>7.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""Compare eager and lazy, shared spaCy loading in resume_analytics.analyzer.
+
+Each scenario runs in a fresh interpreter and reports time to construct the
+analyzers, time to the first analysis and resident memory afterwards:
+
+  eager        every instance calls spacy.load with all components (before)
+  lazy         instances share one pipeline without ner and lemmatizer
+  fork         the parent preloads, forked children analyze; the child's
+               private memory shows how much of the model stays shared
+
+Run from the repository root: python -m benchmarks.bench_spacy_loading [model]
+`model` defaults to en_core_web_sm and may be a package name or a path.
+"""
+import json
+import os
+import subprocess
+import sys
+
+INSTANCES = 4
+
+RESUME_TEXT = (
+    "Backend developer with 6 years of experience building Python and SQL services. "
+    "Led a team of four engineers. Deployed Docker and Kubernetes workloads on AWS. "
+) * 20
+
+_SCENARIO = r'''
+import json, os, sys, time
+model, scenario, instances, text = sys.argv[1], sys.argv[2], int(sys.argv[3]), sys.argv[4]
+
+def memory_kb(pid='self'):
+    fields = {}
+    with open(f'/proc/{pid}/smaps_rollup') as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == 'kB':
+                fields[parts[0].rstrip(':')] = int(parts[1])
+    return {'rss': fields['Rss'], 'private': fields['Private_Clean'] + fields['Private_Dirty']}
+
+start = time.perf_counter()
+from resume_analytics import analyzer
+analyzer.MODEL_NAME = model
+if scenario == 'eager':
+    import spacy
+    class EagerAnalyzer(analyzer.ResumeAnalyzer):
+        def __init__(self):
+            self._own_nlp = spacy.load(model)
+            self._own_nlp.add_pipe("skill_matcher")
+        nlp = property(lambda self: self._own_nlp)
+    analyzers = [EagerAnalyzer() for _ in range(instances)]
+else:
+    if scenario == 'fork':
+        analyzer.preload_model()
+    analyzers = [analyzer.ResumeAnalyzer() for _ in range(instances)]
+constructed = time.perf_counter()
+
+if scenario == 'fork':
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        child_start = time.perf_counter()
+        for instance in analyzers:
+            instance.analyze_resume(text)
+        os.write(write_fd, json.dumps([time.perf_counter() - child_start, memory_kb()]).encode())
+        os._exit(0)
+    os.waitpid(pid, 0)
+    elapsed, memory = json.loads(os.read(read_fd, 1 << 16))
+    result = {'construct': constructed - start, 'first': elapsed, **memory}
+else:
+    for instance in analyzers:
+        instance.analyze_resume(text)
+    result = {'construct': constructed - start, 'first': time.perf_counter() - constructed, **memory_kb()}
+print(json.dumps(result))
+'''
+
+
+def _run(model, scenario):
+    output = subprocess.run(
+        [sys.executable, '-c', _SCENARIO, model, scenario, str(INSTANCES), RESUME_TEXT],
+        check=True, capture_output=True, text=True, cwd=os.getcwd()
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    model = sys.argv[1] if len(sys.argv) > 1 else 'en_core_web_sm'
+    print(f"model: {model}, {INSTANCES} analyzer instances per process")
+    print(f"{'scenario':>8} {'construct s':>12} {'analyze s':>10} {'RSS MB':>8} {'private MB':>11}")
+    for scenario in ('eager', 'lazy', 'fork'):
+        result = _run(model, scenario)
+        print(f"{scenario:>8} {result['construct']:>12.2f} {result['first']:>10.2f} "
+              f"{result['rss'] / 1024:>8.1f} {result['private'] / 1024:>11.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""Similar-resume search latency as the vector index grows.
+
+Builds a VectorIndex over synthetic resume rows in a temporary directory,
+appending them in batches the way saved resumes arrive, then reports the
+top-10 query latency before and after compaction.
+
+Run from the repository root: python -m benchmarks.bench_vector_index [count]
+"""
+import sys
+import tempfile
+import time
+
+from benchmarks.fixtures import make_resume_rows
+from utils.vector_index import VectorIndex, resume_index_text
+
+QUERIES = 50
+
+
+def _query_latencies(index, texts):
+    latencies = []
+    for text in texts:
+        start = time.perf_counter()
+        index.query(text, k=10)
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    return latencies[len(latencies) // 2], latencies[int(len(latencies) * 0.95)]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    rows = make_resume_rows(count)
+    texts = [resume_index_text(row) for row in rows]
+    queries = texts[:QUERIES]
+
+    with tempfile.TemporaryDirectory() as directory:
+        index = VectorIndex(directory)
+        start = time.perf_counter()
+        for offset in range(0, count, 1000):
+            index.add_many([row['id'] for row in rows[offset:offset + 1000]], texts[offset:offset + 1000])
+        build_time = time.perf_counter() - start
+        # A trickle of single appends on top, as from individual uploads
+        for row, text in zip(rows[:20], texts[:20]):
+            index.add(row['id'], text)
+        segments = len(index._segments)
+        p50, p95 = _query_latencies(index, queries)
+
+        start = time.perf_counter()
+        index.compact()
+        compact_time = time.perf_counter() - start
+        compact_p50, compact_p95 = _query_latencies(index, queries)
+
+        start = time.perf_counter()
+        reopened = VectorIndex(directory)
+        load_time = time.perf_counter() - start
+        assert reopened.query(queries[0], k=10) == index.query(queries[0], k=10)
+
+    print(f"{count} resumes indexed in {build_time:.1f} s ({segments} segments), "
+          f"compacted in {compact_time * 1000:.0f} ms, reloaded in {load_time * 1000:.0f} ms")
+    print(f"{'':>16} {'p50 ms':>8} {'p95 ms':>8}")
+    print(f"{'before compact':>16} {p50 * 1000:>8.1f} {p95 * 1000:>8.1f}")
+    print(f"{'after compact':>16} {compact_p50 * 1000:>8.1f} {compact_p95 * 1000:>8.1f}")
+
+
+if __name__ == '__main__':
+    main()
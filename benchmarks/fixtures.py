@@ -0,0 +1,237 @@
+"""Synthetic documents shared by the benchmark scripts."""
+import io
+
+RESUME_LINES = [
+    "JANE DOE",
+    "jane.doe@example.com | 555-123-4567 | linkedin.com/in/janedoe",
+    "PROFESSIONAL SUMMARY",
+    "Backend engineer with 6 years of experience building APIs and data pipelines.",
+    "EXPERIENCE",
+    "Senior Software Engineer at Acme Corp 2019 - 2023",
+    "- Developed REST APIs in Python and Flask serving 2M requests per day",
+    "- Led migration of the reporting database from MySQL to PostgreSQL",
+    "EDUCATION",
+    "Bachelor of Technology in Computer Science, 2018, CGPA 8.7",
+    "SKILLS",
+    "Python, SQL, Docker, Kubernetes, AWS, Git",
+]
+
+# A sidebar layout: contact, skills and education on the left, the main
+# narrative on the right. Content streams emit the rows left-right
+# interleaved, which is what trips up stream-order extraction.
+SIDEBAR_LINES = [
+    "CONTACT", "jane.doe@example.com", "555-123-4567", "linkedin.com/in/janedoe", "",
+    "SKILLS", "Python, SQL, Docker", "Kubernetes, AWS, Git", "",
+    "EDUCATION", "B.Tech Computer Science", "2018, CGPA 8.7",
+]
+MAIN_LINES = [
+    "PROFESSIONAL SUMMARY",
+    "Backend engineer with 6 years of experience",
+    "building APIs and data pipelines.", "",
+    "EXPERIENCE",
+    "Senior Software Engineer, Acme Corp 2019 - 2023",
+    "- Developed REST APIs in Python and Flask",
+    "- Led migration of the reporting database", "",
+    "PROJECTS",
+    "- Resume parser with PDF and DOCX support",
+    "- Internal metrics dashboard",
+]
+
+
+def _escape_pdf_text(line):
+    return line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def _show(line):
+    return f"({_escape_pdf_text(line)}) Tj".encode('latin-1', 'replace')
+
+
+def _build_pdf(page_streams, base_font=b"Helvetica"):
+    objects = []
+
+    def add(body):
+        objects.append(body)
+        return len(objects)
+
+    catalog = add(None)
+    pages = add(None)
+    font = add(b"<< /Type /Font /Subtype /Type1 /BaseFont /%s /Encoding /WinAnsiEncoding >>" % base_font)
+    page_ids = []
+    for stream in page_streams:
+        content = add(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        page_ids.append(add(
+            b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 %d 0 R >> >> /Contents %d 0 R >>" % (pages, font, content)
+        ))
+    objects[catalog - 1] = b"<< /Type /Catalog /Pages %d 0 R >>" % pages
+    kids = b" ".join(b"%d 0 R" % page_id for page_id in page_ids)
+    objects[pages - 1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(page_ids))
+
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(out.tell())
+        out.write(b"%d 0 obj\n%s\nendobj\n" % (number, body))
+    xref = out.tell()
+    out.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    for offset in offsets:
+        out.write(b"%010d 00000 n \n" % offset)
+    out.write(b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, catalog, xref))
+    return out.getvalue()
+
+
+def make_pdf(page_count, lines=None, lines_per_page=40):
+    """Build a single-column text PDF with `page_count` pages as bytes."""
+    lines = lines or RESUME_LINES
+    streams = []
+    for page_number in range(page_count):
+        commands = [b"BT /F1 10 Tf 12 TL 50 780 Td"]
+        for i in range(lines_per_page):
+            commands.append(_show(lines[(page_number * lines_per_page + i) % len(lines)]) + b" T*")
+        commands.append(b"ET")
+        streams.append(b"\n".join(commands))
+    return _build_pdf(streams)
+
+
+def make_two_column_pdf(left_lines=None, right_lines=None, page_count=1):
+    """Build a sidebar-layout PDF whose rows are emitted left-right interleaved."""
+    left_lines = SIDEBAR_LINES if left_lines is None else left_lines
+    right_lines = MAIN_LINES if right_lines is None else right_lines
+    streams = []
+    for _ in range(page_count):
+        commands = [b"BT /F1 10 Tf"]
+        for row in range(max(len(left_lines), len(right_lines))):
+            y = 760 - row * 14
+            for x, column in ((40, left_lines), (230, right_lines)):
+                if row < len(column) and column[row]:
+                    commands.append(b"1 0 0 1 %d %d Tm " % (x, y) + _show(column[row]))
+        commands.append(b"ET")
+        streams.append(b"\n".join(commands))
+    return _build_pdf(streams)
+
+
+def make_glyph_positioned_pdf(lines=None):
+    """Build a PDF that places every glyph individually, as some designers' exports do.
+
+    Courier's 600-unit advance makes the 6pt glyph pitch match the font, so a
+    layout-aware extractor can still recover the word gaps.
+    """
+    lines = lines or RESUME_LINES
+    commands = [b"BT /F1 10 Tf"]
+    for row, line in enumerate(lines):
+        y = 760 - row * 14
+        for column, char in enumerate(line):
+            if char != ' ':
+                commands.append(b"1 0 0 1 %d %d Tm " % (50 + column * 6, y) + _show(char))
+    commands.append(b"ET")
+    return _build_pdf([b"\n".join(commands)], base_font=b"Courier")
+
+
+def make_corpus():
+    """Name -> PDF bytes for the extraction backend comparison."""
+    return {
+        'single_column_1p': make_pdf(1),
+        'single_column_8p': make_pdf(8),
+        'two_column_1p': make_two_column_pdf(),
+        'two_column_3p': make_two_column_pdf(page_count=3),
+        'glyph_positioned': make_glyph_positioned_pdf(),
+    }
+
+
+def make_docx(paragraph_count, table_every=50):
+    """Build a DOCX with body paragraphs, line breaks, tabs and periodic skills tables."""
+    from docx import Document
+
+    doc = Document()
+    for i in range(paragraph_count):
+        line = RESUME_LINES[i % len(RESUME_LINES)]
+        paragraph = doc.add_paragraph(line)
+        if i % 7 == 0:
+            run = paragraph.add_run()
+            run.add_break()
+            run.add_tab()
+            paragraph.add_run('continued')
+        if table_every and i % table_every == table_every - 1:
+            table = doc.add_table(rows=2, cols=3)
+            for row_index, row in enumerate(table.rows):
+                for column_index, cell in enumerate(row.cells):
+                    cell.text = f"Skill {i}-{row_index}-{column_index}"
+            table.cell(0, 0).add_table(rows=1, cols=1).cell(0, 0).text = "Nested tool"
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+_ROW_WORDS = (
+    "built maintained scalable services pipelines dashboards reporting customers platform "
+    "migration latency throughput team mentored reviewed designed tested deployed automated "
+    "analytics models features clients stakeholders requirements infrastructure monitoring"
+).split()
+
+
+def make_resume_rows(count, seed=0):
+    """resume_data-shaped dicts with random skills and filler text, IDs from 1."""
+    import random
+    from config.job_roles import JOB_ROLES
+    from config.skills import SKILL_ALIASES
+
+    rng = random.Random(seed)
+    roles = [role for roles in JOB_ROLES.values() for role in roles]
+    skills = list(SKILL_ALIASES)
+    rows = []
+    for resume_id in range(1, count + 1):
+        rows.append({
+            'id': resume_id,
+            'target_role': rng.choice(roles),
+            'summary': ' '.join(rng.choices(_ROW_WORDS, k=30)),
+            'skills': str(rng.sample(skills, 8)),
+            'experience': str([' '.join(rng.choices(_ROW_WORDS, k=25)) for _ in range(3)]),
+            'projects': str([' '.join(rng.choices(_ROW_WORDS + skills, k=15))]),
+            'education': "['B.Sc Computer Science 2018']",
+        })
+    return rows
+
+
+def make_resume_texts(count, seed=0):
+    """Plain-text resumes: the RESUME_LINES skeleton with each row's summary,
+    skills and experience, so texts differ in length and vocabulary."""
+    texts = []
+    for row in make_resume_rows(count, seed):
+        texts.append('\n'.join([
+            *RESUME_LINES[:3], row['summary'], "EXPERIENCE", *RESUME_LINES[5:8],
+            row['experience'], "SKILLS", row['skills']
+        ]))
+    return texts
+
+
+# Resume builder form data covering every section and field the templates render
+BUILDER_DATA = {
+    'personal_info': {
+        'full_name': 'Jane Q Doe', 'email': 'jane.doe@example.com', 'phone': '555-123-4567',
+        'location': 'Pune', 'linkedin': 'linkedin.com/in/janedoe', 'portfolio': 'janedoe.dev',
+        'title': 'Backend Engineer',
+    },
+    'summary': 'Backend engineer with 6 years of experience building APIs & data pipelines.',
+    'experience': [
+        {'position': 'Senior Software Engineer', 'company': 'Acme Corp', 'start_date': '2019', 'end_date': '2023',
+         'description': 'Owned the public API platform.',
+         'responsibilities': 'Developed REST APIs in Python and Flask\nLed migration from MySQL to PostgreSQL',
+         'achievements': ['Cut p99 latency by 40%']},
+        {'position': 'Software Engineer', 'company': 'Beta Labs', 'start_date': '2017', 'end_date': '2019',
+         'responsibilities': ['Built ETL jobs', 'Maintained CI pipelines']},
+    ],
+    'projects': [
+        {'name': 'Resume Parser', 'technologies': 'Python, spaCy', 'description': 'Extracts structured resume data.',
+         'responsibilities': 'Designed the pipeline\nWrote the evaluation suite', 'achievements': '95% field accuracy',
+         'link': 'https://example.com/parser'},
+    ],
+    'education': [
+        {'school': 'MIT', 'degree': 'B.S.', 'field': 'Computer Science', 'graduation_date': '2017', 'gpa': '3.9',
+         'achievements': "Dean's list"},
+    ],
+    'skills': {
+        'technical': ['Python', 'SQL', 'Docker'], 'soft': 'Communication\nMentoring',
+        'languages': ['English'], 'tools': ['Git', 'Kubernetes'],
+    },
+}
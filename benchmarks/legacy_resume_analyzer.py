@@ -0,0 +1,390 @@
+"""The analyzer stages as they were before ResumeDocument, for benchmarks.
+
+Each stage takes the raw text and derives its own lowered copy, line split
+and stripped lines. bench_resume_document.py measures ResumeDocument
+against this; it is not used by the application.
+"""
+import re
+
+DOCUMENT_TYPE_SAMPLE_CHARS = 4096
+DOCUMENT_TYPE_CONFIDENCE = 0.5
+
+
+class LegacyResumeAnalyzer:
+    def __init__(self):
+        self.document_types = {
+            'resume': [
+                'experience', 'education', 'skills', 'work', 'project', 'objective',
+                'summary', 'employment', 'qualification', 'achievements'
+            ],
+            'marksheet': [
+                'grade', 'marks', 'score', 'semester', 'cgpa', 'sgpa', 'examination',
+                'result', 'academic year', 'percentage'
+            ],
+            'certificate': [
+                'certificate', 'certification', 'awarded', 'completed', 'achievement',
+                'training', 'course completion', 'qualified'
+            ],
+            'id_card': [
+                'id card', 'identity', 'student id', 'employee id', 'valid until',
+                'date of issue', 'identification'
+            ]
+        }
+
+    def classify_document(self, text):
+        """Return (document_type, confidence) for the given text.
+
+        Confidence is the relative margin of the best-scoring type over the
+        runner-up, so 1.0 means no other type matched at all.
+        """
+        text = text.lower()
+        word_count = len(text.split())
+        scores = {}
+        for doc_type, keywords in self.document_types.items():
+            matches = sum(1 for keyword in keywords if keyword in text)
+            density = matches / len(keywords)
+            frequency = matches / (word_count + 1)
+            scores[doc_type] = (density * 0.7) + (frequency * 0.3)
+        ranked = sorted(scores.items(), key=lambda x: x[1], reverse=True)
+        best_type, best_score = ranked[0]
+        if best_score <= 0.15:
+            return 'unknown', 0.0
+        return best_type, (best_score - ranked[1][1]) / best_score
+
+    def is_clearly_not_resume(self, text):
+        """True when a text sample confidently classifies as another document type"""
+        doc_type, confidence = self.classify_document(text)
+        return doc_type not in ('resume', 'unknown') and confidence >= DOCUMENT_TYPE_CONFIDENCE
+
+    def detect_document_type(self, text, sample_chars=DOCUMENT_TYPE_SAMPLE_CHARS):
+        """Classify the document, deciding from a prefix sample when it is conclusive.
+
+        Only a confident non-resume verdict is taken from the sample; anything
+        else is re-checked against the full text.
+        """
+        if sample_chars and len(text) > sample_chars:
+            doc_type, confidence = self.classify_document(text[:sample_chars])
+            if doc_type not in ('resume', 'unknown') and confidence >= DOCUMENT_TYPE_CONFIDENCE:
+                return doc_type
+        return self.classify_document(text)[0]
+
+    def calculate_keyword_match(self, resume_text, required_skills):
+        resume_text = resume_text.lower()
+        found_skills = []
+        missing_skills = []
+
+        for skill in required_skills:
+            skill_lower = skill.lower()
+            if skill_lower in resume_text:
+                found_skills.append(skill)
+            elif any(skill_lower in phrase for phrase in resume_text.split('.')):
+                found_skills.append(skill)
+            else:
+                missing_skills.append(skill)
+
+        match_score = (len(found_skills) / len(required_skills)) * 100 if required_skills else 0
+
+        return {
+            'score': match_score,
+            'found_skills': found_skills,
+            'missing_skills': missing_skills
+        }
+
+    def check_resume_sections(self, text):
+        text = text.lower()
+        essential_sections = {
+            'contact': ['email', 'phone', 'address', 'linkedin'],
+            'education': ['education', 'university', 'college', 'degree', 'academic'],
+            'experience': ['experience', 'work', 'employment', 'job', 'internship'],
+            'skills': ['skills', 'technologies', 'tools', 'proficiencies', 'expertise']
+        }
+
+        section_scores = {}
+        for section, keywords in essential_sections.items():
+            found = sum(1 for keyword in keywords if keyword in text)
+            section_scores[section] = min(25, (found / len(keywords)) * 25)
+
+        return sum(section_scores.values())
+
+    def check_formatting(self, text):
+        lines = text.split('\n')
+        score = 100
+        deductions = []
+        if len(text) < 300:
+            score -= 30
+            deductions.append("Resume is too short")
+        if not any(line.isupper() for line in lines):
+            score -= 20
+            deductions.append("No clear section headers found")
+        if not any(line.strip().startswith(('•', '-', '*', '→')) for line in lines):
+            score -= 20
+            deductions.append("No bullet points found for listing details")
+        if any(len(line.strip()) == 0 and len(next_line.strip()) == 0
+               for line, next_line in zip(lines[:-1], lines[1:])):
+            score -= 15
+            deductions.append("Inconsistent spacing between sections")
+        contact_patterns = [
+            r'\b[\w\.-]+@[\w\.-]+\.\w+\b',
+            r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',
+            r'linkedin\.com/\w+',
+        ]
+        if not any(re.search(pattern, text) for pattern in contact_patterns):
+            score -= 15
+            deductions.append("Missing or improperly formatted contact information")
+
+        return max(0, score), deductions
+
+
+    def extract_personal_info(self, text):
+        email_pattern = r'[\w\.-]+@[\w\.-]+\.\w+'
+        phone_pattern = r'(\+\d{1,3}[-.]?)?\s*\(?\d{3}\)?[-.]?\s*\d{3}[-.]?\s*\d{4}'
+        linkedin_pattern = r'linkedin\.com/in/[\w-]+'
+        github_pattern = r'github\.com/[\w-]+'
+        email = re.search(email_pattern, text)
+        phone = re.search(phone_pattern, text)
+        linkedin = re.search(linkedin_pattern, text)
+        github = re.search(github_pattern, text)
+        # First non-empty line is likely the name
+        lines = [line.strip() for line in text.split('\n') if line.strip()]
+        name = lines[0] if lines else 'Unknown'
+
+        return {
+            'name': name if len(name) > 0 and not re.search(r'^(education|experience|skills|summary|objective)$', name.lower()) else 'Unknown',
+            'email': email.group(0) if email else '',
+            'phone': phone.group(0) if phone else '',
+            'linkedin': linkedin.group(0) if linkedin else '',
+            'github': github.group(0) if github else '',
+            'portfolio': ''
+        }
+
+    def extract_education(self, text):
+        education = []
+        lines = text.split('\n')
+        education_keywords = [
+            'education', 'academic', 'qualification', 'degree', 'university', 'college',
+            'school', 'institute', 'certification', 'diploma', 'bachelor', 'master',
+            'phd', 'b.tech', 'm.tech', 'b.e', 'm.e', 'b.sc', 'm.sc','bca', 'mca', 'b.com',
+            'm.com', 'b.cs-it', 'imca', 'bba', 'mba', 'honors', 'scholarship'
+        ]
+        in_education_section = False
+        current_entry = []
+
+        for line in lines:
+            line = line.strip()
+            if any(keyword.lower() in line.lower() for keyword in education_keywords):
+                if not any(keyword.lower() == line.lower() for keyword in education_keywords):
+                    current_entry.append(line)
+                in_education_section = True
+                continue
+
+            if in_education_section:
+                # Check if we've hit another major section (e.g., Experience, Skills)
+                if line and any(keyword.lower() in line.lower() for keyword in self.document_types['resume']):
+                    if not any(edu_key.lower() in line.lower() for edu_key in education_keywords):
+                        in_education_section = False
+                        if current_entry:
+                            education.append(' '.join(current_entry))
+                            current_entry = []
+                        continue
+
+                if line:
+                    current_entry.append(line)
+                elif current_entry:
+                    education.append(' '.join(current_entry))
+                    current_entry = []
+
+        if current_entry:
+            education.append(' '.join(current_entry))
+
+        return [edu for edu in education if edu]
+
+    def extract_experience(self, text):
+        experience = []
+        lines = text.split('\n')
+        experience_keywords = [
+            'experience', 'employment', 'work history', 'professional experience',
+            'work experience', 'career history', 'professional background',
+            'employment history', 'job history', 'positions held',
+            'job title', 'job responsibilities', 'job description', 'job summary'
+        ]
+        in_experience_section = False
+        current_entry = []
+
+        for line in lines:
+            line = line.strip()
+            if any(keyword.lower() in line.lower() for keyword in experience_keywords):
+                if not any(keyword.lower() == line.lower() for keyword in experience_keywords):
+                    current_entry.append(line)
+                in_experience_section = True
+                continue
+
+            if in_experience_section:
+                if line and any(keyword.lower() in line.lower() for keyword in self.document_types['resume']):
+                    if not any(exp_key.lower() in line.lower() for exp_key in experience_keywords):
+                        in_experience_section = False
+                        if current_entry:
+                            experience.append(' '.join(current_entry))
+                            current_entry = []
+                        continue
+
+                if line:
+                    current_entry.append(line)
+                elif current_entry:
+                    experience.append(' '.join(current_entry))
+                    current_entry = []
+
+        if current_entry:
+            experience.append(' '.join(current_entry))
+
+        return [exp for exp in experience if exp]
+
+    def extract_projects(self, text):
+        projects = []
+        lines = text.split('\n')
+        project_keywords = [
+            'projects', 'personal projects', 'academic projects', 'key projects',
+            'major projects', 'professional projects', 'project experience',
+            'relevant projects', 'featured projects','latest projects',
+            'top projects'
+        ]
+        in_project_section = False
+        current_entry = []
+
+        for line in lines:
+            line = line.strip()
+            if any(keyword.lower() in line.lower() for keyword in project_keywords):
+                if not any(keyword.lower() == line.lower() for keyword in project_keywords):
+                    current_entry.append(line)
+                in_project_section = True
+                continue
+
+            if in_project_section:
+                if line and any(keyword.lower() in line.lower() for keyword in self.document_types['resume']):
+                    if not any(proj_key.lower() in line.lower() for proj_key in project_keywords):
+                        in_project_section = False
+                        if current_entry:
+                            projects.append(' '.join(current_entry))
+                            current_entry = []
+                        continue
+
+                if line:
+                    current_entry.append(line)
+                elif current_entry:
+                    projects.append(' '.join(current_entry))
+                    current_entry = []
+
+        if current_entry:
+            projects.append(' '.join(current_entry))
+
+        return [proj for proj in projects if proj]
+
+    def extract_skills(self, text):
+        skills = set()
+        lines = text.split('\n')
+        skills_keywords = [
+            'skills', 'technical skills', 'competencies', 'expertise',
+            'core competencies', 'professional skills', 'key skills',
+            'technical expertise', 'proficiencies', 'qualifications',
+            'top skills', 'key skill', 'major skill', 'personal skill',
+            'soft skills', 'soft skill', 'soft skillset'
+        ]
+        in_skills_section = False
+        current_entry = []
+
+        separators = [',', '•', '|', '/', '\\', '·', '>', '-', '–', '―']
+
+        for line in lines:
+            line = line.strip()
+            if any(keyword.lower() in line.lower() for keyword in skills_keywords):
+                if not any(keyword.lower() == line.lower() for keyword in skills_keywords):
+                    current_entry.append(line)
+                in_skills_section = True
+                continue
+
+            if in_skills_section:
+                if line and any(keyword.lower() in line.lower() for keyword in self.document_types['resume']):
+                    if not any(skill_key.lower() in line.lower() for skill_key in skills_keywords):
+                        in_skills_section = False
+                        if current_entry:
+                            text_to_process = ' '.join(current_entry)
+                            for separator in separators:
+                                if separator in text_to_process:
+                                    skills.update(skill.strip() for skill in text_to_process.split(separator) if skill.strip())
+                            current_entry = []
+                        continue
+
+                if line:
+                    current_entry.append(line)
+                elif current_entry:
+                    text_to_process = ' '.join(current_entry)
+                    for separator in separators:
+                        if separator in text_to_process:
+                            skills.update(skill.strip() for skill in text_to_process.split(separator) if skill.strip())
+                    current_entry = []
+
+        if current_entry:
+            text_to_process = ' '.join(current_entry)
+            for separator in separators:
+                if separator in text_to_process:
+                    skills.update(skill.strip() for skill in text_to_process.split(separator) if skill.strip())
+
+        return list(skills)
+
+    def extract_summary(self, text):
+        summary = []
+        lines = text.split('\n')
+        summary_keywords = [
+            'summary', 'professional summary', 'career summary', 'objective',
+            'career objective', 'professional objective', 'about me', 'profile',
+            'professional profile', 'career profile', 'overview', 'skill summary'
+        ]
+        in_summary_section = False
+        current_entry = []
+
+        # Check the first few non-empty lines for a potential summary
+        start_index = 0
+        while start_index < min(10, len(lines)) and not lines[start_index].strip():
+            start_index += 1
+
+        first_lines = []
+        lines_checked = 0
+        for line in lines[start_index:]:
+            if line.strip():
+                first_lines.append(line.strip())
+                lines_checked += 1
+                if lines_checked >= 5:
+                    break
+
+        if first_lines and not any(keyword in first_lines[0].lower() for keyword in summary_keywords):
+            potential_summary = ' '.join(first_lines)
+            if len(potential_summary.split()) > 10:
+                if not re.search(r'\b(?:email|phone|address|tel|mobile|linkedin)\b', potential_summary.lower()):
+                    summary.append(potential_summary)
+
+        for line in lines:
+            line = line.strip()
+            if any(keyword.lower() in line.lower() for keyword in summary_keywords):
+                if not any(keyword.lower() == line.lower() for keyword in summary_keywords):
+                    current_entry.append(line)
+                in_summary_section = True
+                continue
+
+            if in_summary_section:
+                if line and any(keyword.lower() in line.lower() for keyword in self.document_types['resume']):
+                    if not any(sum_key.lower() in line.lower() for sum_key in summary_keywords):
+                        in_summary_section = False
+                        if current_entry:
+                            summary.append(' '.join(current_entry))
+                            current_entry = []
+                        continue
+
+                if line:
+                    current_entry.append(line)
+                elif current_entry:
+                    summary.append(' '.join(current_entry))
+                    current_entry = []
+
+        if current_entry:
+            summary.append(' '.join(current_entry))
+
+        return ' '.join(summary) if summary else ''
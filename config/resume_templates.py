@@ -0,0 +1,342 @@
+"""Declarative resume builder templates, compiled by utils.render_plan.
+
+A template is a dict with:
+
+  styles    (role, style name, properties) registered on the base document
+            in order. Properties: size/space_before/space_after in points,
+            bold, all_caps, color (r, g, b), font, alignment.
+  margins   page margins in inches (top, bottom, left, right), or None to
+            keep the defaults.
+  sections  the document in order. A section has `when` (a data field that
+            must be non-empty), optional `scope` (render inside data[scope]
+            instead of data) and `blocks`.
+
+Blocks render within the current scope (the data dict, or one list item):
+
+  paragraph  {'style': role, 'text': format} or {'style': role, 'runs': [...]},
+             plus optional `when` (a field, or a tuple where any field will
+             do), `indent` (inches), `space_after` (points), `alignment`.
+             A `text` paragraph (optionally `upper`) has no run when the
+             text is empty, like add_paragraph(text); listed runs are always
+             written.
+  run        {'text': format} with optional bold, color, upper, `when`; or
+             {'join': separator, 'parts': [(field, format), ...]}, written
+             only when at least one part's field is non-empty.
+  items      {'items': field, 'blocks': [...]}: blocks once per list entry.
+  bullets    {'bullets': field, 'style', 'indent', 'label'}: one '• ' paragraph
+             per line/entry of the field, after the optional label paragraph.
+             'indent_style' indents the paragraph style itself instead, which
+             is how the minimal template has always indented its bullets.
+  skills     {'skills': categories, 'style', 'label', 'separator', ...}: one
+             paragraph per non-empty category of the skills dict.
+
+Formats are str.format strings over the scope's fields.
+"""
+
+SKILL_CATEGORIES = [
+    {'key': 'technical', 'title': 'Technical Skills', 'icon': '💻'},
+    {'key': 'soft', 'title': 'Soft Skills', 'icon': '🤝'},
+    {'key': 'languages', 'title': 'Languages', 'icon': '🌐'},
+    {'key': 'tools', 'title': 'Tools & Technologies', 'icon': '🛠️'},
+]
+
+MODERN_BLUE = (41, 128, 185)
+CREATIVE_PURPLE = (155, 89, 182)
+
+MODERN_UNDERLINE = {'style': 'underline', 'text': '_' * 40}
+
+TEMPLATE_SPECS = {
+    'modern': {
+        'styles': [
+            ('name', 'Modern Name', {'size': 24, 'bold': True, 'color': MODERN_BLUE, 'font': 'Arial',
+                                     'space_after': 0, 'space_before': 6, 'alignment': 'center'}),
+            ('section', 'Modern Section', {'size': 14, 'bold': True, 'color': MODERN_BLUE, 'font': 'Arial',
+                                           'space_before': 16, 'space_after': 4}),
+            ('underline', 'Modern Section Underline', {'size': 8, 'color': MODERN_BLUE, 'space_after': 8}),
+            ('normal', 'Modern Normal', {'size': 10, 'font': 'Arial', 'space_after': 2, 'color': (44, 62, 80)}),
+            ('contact', 'Modern Contact', {'size': 10, 'font': 'Arial', 'color': MODERN_BLUE, 'space_after': 2,
+                                           'alignment': 'center'}),
+        ],
+        'margins': (0.5, 0.5, 0.8, 0.8),
+        'sections': [
+            {'scope': 'personal_info', 'blocks': [
+                {'style': 'name', 'text': '{full_name}', 'upper': True},
+                {'style': 'contact', 'when': 'title', 'text': '{title}'},
+                {'style': 'contact', 'runs': [
+                    {'join': ' | ', 'parts': [('email', '{email}'), ('phone', '{phone}'), ('location', '{location}')]},
+                ]},
+                {'style': 'contact', 'when': ('linkedin', 'portfolio'), 'runs': [
+                    {'join': ' | ', 'parts': [('linkedin', 'LinkedIn: {linkedin}'),
+                                              ('portfolio', 'Portfolio: {portfolio}')]},
+                ]},
+            ]},
+            {'when': 'summary', 'blocks': [
+                {'style': 'section', 'text': 'PROFESSIONAL SUMMARY'},
+                MODERN_UNDERLINE,
+                {'style': 'normal', 'text': '{summary}', 'space_after': 12, 'indent': 0.2},
+            ]},
+            {'when': 'experience', 'blocks': [
+                {'style': 'section', 'text': 'EXPERIENCE'},
+                MODERN_UNDERLINE,
+                {'items': 'experience', 'blocks': [
+                    {'style': 'normal', 'indent': 0.2, 'space_after': 12, 'runs': [
+                        {'text': '{position} at {company}', 'bold': True},
+                        {'text': '\n{start_date} - {end_date}', 'color': MODERN_BLUE},
+                    ]},
+                    {'style': 'normal', 'when': 'description', 'text': '{description}', 'indent': 0.4},
+                    {'bullets': 'responsibilities', 'style': 'normal', 'indent': 0.6},
+                ]},
+            ]},
+            {'when': 'projects', 'blocks': [
+                {'style': 'section', 'text': 'PROJECTS'},
+                MODERN_UNDERLINE,
+                {'items': 'projects', 'blocks': [
+                    {'style': 'normal', 'indent': 0.2, 'space_after': 12, 'runs': [
+                        {'text': '{name}', 'bold': True},
+                        {'text': ' | {technologies}', 'when': 'technologies', 'color': MODERN_BLUE},
+                    ]},
+                    {'style': 'normal', 'when': 'description', 'text': '{description}', 'indent': 0.4},
+                    {'bullets': 'responsibilities', 'style': 'normal', 'indent': 0.6},
+                ]},
+            ]},
+            {'when': 'education', 'blocks': [
+                {'style': 'section', 'text': 'EDUCATION'},
+                MODERN_UNDERLINE,
+                {'items': 'education', 'blocks': [
+                    {'style': 'normal', 'indent': 0.2, 'space_after': 8, 'runs': [
+                        {'text': '{school}', 'bold': True},
+                        {'text': '\n{degree} in {field}'},
+                        {'text': '\nGraduation: {graduation_date}'},
+                        {'text': ' | GPA: {gpa}', 'when': 'gpa'},
+                    ]},
+                ]},
+            ]},
+            {'when': 'skills', 'blocks': [
+                {'style': 'section', 'text': 'SKILLS'},
+                MODERN_UNDERLINE,
+                {'skills': SKILL_CATEGORIES, 'style': 'normal', 'indent': 0.2, 'space_after': 6,
+                 'label': '{title}: ', 'separator': ' • '},
+            ]},
+        ],
+    },
+
+    'professional': {
+        'styles': [
+            ('header', 'Pro Header', {'size': 24, 'bold': True, 'color': (0, 0, 0), 'space_after': 4,
+                                      'font': 'Calibri'}),
+            ('section', 'Pro Section', {'size': 14, 'bold': True, 'color': (0, 120, 215), 'space_before': 12,
+                                        'space_after': 6, 'font': 'Calibri'}),
+            ('normal', 'Pro Normal', {'size': 10, 'font': 'Calibri', 'space_after': 2}),
+            ('contact', 'Pro Contact', {'size': 10, 'font': 'Calibri', 'space_after': 6}),
+        ],
+        'margins': (0.5, 0.5, 0.7, 0.7),
+        'sections': [
+            {'scope': 'personal_info', 'blocks': [
+                {'style': 'header', 'text': '{full_name}', 'alignment': 'left'},
+                {'style': 'contact', 'when': ('email', 'phone', 'location'), 'runs': [
+                    {'join': ' | ', 'parts': [('email', '{email}'), ('phone', '{phone}'), ('location', '{location}')]},
+                ]},
+                {'style': 'contact', 'when': ('linkedin', 'portfolio'), 'runs': [
+                    {'join': ' | ', 'parts': [('linkedin', 'LinkedIn: {linkedin}'),
+                                              ('portfolio', 'Portfolio: {portfolio}')]},
+                ]},
+            ]},
+            {'when': 'summary', 'blocks': [
+                {'style': 'section', 'text': 'PROFESSIONAL SUMMARY'},
+                {'style': 'normal', 'text': '{summary}'},
+            ]},
+            {'when': 'experience', 'blocks': [
+                {'style': 'section', 'text': 'EXPERIENCE'},
+                {'items': 'experience', 'blocks': [
+                    {'style': 'normal', 'runs': [
+                        {'text': '{position} at {company}', 'bold': True},
+                        {'text': ' | {start_date} - {end_date}'},
+                    ]},
+                    {'style': 'normal', 'when': 'description', 'text': '{description}', 'indent': 0.2},
+                    {'bullets': 'responsibilities', 'style': 'normal', 'indent': 0.3},
+                ]},
+            ]},
+            {'when': 'projects', 'blocks': [
+                {'style': 'section', 'text': 'PROJECTS'},
+                {'items': 'projects', 'blocks': [
+                    {'style': 'normal', 'runs': [
+                        {'text': '{name}', 'bold': True},
+                        {'text': ' | {technologies}', 'when': 'technologies'},
+                    ]},
+                    {'style': 'normal', 'when': 'description', 'text': '{description}', 'indent': 0.2},
+                    {'bullets': 'responsibilities', 'style': 'normal', 'indent': 0.3},
+                ]},
+            ]},
+            {'when': 'education', 'blocks': [
+                {'style': 'section', 'text': 'EDUCATION'},
+                {'items': 'education', 'blocks': [
+                    {'style': 'normal', 'runs': [
+                        {'text': '{school}', 'bold': True},
+                        {'text': '\n{degree} in {field}'},
+                        {'text': ' | Graduation: {graduation_date}'},
+                        {'text': ' | GPA: {gpa}', 'when': 'gpa'},
+                    ]},
+                ]},
+            ]},
+            {'when': 'skills', 'blocks': [
+                {'style': 'section', 'text': 'SKILLS'},
+                {'skills': SKILL_CATEGORIES, 'style': 'normal', 'label': '{title}: ', 'separator': ', '},
+            ]},
+        ],
+    },
+
+    'minimal': {
+        'styles': [
+            ('header', 'Min Header', {'size': 28, 'bold': True, 'color': (33, 33, 33), 'space_after': 4}),
+            ('contact', 'Min Contact', {'size': 9, 'color': (100, 100, 100), 'space_after': 12}),
+            ('section', 'Min Section', {'size': 12, 'all_caps': True, 'bold': True, 'color': (33, 33, 33),
+                                        'space_before': 16, 'space_after': 8}),
+            ('normal', 'Min Normal', {'size': 10, 'color': (33, 33, 33), 'space_after': 4}),
+        ],
+        'margins': None,
+        'sections': [
+            {'scope': 'personal_info', 'blocks': [
+                {'style': 'header', 'text': '{full_name}'},
+                {'style': 'contact', 'when': ('email', 'phone', 'location'), 'runs': [
+                    {'join': ' • ', 'parts': [('email', '{email}'), ('phone', '{phone}'), ('location', '{location}')]},
+                ]},
+                {'style': 'contact', 'when': ('linkedin', 'portfolio'), 'runs': [
+                    {'join': ' • ', 'parts': [('linkedin', 'LinkedIn: {linkedin}'),
+                                              ('portfolio', 'Portfolio: {portfolio}')]},
+                ]},
+            ]},
+            {'when': 'summary', 'blocks': [
+                {'style': 'section', 'text': 'SUMMARY'},
+                {'style': 'normal', 'text': '{summary}'},
+            ]},
+            {'when': 'experience', 'blocks': [
+                {'style': 'section', 'text': 'EXPERIENCE'},
+                {'items': 'experience', 'blocks': [
+                    {'style': 'normal', 'runs': [
+                        {'text': '{position} at {company}', 'bold': True},
+                        {'text': '\n{start_date} - {end_date}'},
+                    ]},
+                    {'style': 'normal', 'when': 'description', 'text': '{description}'},
+                    {'bullets': 'responsibilities', 'style': 'normal', 'indent_style': 0.25,
+                     'label': {'style': 'normal', 'runs': [{'text': 'Key Responsibilities:', 'bold': True}]}},
+                    {'bullets': 'achievements', 'style': 'normal', 'indent_style': 0.25,
+                     'label': {'style': 'normal', 'runs': [{'text': 'Key Achievements:', 'bold': True}]}},
+                ]},
+            ]},
+            {'when': 'projects', 'blocks': [
+                {'style': 'section', 'text': 'PROJECTS'},
+                {'items': 'projects', 'blocks': [
+                    {'style': 'normal', 'runs': [
+                        {'text': '{name}', 'bold': True},
+                        {'text': '\nTechnologies: {technologies}', 'when': 'technologies'},
+                    ]},
+                    {'style': 'normal', 'when': 'description', 'text': '{description}'},
+                    {'bullets': 'responsibilities', 'style': 'normal', 'indent_style': 0.25,
+                     'label': {'style': 'normal', 'runs': [{'text': 'Key Responsibilities:', 'bold': True}]}},
+                    {'bullets': 'achievements', 'style': 'normal', 'indent_style': 0.25,
+                     'label': {'style': 'normal', 'runs': [{'text': 'Key Achievements:', 'bold': True}]}},
+                    {'style': 'normal', 'when': 'link', 'text': 'Project Link: {link}'},
+                ]},
+            ]},
+            {'when': 'education', 'blocks': [
+                {'style': 'section', 'text': 'EDUCATION'},
+                {'items': 'education', 'blocks': [
+                    {'style': 'normal', 'runs': [
+                        {'text': '{school} - {degree} in {field}', 'bold': True},
+                        {'text': '\nGraduation: {graduation_date}'},
+                        {'text': ' | GPA: {gpa}', 'when': 'gpa'},
+                    ]},
+                    {'bullets': 'achievements', 'style': 'normal', 'indent_style': 0.25,
+                     'label': {'style': 'normal', 'runs': [{'text': 'Achievements & Activities:', 'bold': True}]}},
+                ]},
+            ]},
+            {'when': 'skills', 'blocks': [
+                {'style': 'section', 'text': 'SKILLS'},
+                {'skills': SKILL_CATEGORIES, 'style': 'normal', 'label': '{title}: ', 'separator': ' • '},
+            ]},
+        ],
+    },
+
+    'creative': {
+        'styles': [
+            ('name', 'Creative Name', {'size': 24, 'bold': True, 'color': CREATIVE_PURPLE, 'font': 'Arial',
+                                       'space_after': 4, 'space_before': 6, 'alignment': 'center'}),
+            ('section', 'Creative Section', {'size': 14, 'bold': True, 'color': CREATIVE_PURPLE, 'font': 'Arial',
+                                             'space_before': 16, 'space_after': 4}),
+            ('normal', 'Creative Normal', {'size': 10, 'font': 'Arial', 'space_after': 2, 'color': (52, 73, 94)}),
+            ('contact', 'Creative Contact', {'size': 10, 'font': 'Arial', 'color': CREATIVE_PURPLE,
+                                             'space_after': 2, 'alignment': 'center'}),
+        ],
+        'margins': (0.5, 0.5, 0.8, 0.8),
+        'sections': [
+            {'scope': 'personal_info', 'blocks': [
+                {'style': 'name', 'text': '✨ {full_name} ✨'},
+                {'style': 'contact', 'when': 'title', 'text': '💫 {title}'},
+                {'style': 'contact', 'runs': [
+                    {'join': ' | ', 'parts': [('email', '📧 {email}'), ('phone', '📱 {phone}'),
+                                              ('location', '📍 {location}')]},
+                ]},
+                {'style': 'contact', 'when': ('linkedin', 'portfolio'), 'runs': [
+                    {'join': ' | ', 'parts': [('linkedin', '🔗 LinkedIn: {linkedin}'),
+                                              ('portfolio', '🌐 Portfolio: {portfolio}')]},
+                ]},
+            ]},
+            {'when': 'summary', 'blocks': [
+                {'style': 'section', 'text': '👨‍💼 PROFESSIONAL SUMMARY'},
+                {'style': 'normal', 'text': '{summary}', 'space_after': 12, 'indent': 0.2},
+            ]},
+            {'when': 'experience', 'blocks': [
+                {'style': 'section', 'text': '💼 EXPERIENCE'},
+                {'items': 'experience', 'blocks': [
+                    {'style': 'normal', 'indent': 0.2, 'space_after': 12, 'runs': [
+                        {'text': '🚀 {position}', 'bold': True},
+                        {'text': '\n🏢 {company}'},
+                        {'text': '\n📅 {start_date} - {end_date}'},
+                    ]},
+                    {'style': 'normal', 'when': 'description', 'text': '{description}', 'indent': 0.4},
+                    {'bullets': 'responsibilities', 'style': 'normal', 'indent': 0.6,
+                     'label': {'style': 'normal', 'indent': 0.4,
+                               'runs': [{'text': '🎯 Key Achievements:', 'bold': True}]}},
+                ]},
+            ]},
+            {'when': 'projects', 'blocks': [
+                {'style': 'section', 'text': '🛠️ PROJECTS'},
+                {'items': 'projects', 'blocks': [
+                    {'style': 'normal', 'indent': 0.2, 'space_after': 12, 'runs': [
+                        {'text': '✨ {name}', 'bold': True},
+                        {'text': '\n💻 Technologies: {technologies}', 'when': 'technologies'},
+                    ]},
+                    {'style': 'normal', 'when': 'description', 'text': '{description}', 'indent': 0.4},
+                    {'bullets': 'responsibilities', 'style': 'normal', 'indent': 0.6,
+                     'label': {'style': 'normal', 'indent': 0.4,
+                               'runs': [{'text': '🎯 Key Features:', 'bold': True}]}},
+                ]},
+            ]},
+            {'when': 'education', 'blocks': [
+                {'style': 'section', 'text': '🎓 EDUCATION'},
+                {'items': 'education', 'blocks': [
+                    {'style': 'normal', 'indent': 0.2, 'space_after': 8, 'runs': [
+                        {'text': '📚 {school}', 'bold': True},
+                        {'text': '\n🎯 {degree} in {field}'},
+                        {'text': '\n📅 Graduation: {graduation_date}'},
+                        {'text': ' | 📊 GPA: {gpa}', 'when': 'gpa'},
+                    ]},
+                ]},
+            ]},
+            {'when': 'skills', 'blocks': [
+                {'style': 'section', 'text': '⭐ SKILLS'},
+                {'skills': SKILL_CATEGORIES, 'style': 'normal', 'indent': 0.2, 'space_after': 6,
+                 'label': '{icon} {title}: ', 'separator': ' • '},
+            ]},
+        ],
+    },
+}
+
+# Template used for unknown template names
+DEFAULT_TEMPLATE = 'modern'
+
+
+def resolve_template(name):
+    """TEMPLATE_SPECS key a requested template name renders with"""
+    name = (name or '').lower()
+    return name if name in TEMPLATE_SPECS else DEFAULT_TEMPLATE
@@ -0,0 +1,32 @@
+"""ATS score weights, versioned so stored scores can be recomputed when they change.
+
+The ATS score is the sum over sections of round(section score * weight).
+To change the weights, add a new version rather than editing an existing
+one, point CURRENT_SCORING_VERSION at it and run
+`python -m utils.rescoring` to bring stored analyses up to date.
+"""
+
+# Section scores the ATS score is built from, in the order weights are applied
+SCORE_SECTIONS = ('contact', 'summary', 'skills', 'experience', 'education', 'format')
+
+SCORING_WEIGHTS = {
+    1: {
+        'contact': 0.1,
+        'summary': 0.1,
+        'skills': 0.3,
+        'experience': 0.2,
+        'education': 0.1,
+        'format': 0.2,
+    },
+}
+
+CURRENT_SCORING_VERSION = 1
+
+
+def scoring_weights(version=None):
+    """Weights of `version` (default: the current one) as a tuple in SCORE_SECTIONS order"""
+    version = CURRENT_SCORING_VERSION if version is None else version
+    if version not in SCORING_WEIGHTS:
+        raise ValueError(f"Unknown scoring version {version}. Available versions: {', '.join(map(str, SCORING_WEIGHTS))}")
+    weights = SCORING_WEIGHTS[version]
+    return tuple(weights[section] for section in SCORE_SECTIONS)
@@ -0,0 +1,116 @@
+"""Canonical skill names and the other spellings they appear under.
+
+Every skill in JOB_ROLES' required_skills has an entry, plus common skills
+used elsewhere (the dashboard categories). Aliases are matched as whole
+words, case-insensitively, and "-", "/" and whitespace are interchangeable,
+so "UI/UX" also covers "ui ux" and "Front-end" covers "front end".
+
+Aliases are other names for the same skill, never related tools or products:
+listing MySQL or Jenkins does not show SQL or CI/CD experience, and
+counting it as such would inflate skill and keyword scores.
+"""
+
+SKILL_ALIASES = {
+    # Languages
+    'Python': ['python3', 'python 3'],
+    'Java': ['core java', 'java se', 'java ee', 'j2ee'],
+    'JavaScript': ['js', 'ecmascript', 'es6', 'es2015', 'vanilla js'],
+    'TypeScript': [],
+    'C++': ['cpp', 'c plus plus'],
+    'C#': ['c sharp', 'csharp'],
+    'R': ['r programming', 'r language', 'rstats'],
+    'Swift': [],
+    'Kotlin': [],
+    'SQL': [],
+    'HTML': ['html5'],
+    'CSS': ['css3'],
+    'Programming': ['coding', 'software development'],
+
+    # Frameworks and libraries
+    'React': ['reactjs', 'react.js'],
+    'React Native': ['react-native'],
+    'Angular': ['angularjs', 'angular.js'],
+    'Vue.js': ['vue', 'vuejs'],
+    'Node.js': ['node', 'nodejs', 'node js'],
+    'Django': ['django rest framework', 'drf'],
+    'Flask': [],
+    'Flutter': [],
+    'TensorFlow': [],
+    'PyTorch': ['torch'],
+    'Unity': ['unity3d', 'unity 3d'],
+    'Unreal Engine': ['unreal', 'ue4', 'ue5'],
+
+    # Data
+    'Machine Learning': ['ml'],
+    'Deep Learning': ['neural networks'],
+    'MLOps': ['ml ops'],
+    'Artificial Intelligence': ['ai'],
+    'Data Science': [],
+    'Analytics': ['data analytics'],
+    'Statistics': ['statistical analysis', 'statistical modeling', 'statistical modelling'],
+    'Data Visualization': ['data visualisation'],
+    'Excel': ['ms excel', 'microsoft excel'],
+    'Databases': ['database', 'dbms'],
+    'MongoDB': ['mongo'],
+    'Database Design': ['data modeling', 'data modelling', 'schema design'],
+
+    # Infrastructure
+    'AWS': ['amazon web services'],
+    'Azure': ['microsoft azure'],
+    'GCP': ['google cloud', 'google cloud platform'],
+    'Cloud Computing': ['cloud'],
+    'Docker': [],
+    'Kubernetes': ['k8s'],
+    'Linux': [],
+    'Git': [],
+    'CI/CD': ['continuous integration', 'continuous delivery', 'continuous deployment'],
+    'DevOps': ['dev ops'],
+    'Infrastructure as Code': ['iac'],
+    'Monitoring': [],
+    'Automation': ['test automation'],
+    'Performance Tuning': ['performance optimization', 'performance optimisation'],
+
+    # Engineering
+    'APIs': ['api', 'rest api', 'rest apis', 'restful', 'restful api', 'restful apis'],
+    'System Design': ['system architecture', 'software architecture'],
+    'Frontend Tech': ['frontend', 'front end', 'frontend development'],
+    'Backend Tech': ['backend', 'back end', 'backend development'],
+    'Responsive Design': ['responsive web design', 'mobile-first design'],
+    '3D Graphics': ['computer graphics'],
+    'Game Physics': ['physics engine', 'physics simulation'],
+    'App Store Deployment': ['app store', 'play store', 'google play'],
+
+    # Security
+    'Security': ['cybersecurity', 'cyber security', 'information security', 'infosec'],
+    'Network Security': ['firewalls'],
+    'Web Security': ['owasp', 'application security', 'appsec'],
+    'Ethical Hacking': ['penetration testing', 'pentesting', 'pen testing'],
+    'Security Tools': ['wireshark', 'metasploit', 'burp suite', 'nmap'],
+    'Threat Detection': ['siem', 'intrusion detection'],
+    'Incident Response': [],
+
+    # Design
+    'UI/UX': ['ui', 'ux', 'ui ux design', 'user interface', 'user experience'],
+    'Mobile UI/UX': ['mobile ui', 'mobile ux', 'mobile design'],
+    'Figma': [],
+    'Adobe XD': [],
+    'Wireframing': ['wireframes'],
+    'Prototyping': ['prototypes'],
+    'Visual Design': ['graphic design'],
+    'Typography': [],
+    'Color Theory': ['colour theory'],
+    'User Research': ['ux research'],
+    'Usability Testing': ['user testing'],
+
+    # Product and management
+    'Agile': ['agile methodology', 'agile methodologies'],
+    'Scrum': ['scrum master'],
+    'Management': ['team management', 'people management'],
+    'Project Planning': ['project management'],
+    'Product Strategy': ['product management'],
+    'Roadmapping': ['product roadmap', 'roadmaps'],
+    'User Stories': [],
+    'Market Research': ['market analysis'],
+    'Stakeholder Management': ['stakeholder communication'],
+    'Risk Management': ['risk assessment'],
+}
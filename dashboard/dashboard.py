@@ -4,6 +4,19 @@ from .components import DashboardComponents
 import json
 import io
 from config.database import get_database_connection
+from utils.skill_index import SKILL_INDEX
+
+# Canonical skill ID -> dashboard category; anything else is 'Other'
+SKILL_CATEGORIES = {
+    SKILL_INDEX.canonical_id(skill): category
+    for category, skills in {
+        'Programming': ['Python', 'Java', 'JavaScript', 'C++', 'Programming'],
+        'Database': ['SQL', 'Databases', 'MongoDB'],
+        'Cloud': ['AWS', 'Azure', 'Cloud Computing'],
+        'Management': ['Agile', 'Scrum', 'Management'],
+    }.items()
+    for skill in skills
+}
 
 class DashboardManager:
     def __init__(self):
@@ -77,8 +90,7 @@ class DashboardManager:
                 skills = resume_data.get('skills_categories', {})
                 for category, skill_list in skills.items():
                     for skill in skill_list:
-                        skill = skill.strip().lower()
-                        if skill:
+                        if skill.strip():
                             skill_category = self._categorize_skill(skill)
                             skill_counts[skill_category] = skill_counts.get(skill_category, 0) + 1
             except json.JSONDecodeError:
@@ -94,18 +106,8 @@ class DashboardManager:
         return categories, counts
 
     def _categorize_skill(self, skill):
-        """Helper method to categorize skills"""
-        skill = skill.lower()
-        if skill in ['python', 'java', 'javascript', 'c++', 'programming']:
-            return 'Programming'
-        elif skill in ['sql', 'mongodb', 'database']:
-            return 'Database'
-        elif skill in ['aws', 'azure', 'cloud']:
-            return 'Cloud'
-        elif skill in ['agile', 'scrum', 'management']:
-            return 'Management'
-        else:
-            return 'Other'
+        """Helper method to categorize skills by their canonical skill ID"""
+        return SKILL_CATEGORIES.get(SKILL_INDEX.canonical_id(skill), 'Other')
 
     def get_weekly_trends(self):
         """Get weekly submission trends"""
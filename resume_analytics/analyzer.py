@@ -1,18 +1,120 @@
+import gc
+import re
+import threading
 import spacy
 from collections import Counter
 from datetime import datetime
+from spacy.language import Language
+from spacy.matcher import PhraseMatcher
+from spacy.tokens import Doc
+from config.skills import SKILL_ALIASES
+from utils.skill_index import SKILL_INDEX, skill_tokens
+
+MODEL_NAME = "en_core_web_sm"
+# Components the analysis never reads: sentences come from the parser and
+# skills/experience from token text, so entities and lemmas are not needed
+EXCLUDED_COMPONENTS = ("ner", "lemmatizer")
+
+_nlp = None
+_nlp_lock = threading.Lock()
+
+# Fast path (parse=False): a number token directly followed by a token
+# containing "year", as _analyze_experience reads the parse; and sentences
+# ended by punctuation or a line break
+EXPERIENCE_YEARS_RE = re.compile(r'(?<![\w.,])(\d+)(?![\w.,])\s+\S*?year', re.IGNORECASE)
+SENTENCE_BREAK_RE = re.compile(r'(?<=[.!?])\s+|\s*\n\s*')
+
+Doc.set_extension("skills", default=None, force=True)
+
+class SkillMatcher:
+    """Pipeline component setting doc._.skills to the sorted canonical names
+    of the skills the doc mentions, matched as whole-token phrases of any
+    length. A list, not a set, so docs can be serialized (nlp.pipe with
+    n_process > 1 sends them back with msgpack)"""
+    def __init__(self, nlp, skill_aliases=SKILL_ALIASES):
+        self.matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
+        for name, aliases in skill_aliases.items():
+            phrases = set()
+            for alias in (name, *aliases):
+                # "-", "/" and spaces are interchangeable, as in the skill index
+                tokens = skill_tokens(alias)
+                phrases.update(separator.join(tokens) for separator in (" ", "-", "/"))
+                phrases.add(alias.lower())
+            self.matcher.add(name, list(nlp.tokenizer.pipe(sorted(phrases))))
+
+    def __call__(self, doc):
+        strings = doc.vocab.strings
+        doc._.skills = sorted({strings[match_id] for match_id, _, _ in self.matcher(doc)})
+        return doc
+
+@Language.factory("skill_matcher")
+def create_skill_matcher(nlp, name):
+    return SkillMatcher(nlp)
+
+def get_nlp():
+    """The process-wide spaCy pipeline, loaded on first use"""
+    global _nlp
+    if _nlp is None:
+        with _nlp_lock:
+            if _nlp is None:
+                nlp = spacy.load(MODEL_NAME, exclude=list(EXCLUDED_COMPONENTS))
+                if "skill_matcher" not in nlp.pipe_names:
+                    nlp.add_pipe("skill_matcher", last=True)
+                _nlp = nlp
+    return _nlp
+
+def preload_model():
+    """Load the pipeline now, e.g. in a server's master process before it
+    forks workers, so they share the model's pages copy-on-write"""
+    nlp = get_nlp()
+    # Keep the collector from writing to the model's objects in the children
+    gc.freeze()
+    return nlp
 
 class ResumeAnalyzer:
-    def __init__(self):
-        self.nlp = spacy.load("en_core_web_sm")
-        
-    def analyze_resume(self, resume_text):
-        doc = self.nlp(resume_text)
+    def __init__(self, parse=True):
+        """With parse=False, metrics come from regular expressions and the
+        skill index alone, without loading or running spaCy; pass parse=True
+        to analyze_resume to get the full parse for a particular resume"""
+        self.parse = parse
+
+    @property
+    def nlp(self):
+        return get_nlp()
         
-        word_count = len(resume_text.split())
-        sentence_count = len(list(doc.sents))
-        skills = self._extract_skills(doc)
-        experience_years = self._analyze_experience(doc)
+    def analyze_resume(self, resume_text, parse=None):
+        if parse is None:
+            parse = self.parse
+        if not parse:
+            return self._analyze_text(resume_text)
+        return self._analyze_doc(self.nlp(resume_text))
+
+    def analyze_resumes(self, texts, batch_size=32, n_process=1):
+        """Analyze many resumes with nlp.pipe, yielding results in input order.
+
+        `texts` may be any iterable, including a generator; it is consumed
+        lazily. With n_process > 1 spaCy parses in that many worker processes;
+        analyzers created with parse=False skip spaCy here too.
+        """
+        if not self.parse:
+            for text in texts:
+                yield self._analyze_text(text)
+            return
+        for doc in self.nlp.pipe(texts, batch_size=batch_size, n_process=n_process):
+            yield self._analyze_doc(doc)
+
+    def _analyze_doc(self, doc):
+        return self._build_result(
+            len(doc.text.split()), len(list(doc.sents)), self._extract_skills(doc), self._analyze_experience(doc)
+        )
+
+    def _analyze_text(self, resume_text):
+        sentence_count = sum(1 for sentence in SENTENCE_BREAK_RE.split(resume_text) if sentence.strip())
+        skills = {SKILL_INDEX.names[skill_id] for skill_id in SKILL_INDEX.find_ids(resume_text)}
+        experience_years = max((int(years) for years in EXPERIENCE_YEARS_RE.findall(resume_text)), default=0)
+        return self._build_result(len(resume_text.split()), sentence_count, skills, experience_years)
+
+    def _build_result(self, word_count, sentence_count, skills, experience_years):
         profile_score = self._calculate_profile_score(
             word_count, sentence_count, len(skills), experience_years
         )
@@ -32,22 +134,7 @@ class ResumeAnalyzer:
         }
     
     def _extract_skills(self, doc):
-        tech_skills = {
-            "python", "java", "javascript", "react", "node.js", "sql",
-            "html", "css", "aws", "docker", "kubernetes", "git",
-            "machine learning", "ai", "data science", "analytics"
-        }
-        
-        skills = set()
-        for token in doc:
-            if token.text.lower() in tech_skills:
-                skills.add(token.text)
-            if token.i < len(doc) - 1:
-                bigram = (token.text + " " + doc[token.i + 1].text).lower()
-                if bigram in tech_skills:
-                    skills.add(bigram)
-        
-        return skills
+        return set(doc._.skills)
     
     def _analyze_experience(self, doc):
         experience_years = 0
@@ -0,0 +1,74 @@
+import copy
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from utils.resume_document import ResumeDocument
+
+
+class AnalysisSession:
+    """Per-upload analysis state: the inputs plus every stage result computed so far"""
+
+    def __init__(self, text, job_requirements):
+        self.text = text
+        self.document = ResumeDocument(text)
+        self.job_requirements = job_requirements
+        self.results = {}
+        # Held while stages run, so concurrent requests for the same upload
+        # compute each stage once
+        self.lock = threading.RLock()
+
+
+class AnalysisPipeline:
+    """Runs analysis stages on demand over an explicit dependency graph.
+
+    `stages` maps a stage name to `(dependencies, function)`; the function is
+    called with the session followed by the results of its dependencies, in
+    order. Each stage runs at most once per session, and sessions are kept in
+    a small LRU keyed by the text and job requirements, so a later request
+    for more fields on the same upload only runs the stages it is missing.
+    Callers get a copy of each cached result, so post-processing one never
+    changes what later requests see.
+    """
+
+    def __init__(self, stages, max_sessions=64):
+        self.stages = stages
+        self.max_sessions = max_sessions
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def session_key(text, job_requirements):
+        digest = hashlib.sha1(text.encode('utf-8', 'surrogatepass'))
+        digest.update(json.dumps(job_requirements, sort_keys=True, default=str).encode('utf-8'))
+        return digest.hexdigest()
+
+    def session_for(self, text, job_requirements):
+        """Return the cached session for this input, creating it if needed"""
+        key = self.session_key(text, job_requirements)
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is not None:
+                self._sessions.move_to_end(key)
+                return session
+            session = AnalysisSession(text, job_requirements)
+            self._sessions[key] = session
+            if len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+            return session
+
+    def run(self, session, stage):
+        """Return a copy of the result of `stage`, computing it and its
+        dependencies if needed"""
+        with session.lock:
+            return copy.deepcopy(self._result(session, stage))
+
+    def _result(self, session, stage):
+        """The cached result of `stage`; stages get their dependencies'
+        results uncopied and must not modify them"""
+        if stage in session.results:
+            return session.results[stage]
+        dependencies, function = self.stages[stage]
+        result = function(session, *(self._result(session, dependency) for dependency in dependencies))
+        session.results[stage] = result
+        return result
@@ -0,0 +1,102 @@
+"""Regular expressions used by utils.resume_analyzer, compiled once at import.
+
+Python's own pattern cache is small and shared with every other library in
+the process, so the analyzer never passes literal pattern strings to `re`.
+"""
+import re
+from functools import lru_cache
+
+# Personal information
+EMAIL_RE = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+PHONE_RE = re.compile(r'(\+\d{1,3}[-.]?)?\s*\(?\d{3}\)?[-.]?\s*\d{3}[-.]?\s*\d{4}')
+LINKEDIN_RE = re.compile(r'linkedin\.com/in/[\w-]+')
+GITHUB_RE = re.compile(r'github\.com/[\w-]+')
+SECTION_NAME_RE = re.compile(r'^(education|experience|skills|summary|objective)$')
+
+# Formatting: any one of these counts as properly formatted contact details.
+# None of the alternatives can match across a newline, so lines can be
+# searched one at a time.
+CONTACT_RE = re.compile(
+    r'\b[\w\.-]+@[\w\.-]+\.\w+\b'
+    r'|\b\d{3}[-.]?\d{3}[-.]?\d{4}\b'
+    r'|linkedin\.com/\w+'
+)
+BULLET_MARKERS = ('•', '-', '*', '→')
+
+# Summary: opening lines that mention contact details are not a summary
+CONTACT_WORDS_RE = re.compile(r'\b(?:email|phone|address|tel|mobile|linkedin)\b')
+
+# Experience and education entries: every feature the suggestion checks look
+# for, as one alternation so an entry is scanned once for all of them. Match
+# `lastgroup` names the feature.
+ENTRY_FEATURES_RE = re.compile(
+    r'(?P<date>\b(?:19|20)\d{2}\b)'
+    r'|(?P<bullet>[•\-\*])'
+    r'|(?P<action_verb>\b(?:developed|managed|created|implemented|designed|led|improved)\b)'
+    r'|(?P<degree>\b(?:bachelor|master|phd|b\.|m\.|diploma)\b)'
+    r'|(?P<gpa>\b(?:gpa|cgpa|grade|percentage)\b)',
+    re.IGNORECASE
+)
+
+# Skills: list delimiters, with dashes only when spaced ("Python - SQL"), and
+# the separators inside a single entry ("Python/Django", "HTML-CSS") that are
+# only split on when the entry as a whole is not a known skill
+SKILL_SEPARATOR_RE = re.compile(r'[,•|·>]|\s[-–―]\s')
+SKILL_PART_SEPARATOR_RE = re.compile(r'[/\\\-–―]')
+
+SECTION_KEYWORDS = {
+    'education': [
+        'education', 'academic', 'qualification', 'degree', 'university', 'college',
+        'school', 'institute', 'certification', 'diploma', 'bachelor', 'master',
+        'phd', 'b.tech', 'm.tech', 'b.e', 'm.e', 'b.sc', 'm.sc','bca', 'mca', 'b.com',
+        'm.com', 'b.cs-it', 'imca', 'bba', 'mba', 'honors', 'scholarship'
+    ],
+    'experience': [
+        'experience', 'employment', 'work history', 'professional experience',
+        'work experience', 'career history', 'professional background',
+        'employment history', 'job history', 'positions held',
+        'job title', 'job responsibilities', 'job description', 'job summary'
+    ],
+    'projects': [
+        'projects', 'personal projects', 'academic projects', 'key projects',
+        'major projects', 'professional projects', 'project experience',
+        'relevant projects', 'featured projects','latest projects',
+        'top projects'
+    ],
+    'skills': [
+        'skills', 'technical skills', 'competencies', 'expertise',
+        'core competencies', 'professional skills', 'key skills',
+        'technical expertise', 'proficiencies', 'qualifications',
+        'top skills', 'key skill', 'major skill', 'personal skill',
+        'soft skills', 'soft skill', 'soft skillset'
+    ],
+    'summary': [
+        'summary', 'professional summary', 'career summary', 'objective',
+        'career objective', 'professional objective', 'about me', 'profile',
+        'professional profile', 'career profile', 'overview', 'skill summary'
+    ],
+}
+
+
+@lru_cache(maxsize=None)
+def keyword_pattern(keywords):
+    """Compiled alternation matching any of `keywords` (a tuple) as a substring"""
+    return re.compile('|'.join(re.escape(keyword.lower()) for keyword in keywords))
+
+
+SECTION_RES = {section: keyword_pattern(tuple(keywords)) for section, keywords in SECTION_KEYWORDS.items()}
+
+
+def entry_features(entries, wanted):
+    """Return which of the `wanted` ENTRY_FEATURES_RE features occur in any entry.
+
+    Stops scanning as soon as every wanted feature has been seen.
+    """
+    found = set()
+    for entry in entries:
+        for match in ENTRY_FEATURES_RE.finditer(entry):
+            if match.lastgroup in wanted:
+                found.add(match.lastgroup)
+                if found >= wanted:
+                    return found
+    return found
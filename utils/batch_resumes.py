@@ -0,0 +1,223 @@
+"""Batch resume generation streamed as a ZIP archive.
+
+Each record has the /generate_resume shape. Records are rendered with the
+direct OOXML backend across a shared process pool, and each DOCX is
+written to the archive as soon as it completes, so a response only holds
+the few documents still in flight. Only a bounded window of records is
+submitted at once, which keeps a slow client from piling up finished
+documents in memory. The last entry, manifest.json, lists every record's
+file or error in input order.
+"""
+import atexit
+import json
+import threading
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, CancelledError, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from werkzeug.utils import secure_filename
+from utils.pdf_extraction import _available_cpus
+
+REQUIRED_FIELDS = ['name', 'email', 'phone', 'education', 'experience', 'skills']
+MAX_BATCH_RECORDS = 1000
+MAX_WORKERS = 4
+# Records submitted per worker before waiting for one to finish
+PENDING_PER_WORKER = 2
+MANIFEST_NAME = 'manifest.json'
+
+_executor = None
+_executor_lock = threading.Lock()
+_worker_builder = None
+
+
+def missing_fields(record):
+    """Required /generate_resume fields that are absent or empty in record"""
+    return [field for field in REQUIRED_FIELDS if not record.get(field)]
+
+
+def record_resume_data(record):
+    """Builder data for a validated /generate_resume record"""
+    return {
+        'personal_info': {
+            'full_name': record['name'],
+            'email': record['email'],
+            'phone': record['phone']
+        },
+        'summary': '',
+        'experience': record['experience'],
+        'education': record['education'],
+        'projects': [],
+        'skills': {
+            'technical': record['skills'],
+            'soft': [],
+            'languages': [],
+            'tools': []
+        },
+        'skills_categories': {
+            'technical': record['skills'],
+            'soft': [],
+            'languages': [],
+            'tools': []
+        },
+        'template': 'Modern'
+    }
+
+
+def resume_filename(record):
+    return f"{record['name'].replace(' ', '_')}_resume.docx"
+
+
+def _start_worker():
+    """Pool initializer: build one ResumeBuilder per process"""
+    global _worker_builder
+    from utils.resume_builder import ResumeBuilder
+    _worker_builder = ResumeBuilder()
+
+
+def _get_executor(workers):
+    """The shared batch pool, created on first use"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(max_workers=workers, initializer=_start_worker)
+        return _executor
+
+
+def _discard_executor(executor):
+    """Stop handing out a broken pool; the next batch starts a new one. It is
+    not shut down here, since other streams may still be collecting from it."""
+    global _executor
+    with _executor_lock:
+        if _executor is executor:
+            _executor = None
+
+
+def shutdown_batch_pool():
+    """Shut down the shared batch pool if it was started"""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(cancel_futures=True)
+
+
+atexit.register(shutdown_batch_pool)
+
+
+def _render_record(builder, index, record):
+    """(index, archive name, DOCX bytes, None) or (index, None, None, error)"""
+    try:
+        if not isinstance(record, dict):
+            raise ValueError("Record must be a JSON object")
+        missing = missing_fields(record)
+        if missing:
+            raise ValueError(f"Missing fields: {', '.join(missing)}")
+        data = builder.generate_resume(record_resume_data(record), backend='ooxml').getvalue()
+        return index, f"{index + 1:04d}_{secure_filename(resume_filename(record))}", data, None
+    except KeyError as e:
+        # A field a template formats is missing from a nested entry
+        return index, None, None, f"Missing field: {e.args[0]}"
+    except Exception as e:
+        return index, None, None, str(e)
+
+
+def _render_in_worker(index, record):
+    return _render_record(_worker_builder, index, record)
+
+
+def _render_all(records, builder):
+    """_render_record results in completion order; in this process with
+    `builder` when there is one CPU or the pool breaks"""
+    workers = min(MAX_WORKERS, _available_cpus())
+    if workers < 2 or len(records) < 2:
+        for index, record in enumerate(records):
+            yield _render_record(builder, index, record)
+        return
+
+    executor = _get_executor(workers)
+    queued = iter(enumerate(records))
+    pending = {}
+    failed = None
+    try:
+        while failed is None:
+            for index, record in queued:
+                try:
+                    pending[executor.submit(_render_in_worker, index, record)] = (index, record)
+                except (BrokenProcessPool, RuntimeError):
+                    # Broken, or shut down at exit
+                    failed = [(index, record)]
+                    break
+                if len(pending) >= workers * PENDING_PER_WORKER:
+                    break
+            if failed is not None or not pending:
+                break
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, record = pending.pop(future)
+                try:
+                    result = future.result()
+                except (BrokenProcessPool, CancelledError):
+                    failed = [(index, record)]
+                    break
+                yield result
+        if failed is None:
+            return
+
+        print("Batch resume pool failed, rendering the rest of the batch in-process")
+        _discard_executor(executor)
+        remaining = sorted(failed + list(pending.values()) + list(queued), key=lambda item: item[0])
+        pending.clear()
+        for index, record in remaining:
+            yield _render_record(builder, index, record)
+    finally:
+        # The client went away or the pool broke: drop work nobody will read
+        for future in pending:
+            future.cancel()
+
+
+class _ChunkStream:
+    """Write-only file for zipfile that hands what was written so far back
+    to the response generator"""
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def stream_resume_zip(records, builder):
+    """Yield a ZIP of one DOCX per record plus manifest.json, each file
+    written as soon as it is rendered. `builder` renders in-process when no
+    pool is used."""
+    stream = _ChunkStream()
+    manifest = []
+    # DOCX files are already deflated, so they are stored as is
+    with zipfile.ZipFile(stream, 'w', zipfile.ZIP_STORED) as archive:
+        for index, filename, data, error in _render_all(records, builder):
+            if error is None:
+                archive.writestr(filename, data)
+                manifest.append({'index': index, 'status': 'success', 'file': filename})
+            else:
+                print(f"Error generating batch resume {index}: {error}")
+                manifest.append({'index': index, 'status': 'error', 'message': error})
+            chunk = stream.drain()
+            if chunk:
+                yield chunk
+        manifest.sort(key=lambda entry: entry['index'])
+        succeeded = sum(1 for entry in manifest if entry['status'] == 'success')
+        archive.writestr(MANIFEST_NAME, json.dumps({
+            'total': len(records),
+            'succeeded': succeeded,
+            'failed': len(records) - succeeded,
+            'records': manifest
+        }, indent=2))
+    yield stream.drain()
@@ -0,0 +1,95 @@
+import zipfile
+from xml.etree.ElementTree import iterparse
+
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_BODY = _W + 'body'
+_P = _W + 'p'
+_R = _W + 'r'
+_HYPERLINK = _W + 'hyperlink'
+_BR = _W + 'br'
+_TYPE = _W + 'type'
+
+# With a screen callback, the leading text up to this many characters is
+# judged before the rest of the document is parsed.
+SCREEN_CHARS = 4096
+
+# Run children that carry text, with the same plain-text equivalents python-docx
+# uses for `Run.text`; w:t contributes its own text and w:br depends on its type.
+_RUN_TEXT = {
+    _W + 'tab': '\t',
+    _W + 'ptab': '\t',
+    _W + 'cr': '\n',
+    _W + 'noBreakHyphen': '-',
+}
+
+
+def iter_docx_paragraphs(docx_file):
+    """Yield the text of each body and table-cell paragraph in document order.
+
+    `word/document.xml` is streamed out of the zip and parsed incrementally;
+    every finished top-level block is dropped from the tree, so memory stays
+    bounded by the largest single paragraph or table rather than the document.
+    Paragraph text follows python-docx's `Paragraph.text`: only runs directly
+    in the paragraph or in a hyperlink count, so text-box content nested in a
+    drawing (and its VML fallback copy) is skipped.
+    """
+    with zipfile.ZipFile(docx_file) as archive, archive.open('word/document.xml') as stream:
+        tags = []
+        body = None
+        chunks = None
+        run_depth = None
+
+        for event, elem in iterparse(stream, events=('start', 'end')):
+            tag = elem.tag
+            if event == 'start':
+                if tag == _BODY:
+                    body = elem
+                elif run_depth is None:
+                    if tag == _P:
+                        chunks = []
+                    elif tag == _R and chunks is not None and (
+                            tags[-1] == _P or (tags[-1] == _HYPERLINK and tags[-2] == _P)):
+                        run_depth = len(tags)
+                tags.append(tag)
+                continue
+
+            tags.pop()
+            if run_depth is not None:
+                if len(tags) == run_depth:
+                    run_depth = None
+                elif len(tags) == run_depth + 1:
+                    if tag == _W + 't':
+                        chunks.append(elem.text or '')
+                    elif tag == _BR:
+                        if elem.get(_TYPE, 'textWrapping') == 'textWrapping':
+                            chunks.append('\n')
+                    elif tag in _RUN_TEXT:
+                        chunks.append(_RUN_TEXT[tag])
+            elif tag == _P and chunks is not None:
+                yield ''.join(chunks)
+                chunks = None
+
+            if body is not None and tags and tags[-1] == _BODY:
+                body.clear()
+
+
+def extract_docx_text(docx_file, screen=None, screen_chars=SCREEN_CHARS):
+    """Return the non-empty paragraph and table-cell lines of a DOCX file.
+
+    `screen` is an optional predicate over the first `screen_chars` of text:
+    when it returns True parsing stops there and only that prefix is returned.
+    """
+    lines = []
+    size = 0
+    paragraphs = iter_docx_paragraphs(docx_file)
+    for text in paragraphs:
+        if not text.strip():
+            continue
+        lines.append(text)
+        size += len(text) + 1
+        if screen is not None and size >= screen_chars:
+            if screen('\n'.join(lines)):
+                paragraphs.close()
+                return '\n'.join(lines)
+            screen = None
+    return '\n'.join(lines)
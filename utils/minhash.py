@@ -0,0 +1,80 @@
+"""MinHash signatures and LSH banding for near-duplicate resume detection.
+
+A resume's signature is the minimum of 128 independent hashes over its word
+3-shingles; the fraction of positions on which two signatures agree
+estimates the Jaccard similarity of their shingle sets. For lookup the
+signature is cut into 32 bands of 4 rows, and each band is hashed to a
+bucket key: resumes sharing any bucket are candidates. At these settings a
+pair at 0.7 similarity shares a bucket with probability above 0.999, and
+candidates are then checked against DUPLICATE_THRESHOLD on the full
+signatures, so loosely related pairs cost a comparison but are not flagged.
+"""
+import hashlib
+import re
+import zlib
+import numpy as np
+
+NUM_PERMUTATIONS = 128
+BANDS = 32
+ROWS_PER_BAND = NUM_PERMUTATIONS // BANDS
+SHINGLE_SIZE = 3
+# Estimated Jaccard similarity at or above which a resume is a near-duplicate
+DUPLICATE_THRESHOLD = 0.7
+
+_WORD_RE = re.compile(r'\w+')
+
+# Multiply-shift hash family: h(x) = ((a * x + b) mod 2**64) >> 32 with odd a.
+# Fixed seed, so signatures stored in the database stay comparable.
+_random = np.random.RandomState(20240601)
+_A = (_random.randint(0, 2 ** 63, NUM_PERMUTATIONS, dtype=np.uint64) << np.uint64(1)) | np.uint64(1)
+_B = _random.randint(0, 2 ** 63, NUM_PERMUTATIONS, dtype=np.uint64) << np.uint64(1)
+
+
+def shingle_hashes(text):
+    """Stable 32-bit hashes of the distinct word 3-shingles of `text`"""
+    words = _WORD_RE.findall(text.lower())
+    if len(words) < SHINGLE_SIZE:
+        words = words and [' '.join(words)]
+        size = 1
+    else:
+        size = SHINGLE_SIZE
+    return np.fromiter(
+        {zlib.crc32(' '.join(words[i:i + size]).encode('utf-8')) for i in range(len(words) - size + 1)},
+        dtype=np.uint64)
+
+
+def minhash_signature(text):
+    """MinHash signature of `text` (uint32 array), or None if it has no words"""
+    hashes = shingle_hashes(text)
+    if not len(hashes):
+        return None
+    signature = np.full(NUM_PERMUTATIONS, np.iinfo(np.uint64).max, dtype=np.uint64)
+    # In chunks, so a long document never needs a 128 x shingles matrix at once
+    for start in range(0, len(hashes), 2048):
+        chunk = hashes[start:start + 2048]
+        permuted = (np.outer(_A, chunk) + _B[:, None]) >> np.uint64(32)
+        np.minimum(signature, permuted.min(axis=1), out=signature)
+    return signature.astype(np.uint32)
+
+
+def signature_to_bytes(signature):
+    return signature.astype('<u4').tobytes()
+
+
+def signature_from_bytes(data):
+    return np.frombuffer(data, dtype='<u4')
+
+
+def band_keys(signature):
+    """(band, bucket key) pairs of `signature`, bucket keys as signed 64-bit ints"""
+    data = signature.astype('<u4').tobytes()
+    width = ROWS_PER_BAND * 4
+    return [
+        (band, int.from_bytes(hashlib.blake2b(data[band * width:(band + 1) * width], digest_size=8).digest(),
+                              'little', signed=True))
+        for band in range(BANDS)
+    ]
+
+
+def estimated_similarity(signature, other):
+    return float(np.mean(signature == other))
@@ -0,0 +1,139 @@
+"""Write rendered resumes (utils.render_plan) as DOCX without python-docx.
+
+python-docx builds a proxy object and an lxml element for every paragraph
+and run, which is most of what generating a resume costs. OoxmlWriter
+emits word/document.xml directly instead: the pPr/rPr markup for each
+ParagraphFormat and RunFormat is precompiled once, a resume is a join of
+those fragments and its escaped text, and the result is appended to a
+zip that already holds every other part of the template's base document.
+
+The XML matches what python-docx would serialize for the same rendered
+resume; benchmarks/bench_ooxml_writer.py checks this part by part.
+"""
+import re
+import zipfile
+from io import BytesIO
+from xml.sax.saxutils import escape
+
+from docx import Document
+from docx.shared import Inches, Pt, RGBColor
+
+DOCUMENT_PART = 'word/document.xml'
+
+JUSTIFICATIONS = {'left': 'left', 'center': 'center', 'right': 'right'}
+
+# Text lxml refuses to serialize, so python-docx would fail on it too
+_INVALID_XML_CHARS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff]')
+# python-docx writes a tab as <w:tab/> and each CR or LF as <w:br/>
+_RUN_BREAKS = re.compile('([\t\r\n])')
+_BREAK_XML = {'\t': '<w:tab/>', '\r': '<w:br/>', '\n': '<w:br/>'}
+
+
+def _text_xml(text):
+    """Run content for `text`, split into w:t, w:tab and w:br elements"""
+    parts = []
+    for piece in _RUN_BREAKS.split(text):
+        if piece in _BREAK_XML:
+            parts.append(_BREAK_XML[piece])
+        elif piece:
+            if len(piece.strip()) < len(piece):
+                parts.append('<w:t xml:space="preserve">' + escape(piece) + '</w:t>')
+            else:
+                parts.append('<w:t>' + escape(piece) + '</w:t>')
+    return ''.join(parts)
+
+
+class OoxmlWriter:
+    """DOCX writer for one template, given its base document bytes and
+    style IDs by style name (see ResumeBuilder)"""
+
+    def __init__(self, base_document, style_ids):
+        self.base_document = base_document
+        self.style_ids = style_ids
+        with zipfile.ZipFile(BytesIO(base_document)) as package:
+            document_xml = package.read(DOCUMENT_PART).decode('utf-8')
+        # Paragraphs go at the end of the body, before the section properties
+        split = document_xml.index('<w:sectPr')
+        self._head, self._tail = document_xml[:split], document_xml[split:]
+        self._paragraph_starts = {}
+        self._runs = {}
+        # Zips of every part but document.xml, by style indents applied
+        self._packages = {}
+
+    def write(self, rendered):
+        """BytesIO holding the DOCX for a RenderedResume; raises ValueError
+        on text that cannot be stored in XML"""
+        body = []
+        append = body.append
+        for paragraph_format, runs in rendered.paragraphs:
+            start = self._paragraph_starts.get(paragraph_format)
+            if start is None:
+                start = self._paragraph_starts[paragraph_format] = self._paragraph_start(paragraph_format)
+            append(start)
+            for text, run_format in runs:
+                run = self._runs.get(run_format)
+                if run is None:
+                    run = self._runs[run_format] = self._run_fragments(run_format)
+                if text:
+                    append(run[0] + _text_xml(text) + '</w:r>')
+                else:
+                    append(run[1])
+            append('</w:p>')
+        body = ''.join(body)
+        if _INVALID_XML_CHARS.search(body):
+            raise ValueError('All strings must be XML compatible: Unicode or ASCII, no NULL bytes or control characters')
+
+        buffer = BytesIO(self._package(rendered.style_indents))
+        with zipfile.ZipFile(buffer, 'a', zipfile.ZIP_DEFLATED) as package:
+            package.writestr(DOCUMENT_PART, (self._head + body + self._tail).encode('utf-8'))
+        buffer.seek(0)
+        return buffer
+
+    def _paragraph_start(self, paragraph_format):
+        """<w:p> and its pPr, in schema order"""
+        xml = '<w:p><w:pPr><w:pStyle w:val=%s/>' % _attribute(self.style_ids[paragraph_format.style])
+        if paragraph_format.space_after is not None:
+            xml += '<w:spacing w:after="%d"/>' % Pt(paragraph_format.space_after).twips
+        if paragraph_format.indent is not None:
+            xml += '<w:ind w:left="%d"/>' % Inches(paragraph_format.indent).twips
+        if paragraph_format.alignment is not None:
+            xml += '<w:jc w:val="%s"/>' % JUSTIFICATIONS[paragraph_format.alignment]
+        return xml + '</w:pPr>'
+
+    def _run_fragments(self, run_format):
+        """(run start, empty run) for a RunFormat"""
+        properties = ''
+        if run_format.bold:
+            properties += '<w:b/>'
+        if run_format.color:
+            properties += '<w:color w:val="%s"/>' % str(RGBColor(*run_format.color))
+        if not properties:
+            return '<w:r>', '<w:r/>'
+        start = '<w:r><w:rPr>' + properties + '</w:rPr>'
+        return start, start + '</w:r>'
+
+    def _package(self, style_indents):
+        """Zip bytes with every part of the base document except
+        document.xml, with `style_indents` applied to the styles"""
+        key = tuple(sorted(style_indents.items()))
+        package = self._packages.get(key)
+        if package is None:
+            source = self.base_document
+            if style_indents:
+                doc = Document(BytesIO(source))
+                for style_name, indent in style_indents.items():
+                    doc.styles[style_name].paragraph_format.left_indent = Inches(indent)
+                buffer = BytesIO()
+                doc.save(buffer)
+                source = buffer.getvalue()
+            buffer = BytesIO()
+            with zipfile.ZipFile(BytesIO(source)) as base, zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as out:
+                for info in base.infolist():
+                    if info.filename != DOCUMENT_PART:
+                        out.writestr(info, base.read(info))
+            package = self._packages[key] = buffer.getvalue()
+        return package
+
+
+def _attribute(value):
+    return '"%s"' % escape(value, {'"': '&quot;'})
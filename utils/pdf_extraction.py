@@ -0,0 +1,231 @@
+import io
+import os
+import re
+import atexit
+import threading
+from abc import ABC, abstractmethod
+from concurrent.futures import CancelledError, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import PyPDF2
+
+# Documents with at least this many pages are split across the process pool;
+# below it the pickling and re-parsing overhead outweighs the parallelism.
+PARALLEL_PAGE_THRESHOLD = 16
+MIN_PAGES_PER_CHUNK = 4
+MAX_WORKERS = 4
+
+# Extraction output with fewer characters than this per page, with more than
+# this share of single-letter "words" (letter-spaced glyph runs), or with
+# words this long on average (glyphs glued together without spaces) is
+# treated as degenerate and retried with the layout-aware backend.
+MIN_CHARS_PER_PAGE = 80
+MAX_SINGLE_CHAR_WORD_RATIO = 0.4
+MAX_MEAN_WORD_LENGTH = 14
+MIN_WORDS_FOR_RATIO_CHECK = 20
+
+# With a screen callback, documents longer than this are first judged on their
+# leading pages, and the rest is never extracted if the screen rejects them.
+SCREEN_PAGES = 2
+
+_WORD_RE = re.compile(r'\S+')
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _available_cpus():
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def _get_executor():
+    """Create the shared extraction pool on first use"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(max_workers=min(MAX_WORKERS, _available_cpus()))
+        return _executor
+
+
+def _discard_executor(executor):
+    """Stop handing out a broken pool; the next extraction starts a new one.
+    It is not shut down here, since other requests may still be waiting on it."""
+    global _executor
+    with _executor_lock:
+        if _executor is executor:
+            _executor = None
+
+
+def shutdown_pdf_pool():
+    """Shut down the shared extraction pool if it was started"""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(cancel_futures=True)
+
+
+atexit.register(shutdown_pdf_pool)
+
+
+def _extract_pages(pages):
+    chunks = []
+    for page in pages:
+        extracted = page.extract_text()
+        if extracted:
+            chunks.append(extracted + "\n")
+    return chunks
+
+
+def _extract_page_range(pdf_bytes, start, stop):
+    """Worker entry point: re-open the PDF and extract pages [start, stop)"""
+    reader = PyPDF2.PdfReader(io.BytesIO(pdf_bytes))
+    return ''.join(_extract_pages(reader.pages[start:stop]))
+
+
+class PdfBackend(ABC):
+    """Interface for PDF text extraction backends"""
+    name = None
+
+    @abstractmethod
+    def extract(self, pdf_bytes):
+        """Return (text, page_count) for the given PDF bytes"""
+
+
+class PyPDF2Backend(PdfBackend):
+    """Fast content-stream extraction; weak on multi-column layouts"""
+    name = 'pypdf2'
+
+    def __init__(self, parallel_threshold=PARALLEL_PAGE_THRESHOLD):
+        self.parallel_threshold = parallel_threshold
+
+    def extract(self, pdf_bytes):
+        """Extract page text in page order.
+
+        Long documents are extracted in contiguous page ranges across a
+        process pool (one range per worker, since every worker re-parses the
+        file); the per-range chunks are joined once at the end.
+        """
+        reader = PyPDF2.PdfReader(io.BytesIO(pdf_bytes))
+        page_count = len(reader.pages)
+        workers = min(MAX_WORKERS, _available_cpus())
+
+        if page_count < self.parallel_threshold or workers < 2:
+            return ''.join(_extract_pages(reader.pages)), page_count
+
+        pages_per_chunk = max(MIN_PAGES_PER_CHUNK, -(-page_count // workers))
+        ranges = [(start, min(start + pages_per_chunk, page_count))
+                  for start in range(0, page_count, pages_per_chunk)]
+        executor = _get_executor()
+        futures = []
+        try:
+            for start, stop in ranges:
+                futures.append(executor.submit(_extract_page_range, pdf_bytes, start, stop))
+            return ''.join(future.result() for future in futures), page_count
+        except (BrokenProcessPool, CancelledError, RuntimeError):
+            # Broken, or shut down at exit while this request was in flight
+            print("PDF extraction pool failed, falling back to sequential extraction")
+            _discard_executor(executor)
+            for future in futures:
+                future.cancel()
+            return ''.join(_extract_pages(reader.pages)), page_count
+
+
+class PdfMinerBackend(PdfBackend):
+    """Layout-aware extraction that keeps columns and text boxes together"""
+    name = 'pdfminer'
+
+    def extract(self, pdf_bytes):
+        from pdfminer.high_level import extract_pages
+        from pdfminer.layout import LAParams, LTTextContainer
+
+        chunks = []
+        page_count = 0
+        for page_layout in extract_pages(io.BytesIO(pdf_bytes), laparams=LAParams()):
+            page_count += 1
+            for element in page_layout:
+                if isinstance(element, LTTextContainer):
+                    chunks.append(element.get_text())
+            chunks.append("\n")
+        return ''.join(chunks), page_count
+
+
+BACKENDS = {
+    PyPDF2Backend.name: PyPDF2Backend(),
+    PdfMinerBackend.name: PdfMinerBackend(),
+}
+
+
+def looks_degenerate(text, page_count):
+    """Heuristic check for extraction output that is not worth analyzing"""
+    stripped = text.strip()
+    if len(stripped) < MIN_CHARS_PER_PAGE * max(1, page_count):
+        return True
+    words = _WORD_RE.findall(stripped)
+    if len(stripped) / max(1, len(words)) > MAX_MEAN_WORD_LENGTH:
+        return True
+    if len(words) >= MIN_WORDS_FOR_RATIO_CHECK:
+        single_chars = sum(1 for word in words if len(word) == 1)
+        if single_chars / len(words) > MAX_SINGLE_CHAR_WORD_RATIO:
+            return True
+    return False
+
+
+class FallbackStrategy:
+    """Try backends in order, keeping the first non-degenerate output.
+
+    If every backend is degenerate, the longest output wins.
+    """
+
+    def __init__(self, *backend_names):
+        self.backend_names = backend_names
+
+    def extract(self, pdf_bytes):
+        best = ''
+        errors = []
+        for name in self.backend_names:
+            try:
+                text, page_count = BACKENDS[name].extract(pdf_bytes)
+            except Exception as e:
+                errors.append(f"{name}: {e}")
+                continue
+            if not looks_degenerate(text, page_count):
+                return text
+            if len(text.strip()) > len(best.strip()):
+                best = text
+        if not best and errors:
+            raise Exception('; '.join(errors))
+        return best
+
+
+DEFAULT_STRATEGY = FallbackStrategy(PyPDF2Backend.name, PdfMinerBackend.name)
+
+
+def extract_pdf_prefix(pdf_bytes, page_limit=SCREEN_PAGES):
+    """Return the text of the first `page_limit` pages, or None if the
+    document has no more pages than that"""
+    reader = PyPDF2.PdfReader(io.BytesIO(pdf_bytes))
+    if len(reader.pages) <= page_limit:
+        return None
+    return ''.join(_extract_pages(reader.pages[:page_limit]))
+
+
+def extract_pdf_text(file, backend=None, strategy=None, screen=None):
+    """Extract text from a PDF file object.
+
+    `backend` forces a single backend by name; otherwise `strategy` (by
+    default PyPDF2 with a pdfminer fallback) picks per file. `screen` is an
+    optional predicate over the leading pages' text: when it returns True the
+    remaining pages are skipped and only that prefix is returned.
+    """
+    file.seek(0)
+    pdf_bytes = file.read()
+    if screen is not None:
+        prefix = extract_pdf_prefix(pdf_bytes)
+        if prefix is not None and screen(prefix):
+            return prefix
+    if backend is not None:
+        return BACKENDS[backend].extract(pdf_bytes)[0]
+    return (strategy or DEFAULT_STRATEGY).extract(pdf_bytes)
@@ -0,0 +1,147 @@
+"""Background re-analysis of every stored resume with the current analyzer.
+
+Walks resume_data in id order, a chunk at a time, re-running analyze_resume
+on the stored raw_text across a process pool, and writes each chunk's
+results together with the job checkpoint in one transaction. An
+interrupted run resumes after the last committed chunk; a run that reaches
+the end deletes the checkpoint, so the next run (after an analyzer or
+weights change) walks the whole corpus again.
+
+The job keeps out of the way of the web app: workers run at the lowest CPU
+priority, one core is left free when there are several, and after each
+chunk the job sleeps long enough to stay under `max_busy` of wall time.
+Only uploads analyzed after raw_text was stored can be re-analyzed; the
+rest are skipped.
+
+Run from the repository root: python -m utils.reanalysis [--restart]
+"""
+import argparse
+import os
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor
+from config.database import analysis_record, replace_analysis_data
+from config.job_roles import JOB_ROLES
+from utils.pdf_extraction import _available_cpus
+
+DEFAULT_JOB = 'reanalysis'
+
+_analyzer = None
+
+
+def _start_worker():
+    """Pool initializer: drop to the lowest priority and build one analyzer per process"""
+    global _analyzer
+    try:
+        os.nice(19)
+    except (AttributeError, OSError):
+        pass
+    from utils.resume_analyzer import ResumeAnalyzer
+    _analyzer = ResumeAnalyzer()
+
+
+def _reanalyze(row):
+    """(resume_id, analysis record or None) for one (id, raw_text, role, category) row"""
+    resume_id, raw_text, role, category = row
+    role_info = JOB_ROLES.get(category, {}).get(role)
+    if role_info is None:
+        return resume_id, None
+    try:
+        analysis = _analyzer.analyze_resume({'raw_text': raw_text}, role_info)
+    except Exception as e:
+        print(f"Error re-analyzing resume {resume_id}: {e}")
+        return resume_id, None
+    if analysis.get('document_type') != 'resume':
+        return resume_id, None
+    return resume_id, analysis_record(analysis, _analyzer.scoring_version)
+
+
+def _ensure_checkpoints(conn):
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS reanalysis_checkpoints (
+            job TEXT PRIMARY KEY,
+            last_id INTEGER NOT NULL,
+            processed INTEGER NOT NULL,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    conn.commit()
+
+
+def reanalyze_corpus(db_path='resumes.db', job=DEFAULT_JOB, restart=False, chunk_size=200,
+                     workers=None, max_busy=0.5):
+    """Re-analyze every stored resume with raw text, resuming from `job`'s
+    checkpoint unless `restart`. Returns (processed, updated) for this run."""
+    if not 0 < max_busy <= 1:
+        raise ValueError(f"max_busy must be in (0, 1], got {max_busy}")
+    if workers is None:
+        cpus = _available_cpus()
+        workers = max(1, cpus - 1)
+    conn = sqlite3.connect(db_path, timeout=30)
+    _ensure_checkpoints(conn)
+    if restart:
+        with conn:
+            conn.execute('DELETE FROM reanalysis_checkpoints WHERE job = ?', (job,))
+    checkpoint = conn.execute('SELECT last_id, processed FROM reanalysis_checkpoints WHERE job = ?',
+                              (job,)).fetchone()
+    last_id, total = checkpoint if checkpoint else (0, 0)
+    processed = updated = 0
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_start_worker) as pool:
+            while True:
+                rows = conn.execute('''
+                    SELECT id, raw_text, target_role, target_category FROM resume_data
+                    WHERE id > ? AND raw_text IS NOT NULL
+                    ORDER BY id LIMIT ?
+                ''', (last_id, chunk_size)).fetchall()
+                if not rows:
+                    # Finished: the next run starts over from the first resume
+                    with conn:
+                        conn.execute('DELETE FROM reanalysis_checkpoints WHERE job = ?', (job,))
+                    break
+                start = time.perf_counter()
+                results = list(pool.map(_reanalyze, rows, chunksize=max(1, len(rows) // (workers * 4))))
+                last_id = rows[-1][0]
+                with conn:
+                    cursor = conn.cursor()
+                    for resume_id, record in results:
+                        if record is not None:
+                            replace_analysis_data(cursor, resume_id, record)
+                            updated += 1
+                    processed += len(rows)
+                    cursor.execute('''
+                        INSERT INTO reanalysis_checkpoints (job, last_id, processed, updated_at)
+                        VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+                        ON CONFLICT (job) DO UPDATE SET
+                            last_id = excluded.last_id, processed = excluded.processed, updated_at = excluded.updated_at
+                    ''', (job, last_id, total + processed))
+                busy = time.perf_counter() - start
+                if max_busy < 1:
+                    time.sleep(busy * (1 - max_busy) / max_busy)
+    finally:
+        conn.close()
+    return processed, updated
+
+
+def _busy_fraction(value):
+    fraction = float(value)
+    if not 0 < fraction <= 1:
+        raise argparse.ArgumentTypeError(f"must be in (0, 1], got {value}")
+    return fraction
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Re-analyze stored resumes with the current analyzer.')
+    parser.add_argument('--db', default='resumes.db')
+    parser.add_argument('--job', default=DEFAULT_JOB, help='checkpoint name; separate jobs progress independently')
+    parser.add_argument('--restart', action='store_true', help='ignore the checkpoint and start from the first resume')
+    parser.add_argument('--chunk-size', type=int, default=200)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--max-busy', type=_busy_fraction, default=0.5,
+                        help='fraction of wall time spent working; the rest is spent sleeping')
+    args = parser.parse_args()
+    start = time.perf_counter()
+    processed, updated = reanalyze_corpus(args.db, args.job, args.restart, args.chunk_size, args.workers,
+                                          args.max_busy)
+    print(f"Re-analyzed {processed} resumes in {time.perf_counter() - start:.1f} s, {updated} analyses updated")
@@ -0,0 +1,68 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from config.resume_templates import resolve_template
+
+# resume_data fields the builder templates read; anything else (e.g.
+# skills_categories) does not change the rendered document
+RENDERED_FIELDS = ('personal_info', 'summary', 'experience', 'education', 'projects', 'skills')
+
+
+def render_key(resume_data):
+    """Hash of the canonicalized rendered fields plus the template rendered
+    with (unknown names fall back to the default), used as both the cache
+    key and the response ETag"""
+    canonical = json.dumps(
+        {field: resume_data.get(field) for field in RENDERED_FIELDS},
+        sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=str
+    )
+    digest = hashlib.sha256(resolve_template(resume_data.get('template')).encode('utf-8'))
+    digest.update(b'\0')
+    digest.update(canonical.encode('utf-8', 'surrogatepass'))
+    return digest.hexdigest()
+
+
+class RenderCache:
+    """LRU of rendered output (DOCX bytes, HTML fragments) by key, bounded by
+    the total len() of the stored values.
+
+    Values larger than the whole budget are never stored; otherwise the
+    least recently used entries are evicted until the new one fits.
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+            return data
+
+    def put(self, key, data):
+        if len(data) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size -= len(previous)
+            while self._entries and self.size + len(data) > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= len(evicted)
+            self._entries[key] = data
+            self.size += len(data)
+
+    def get_or_render(self, resume_data, render):
+        """(docx bytes, key) for resume_data, calling render(resume_data) for
+        a BytesIO only on a miss"""
+        key = render_key(resume_data)
+        data = self.get(key)
+        if data is None:
+            data = render(resume_data).getvalue()
+            self.put(key, data)
+        return data, key
@@ -0,0 +1,151 @@
+"""Compile declarative resume templates (config.resume_templates) into render
+plans, and render plans against builder data.
+
+Compiling resolves style roles to style names, turns every format string
+into a bound str.format_map and every block into a flat opcode tuple, so
+rendering a resume is one pass over tuples with no spec interpretation
+left. The result is a backend-neutral document: a list of paragraphs,
+each a ParagraphFormat plus (text, RunFormat) runs, that a writer turns
+into DOCX.
+"""
+from collections import namedtuple
+
+ParagraphFormat = namedtuple('ParagraphFormat', 'style indent space_after alignment')
+RunFormat = namedtuple('RunFormat', 'bold color')
+# paragraphs: [(ParagraphFormat, ((text, RunFormat), ...))]; style_indents:
+# {style name: left indent in inches} to apply to the paragraph styles
+RenderedResume = namedtuple('RenderedResume', 'paragraphs style_indents')
+
+PLAIN = RunFormat(False, None)
+BOLD = RunFormat(True, None)
+
+# Opcodes
+_SECTION, _PARAGRAPH, _ITEMS, _BULLETS, _SKILLS = range(5)
+_TEXT_RUN, _JOIN_RUN = range(2)
+
+
+def format_list_items(items):
+    """Entries of a newline-separated string or a list, stripped; blanks and
+    non-string list entries dropped"""
+    if isinstance(items, str):
+        return [item.strip() for item in items.split('\n') if item.strip()]
+    elif isinstance(items, list):
+        return [item.strip() for item in items if isinstance(item, str) and item.strip()]
+    return []
+
+
+class TemplatePlan:
+    """A compiled template: the styles and margins its base document needs,
+    and the opcodes that render builder data"""
+
+    def __init__(self, styles, margins, ops):
+        self.styles = styles
+        self.margins = margins
+        self.ops = ops
+
+    def render(self, data):
+        paragraphs = []
+        style_indents = {}
+        _run_ops(self.ops, data, paragraphs, style_indents)
+        return RenderedResume(paragraphs, style_indents)
+
+
+def _when(when):
+    return (when,) if isinstance(when, str) else tuple(when) if when else None
+
+
+def _compile_run(run):
+    run_format = RunFormat(run.get('bold', False), run.get('color'))
+    if 'join' in run:
+        return (_JOIN_RUN, run['join'], tuple((field, fmt.format_map) for field, fmt in run['parts']), run_format)
+    return (_TEXT_RUN, run['text'].format_map, run_format, run.get('when'), run.get('upper', False), False)
+
+
+def _compile_paragraph(block, style_names):
+    paragraph_format = ParagraphFormat(style_names[block['style']], block.get('indent'), block.get('space_after'),
+                                       block.get('alignment'))
+    if 'text' in block:
+        runs = ((_TEXT_RUN, block['text'].format_map, PLAIN, None, block.get('upper', False), True),)
+    else:
+        runs = tuple(_compile_run(run) for run in block['runs'])
+    return (_PARAGRAPH, _when(block.get('when')), paragraph_format, runs)
+
+
+def _compile_block(block, style_names):
+    if 'items' in block:
+        return (_ITEMS, block['items'], tuple(_compile_block(child, style_names) for child in block['blocks']))
+    if 'bullets' in block:
+        label = _compile_paragraph(block['label'], style_names) if block.get('label') else None
+        paragraph_format = ParagraphFormat(style_names[block['style']], block.get('indent'), None, None)
+        return (_BULLETS, block['bullets'], label, paragraph_format, block.get('indent_style'))
+    if 'skills' in block:
+        paragraph_format = ParagraphFormat(style_names[block['style']], block.get('indent'),
+                                           block.get('space_after'), None)
+        categories = tuple((category['key'], block['label'].format_map(category)) for category in block['skills'])
+        return (_SKILLS, categories, paragraph_format, block['separator'])
+    return _compile_paragraph(block, style_names)
+
+
+def compile_template(spec):
+    """TemplatePlan for one TEMPLATE_SPECS entry; raises KeyError on a
+    style role the spec does not define"""
+    style_names = {role: name for role, name, _ in spec['styles']}
+    ops = tuple(
+        (_SECTION, section.get('when'), section.get('scope'),
+         tuple(_compile_block(block, style_names) for block in section['blocks']))
+        for section in spec['sections']
+    )
+    return TemplatePlan([(name, properties) for _, name, properties in spec['styles']], spec.get('margins'), ops)
+
+
+def _run_ops(ops, scope, paragraphs, style_indents):
+    append = paragraphs.append
+    for op in ops:
+        code = op[0]
+        if code == _PARAGRAPH:
+            _, when, paragraph_format, runs = op
+            if when is None or any(scope.get(field) for field in when):
+                append((paragraph_format, _render_runs(runs, scope)))
+        elif code == _ITEMS:
+            for item in scope[op[1]]:
+                _run_ops(op[2], item, paragraphs, style_indents)
+        elif code == _BULLETS:
+            _, field, label, paragraph_format, indent_style = op
+            if scope.get(field):
+                if label is not None:
+                    append((label[2], _render_runs(label[3], scope)))
+                for entry in format_list_items(scope[field]):
+                    append((paragraph_format, (('• ' + entry, PLAIN),)))
+                    if indent_style is not None:
+                        style_indents[paragraph_format.style] = indent_style
+        elif code == _SKILLS:
+            _, categories, paragraph_format, separator = op
+            skills = scope['skills']
+            for key, label in categories:
+                if skills.get(key):
+                    append((paragraph_format, ((label, BOLD),
+                                               (separator.join(format_list_items(skills[key])), PLAIN))))
+        else:
+            _, when, scope_field, section_ops = op
+            if when is None or scope.get(when):
+                _run_ops(section_ops, scope[scope_field] if scope_field else scope, paragraphs, style_indents)
+
+
+def _render_runs(runs, scope):
+    rendered = []
+    for run in runs:
+        if run[0] == _TEXT_RUN:
+            _, format_text, run_format, when, upper, skip_empty = run
+            if when is not None and not scope.get(when):
+                continue
+            text = format_text(scope)
+            if upper:
+                text = text.upper()
+            if text or not skip_empty:
+                rendered.append((text, run_format))
+        else:
+            _, separator, parts, run_format = run
+            texts = [format_text(scope) for field, format_text in parts if scope.get(field)]
+            if texts:
+                rendered.append((separator.join(texts), run_format))
+    return tuple(rendered)
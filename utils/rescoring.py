@@ -0,0 +1,71 @@
+"""Recompute stored ATS scores after the weights in config.scoring change.
+
+Section scores are read from resume_analysis in id-ordered chunks into a
+NumPy array, every ATS score in the chunk is recomputed in one vectorized
+pass, and only rows whose score or scoring version changed are written
+back, one transaction per chunk. Analyses saved before section scores were
+stored cannot be recomputed and are left as they are.
+
+Run from the repository root: python -m utils.rescoring [version]
+"""
+import sqlite3
+import sys
+import time
+import numpy as np
+from config.database import SECTION_SCORE_COLUMNS
+from config.scoring import CURRENT_SCORING_VERSION, scoring_weights
+
+
+def ats_scores(section_scores, weights):
+    """ATS scores of an (n, sections) array, matching ResumeAnalyzer's formula:
+    each weighted section is rounded half-to-even, as round() does, then summed"""
+    return np.round(section_scores * np.asarray(weights)).astype(np.int64).sum(axis=1)
+
+
+def rescore_analyses(db_path='resumes.db', version=None, chunk_size=100000):
+    """Rescore every stored analysis with the weights of `version` (default:
+    current). Returns (rows rescored, rows changed, rows skipped)."""
+    version = CURRENT_SCORING_VERSION if version is None else version
+    weights = scoring_weights(version)
+    columns = list(SECTION_SCORE_COLUMNS.values())
+    not_null = ' AND '.join(f'{column} IS NOT NULL' for column in columns)
+
+    conn = sqlite3.connect(db_path)
+    try:
+        skipped = conn.execute(f'SELECT COUNT(*) FROM resume_analysis WHERE NOT ({not_null})').fetchone()[0]
+        rescored = changed = 0
+        last_id = 0
+        while True:
+            rows = conn.execute(f'''
+                SELECT id, ats_score, IFNULL(scoring_version, 0), {', '.join(columns)}
+                FROM resume_analysis
+                WHERE id > ? AND {not_null}
+                ORDER BY id LIMIT ?
+            ''', (last_id, chunk_size)).fetchall()
+            if not rows:
+                break
+            data = np.array(rows, dtype=np.float64)
+            ids = data[:, 0].astype(np.int64)
+            scores = ats_scores(data[:, 3:], weights)
+            stale = (scores != data[:, 1]) | (data[:, 2] != version)
+            with conn:
+                conn.executemany('UPDATE resume_analysis SET ats_score = ?, scoring_version = ? WHERE id = ?',
+                                 zip(scores[stale].tolist(), [version] * int(stale.sum()), ids[stale].tolist()))
+            rescored += len(rows)
+            changed += int(np.count_nonzero(scores[stale] != data[stale, 1]))
+            last_id = int(ids[-1])
+        return rescored, changed, skipped
+    finally:
+        conn.close()
+
+
+if __name__ == '__main__':
+    try:
+        version = int(sys.argv[1]) if len(sys.argv) > 1 else None
+        start = time.perf_counter()
+        rescored, changed, skipped = rescore_analyses(version=version)
+    except ValueError as e:
+        print(f"Error rescoring analyses: {e}")
+        sys.exit(2)
+    print(f"Rescored {rescored} analyses in {time.perf_counter() - start:.1f} s: {changed} scores changed, "
+          f"{skipped} without stored section scores skipped")
@@ -1,7 +1,50 @@
-import re
-import PyPDF2
-import io
-from docx import Document
+from config.job_roles import JOB_ROLES
+from config.scoring import CURRENT_SCORING_VERSION, SCORE_SECTIONS, scoring_weights
+from utils.analysis_pipeline import AnalysisPipeline
+from utils.analyzer_patterns import (
+    BULLET_MARKERS, CONTACT_RE, CONTACT_WORDS_RE, EMAIL_RE, GITHUB_RE, LINKEDIN_RE, PHONE_RE,
+    SECTION_KEYWORDS, SECTION_NAME_RE, SECTION_RES, SKILL_SEPARATOR_RE, SKILL_PART_SEPARATOR_RE, entry_features, keyword_pattern
+)
+from utils.docx_extraction import extract_docx_text
+from utils.pdf_extraction import extract_pdf_text
+from utils.resume_document import as_document
+from utils.role_similarity import RoleSimilarity
+from utils.skill_index import SKILL_INDEX
+
+# Type detection looks at this much leading text first, and trusts a non-resume
+# verdict from it when the margin over the runner-up type is at least this big.
+DOCUMENT_TYPE_SAMPLE_CHARS = 4096
+DOCUMENT_TYPE_CONFIDENCE = 0.5
+
+# Output field -> (pipeline stage, key within the stage result or None), in
+# the order analyze_resume returns them.
+ANALYSIS_FIELDS = {
+    'name': ('personal_info', 'name'),
+    'email': ('personal_info', 'email'),
+    'phone': ('personal_info', 'phone'),
+    'linkedin': ('personal_info', 'linkedin'),
+    'github': ('personal_info', 'github'),
+    'portfolio': ('personal_info', 'portfolio'),
+    'ats_score': ('ats_score', None),
+    'keyword_match': ('keyword_match', None),
+    'section_score': ('section_score', None),
+    'format_score': ('formatting', 0),
+    'education': ('education', None),
+    'experience': ('experience', None),
+    'projects': ('projects', None),
+    'skills': ('skills', None),
+    'summary': ('summary', None),
+    'suggestions': ('suggestions', None),
+    'contact_suggestions': ('contact_suggestions', None),
+    'summary_suggestions': ('summary_suggestions', None),
+    'skills_suggestions': ('skills_suggestions', None),
+    'experience_suggestions': ('experience_suggestions', None),
+    'education_suggestions': ('education_suggestions', None),
+    'format_suggestions': ('formatting', 1),
+    'format_features': ('format_features', None),
+    'section_scores': ('section_scores', None),
+    'role_similarity': ('role_similarity', None),
+}
 
 class ResumeAnalyzer:
     def __init__(self):
@@ -23,28 +66,67 @@ class ResumeAnalyzer:
                 'date of issue', 'identification'
             ]
         }
-        
-    def detect_document_type(self, text):
-        text = text.lower()
+        self.resume_keywords_re = keyword_pattern(tuple(self.document_types['resume']))
+        self.role_similarity = RoleSimilarity(JOB_ROLES)
+        self.scoring_version = CURRENT_SCORING_VERSION
+        self.scoring_weights = scoring_weights(self.scoring_version)
+        self.pipeline = self._build_pipeline()
+        
+    def classify_document(self, text):
+        """Return (document_type, confidence) for the given text.
+
+        Confidence is the relative margin of the best-scoring type over the
+        runner-up, so 1.0 means no other type matched at all.
+        """
+        doc = as_document(text)
         scores = {}
         for doc_type, keywords in self.document_types.items():
-            matches = sum(1 for keyword in keywords if keyword in text)
+            matches = sum(1 for keyword in keywords if keyword in doc.lower)
             density = matches / len(keywords)
-            frequency = matches / (len(text.split()) + 1) 
+            frequency = matches / (doc.word_count + 1)
             scores[doc_type] = (density * 0.7) + (frequency * 0.3)
-        best_match = max(scores.items(), key=lambda x: x[1])
-        return best_match[0] if best_match[1] > 0.15 else 'unknown'
+        ranked = sorted(scores.items(), key=lambda x: x[1], reverse=True)
+        best_type, best_score = ranked[0]
+        if best_score <= 0.15:
+            return 'unknown', 0.0
+        return best_type, (best_score - ranked[1][1]) / best_score
+
+    def is_clearly_not_resume(self, text):
+        """True when a text sample confidently classifies as another document type"""
+        doc_type, confidence = self.classify_document(text)
+        return doc_type not in ('resume', 'unknown') and confidence >= DOCUMENT_TYPE_CONFIDENCE
+
+    def detect_document_type(self, text, sample_chars=DOCUMENT_TYPE_SAMPLE_CHARS):
+        """Classify the document, deciding from a prefix sample when it is conclusive.
+
+        Only a confident non-resume verdict is taken from the sample; anything
+        else is re-checked against the full text.
+        """
+        doc = as_document(text)
+        if sample_chars and len(doc) > sample_chars:
+            doc_type, confidence = self.classify_document(doc.text[:sample_chars])
+            if doc_type not in ('resume', 'unknown') and confidence >= DOCUMENT_TYPE_CONFIDENCE:
+                return doc_type
+        return self.classify_document(doc)[0]
         
     def calculate_keyword_match(self, resume_text, required_skills):
-        resume_text = resume_text.lower()
+        """Match required skills by canonical skill ID, so aliases count ("JS"
+        for JavaScript) and whole words are required ("Java" is not found in
+        "JavaScript"); skills missing from SKILL_INDEX fall back to substrings"""
+        resume_lower = as_document(resume_text).lower
+        resume_skill_ids = None
         found_skills = []
         missing_skills = []
         
         for skill in required_skills:
-            skill_lower = skill.lower()
-            if skill_lower in resume_text:
-                found_skills.append(skill)
-            elif any(skill_lower in phrase for phrase in resume_text.split('.')):
+            skill_id = SKILL_INDEX.canonical_id(skill)
+            if skill_id is None:
+                found = skill.lower() in resume_lower
+            else:
+                if resume_skill_ids is None:
+                    resume_skill_ids = SKILL_INDEX.find_ids(resume_lower)
+                found = skill_id in resume_skill_ids
+            if found:
                 found_skills.append(skill)
             else:
                 missing_skills.append(skill)
@@ -58,7 +140,7 @@ class ResumeAnalyzer:
         }
         
     def check_resume_sections(self, text):
-        text = text.lower()
+        text = as_document(text).lower
         essential_sections = {
             'contact': ['email', 'phone', 'address', 'linkedin'],
             'education': ['education', 'university', 'college', 'degree', 'academic'],
@@ -73,74 +155,97 @@ class ResumeAnalyzer:
             
         return sum(section_scores.values())
         
-    def check_formatting(self, text):
-        lines = text.split('\n')
+    def scan_formatting(self, text):
+        """Collect every feature check_formatting scores in one pass over the lines.
+
+        Returns a dict with the text length, the indices of all-uppercase
+        (header) lines, the number of bulleted lines, the index of the first
+        line of each run of blank lines after the first blank, and the index
+        of the first line with contact details (None if there is none).
+        """
+        doc = as_document(text)
+        source = doc.text
+        header_lines = []
+        bullet_count = 0
+        extra_blank_lines = []
+        contact_line = None
+        previous_blank = False
+        for index, (start, end) in enumerate(zip(doc.line_starts, doc.line_ends)):
+            if start == end:
+                if previous_blank:
+                    extra_blank_lines.append(index)
+                previous_blank = True
+                continue
+            previous_blank = False
+            # Surrounding whitespace is uncased, so stripped lines give the same isupper()
+            line = source[start:end]
+            if line.isupper():
+                header_lines.append(index)
+            if line.startswith(BULLET_MARKERS):
+                bullet_count += 1
+            if contact_line is None and CONTACT_RE.search(line):
+                contact_line = index
+
+        return {
+            'length': len(doc),
+            'header_lines': header_lines,
+            'bullet_count': bullet_count,
+            'extra_blank_lines': extra_blank_lines,
+            'contact_line': contact_line,
+        }
+
+    def check_formatting(self, text, features=None):
+        """Score formatting out of 100; `features` is a scan_formatting result
+        to reuse instead of scanning `text` again"""
+        if features is None:
+            features = self.scan_formatting(text)
         score = 100
         deductions = []
-        if len(text) < 300:
+        if features['length'] < 300:
             score -= 30
             deductions.append("Resume is too short")
-        if not any(line.isupper() for line in lines):
+        if not features['header_lines']:
             score -= 20
             deductions.append("No clear section headers found")
-        if not any(line.strip().startswith(('•', '-', '*', '→')) for line in lines):
+        if not features['bullet_count']:
             score -= 20
             deductions.append("No bullet points found for listing details")
-        if any(len(line.strip()) == 0 and len(next_line.strip()) == 0 
-               for line, next_line in zip(lines[:-1], lines[1:])):
+        if features['extra_blank_lines']:
             score -= 15
             deductions.append("Inconsistent spacing between sections")
-        contact_patterns = [
-            r'\b[\w\.-]+@[\w\.-]+\.\w+\b',  
-            r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b', 
-            r'linkedin\.com/\w+',  
-        ]
-        if not any(re.search(pattern, text) for pattern in contact_patterns):
+        if features['contact_line'] is None:
             score -= 15
             deductions.append("Missing or improperly formatted contact information")
             
         return max(0, score), deductions
         
-    def extract_text_from_pdf(self, file):
+    def extract_text_from_pdf(self, file, screen_non_resumes=False):
+        """Extract PDF text; with screen_non_resumes, stop after the leading
+        pages when they are clearly not a resume and return only those"""
         try:
-            # Ensure the file pointer is at the beginning
-            file.seek(0)
-            pdf_reader = PyPDF2.PdfReader(file)
-            text = ""
-            for page in pdf_reader.pages:
-                extracted = page.extract_text()
-                if extracted:
-                    text += extracted + "\n"
-            return text
+            return extract_pdf_text(file, screen=self.is_clearly_not_resume if screen_non_resumes else None)
         except Exception as e:
             raise Exception(f"Error extracting text from PDF: {str(e)}")
             
-    def extract_text_from_docx(self, docx_file):
+    def extract_text_from_docx(self, docx_file, screen_non_resumes=False):
+        """Extract DOCX text; with screen_non_resumes, stop after the leading
+        text when it is clearly not a resume and return only that"""
         try:
-            doc = Document(docx_file)
-            full_text = []
-            for paragraph in doc.paragraphs:
-                if paragraph.text.strip():
-                    full_text.append(paragraph.text)
-            return '\n'.join(full_text)
+            return extract_docx_text(docx_file, screen=self.is_clearly_not_resume if screen_non_resumes else None)
         except Exception as e:
             raise Exception(f"Error extracting text from DOCX file: {str(e)}")
 
     def extract_personal_info(self, text):
-        email_pattern = r'[\w\.-]+@[\w\.-]+\.\w+'
-        phone_pattern = r'(\+\d{1,3}[-.]?)?\s*\(?\d{3}\)?[-.]?\s*\d{3}[-.]?\s*\d{4}'
-        linkedin_pattern = r'linkedin\.com/in/[\w-]+'
-        github_pattern = r'github\.com/[\w-]+'
-        email = re.search(email_pattern, text)
-        phone = re.search(phone_pattern, text)
-        linkedin = re.search(linkedin_pattern, text)
-        github = re.search(github_pattern, text)
+        doc = as_document(text)
+        email = EMAIL_RE.search(doc.text)
+        phone = PHONE_RE.search(doc.text)
+        linkedin = LINKEDIN_RE.search(doc.text)
+        github = GITHUB_RE.search(doc.text)
         # First non-empty line is likely the name
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
-        name = lines[0] if lines else 'Unknown'
+        name = next((line for line in doc.iter_stripped_lines() if line), 'Unknown')
         
         return {
-            'name': name if len(name) > 0 and not re.search(r'^(education|experience|skills|summary|objective)$', name.lower()) else 'Unknown',
+            'name': name if len(name) > 0 and not SECTION_NAME_RE.search(name.lower()) else 'Unknown',
             'email': email.group(0) if email else '',
             'phone': phone.group(0) if phone else '',
             'linkedin': linkedin.group(0) if linkedin else '',
@@ -148,276 +253,104 @@ class ResumeAnalyzer:
             'portfolio': ''
         }
 
-    def extract_education(self, text):
-        education = []
-        lines = text.split('\n')
-        education_keywords = [
-            'education', 'academic', 'qualification', 'degree', 'university', 'college',
-            'school', 'institute', 'certification', 'diploma', 'bachelor', 'master',
-            'phd', 'b.tech', 'm.tech', 'b.e', 'm.e', 'b.sc', 'm.sc','bca', 'mca', 'b.com',
-            'm.com', 'b.cs-it', 'imca', 'bba', 'mba', 'honors', 'scholarship'
-        ]
-        in_education_section = False
+    def _section_entries(self, doc, section):
+        """Collect the entries of the section(s) introduced by SECTION_KEYWORDS[section].
+
+        A line containing a section keyword opens the section (and is kept
+        unless it is exactly a keyword); a blank line closes the current
+        entry; a line with another resume keyword but no section keyword ends
+        the section. Entries are returned as space-joined strings.
+        """
+        exact_keywords = set(SECTION_KEYWORDS[section])
+        section_lines = doc.lines_matching(SECTION_RES[section])
+        resume_keyword_lines = doc.lines_matching(self.resume_keywords_re)
+        entries = []
+        in_section = False
         current_entry = []
 
-        for line in lines:
-            line = line.strip()
-            if any(keyword.lower() in line.lower() for keyword in education_keywords):
-                if not any(keyword.lower() == line.lower() for keyword in education_keywords):
-                    current_entry.append(line)
-                in_education_section = True
+        for index in range(doc.line_count):
+            if index in section_lines:
+                if doc.lower_line(index) not in exact_keywords:
+                    current_entry.append(doc.stripped_line(index))
+                in_section = True
                 continue
             
-            if in_education_section:
+            if in_section:
+                if doc.is_blank(index):
+                    if current_entry:
+                        entries.append(' '.join(current_entry))
+                        current_entry = []
                 # Check if we've hit another major section (e.g., Experience, Skills)
-                if line and any(keyword.lower() in line.lower() for keyword in self.document_types['resume']):
-                    if not any(edu_key.lower() in line.lower() for edu_key in education_keywords):
-                        in_education_section = False
-                        if current_entry:
-                            education.append(' '.join(current_entry))
-                            current_entry = []
-                        continue
-                
-                if line:
-                    current_entry.append(line)
-                elif current_entry:
-                    education.append(' '.join(current_entry))
-                    current_entry = []
+                elif index in resume_keyword_lines:
+                    in_section = False
+                    if current_entry:
+                        entries.append(' '.join(current_entry))
+                        current_entry = []
+                else:
+                    current_entry.append(doc.stripped_line(index))
         
         if current_entry:
-            education.append(' '.join(current_entry))
+            entries.append(' '.join(current_entry))
         
-        return [edu for edu in education if edu]
+        return entries
 
-    def extract_experience(self, text):
-        experience = []
-        lines = text.split('\n')
-        experience_keywords = [
-            'experience', 'employment', 'work history', 'professional experience',
-            'work experience', 'career history', 'professional background',
-            'employment history', 'job history', 'positions held',
-            'job title', 'job responsibilities', 'job description', 'job summary'
-        ]
-        in_experience_section = False
-        current_entry = []
+    def extract_education(self, text):
+        return [edu for edu in self._section_entries(as_document(text), 'education') if edu]
 
-        for line in lines:
-            line = line.strip()
-            if any(keyword.lower() in line.lower() for keyword in experience_keywords):
-                if not any(keyword.lower() == line.lower() for keyword in experience_keywords):
-                    current_entry.append(line)
-                in_experience_section = True
-                continue
-            
-            if in_experience_section:
-                if line and any(keyword.lower() in line.lower() for keyword in self.document_types['resume']):
-                    if not any(exp_key.lower() in line.lower() for exp_key in experience_keywords):
-                        in_experience_section = False
-                        if current_entry:
-                            experience.append(' '.join(current_entry))
-                            current_entry = []
-                        continue
-                
-                if line:
-                    current_entry.append(line)
-                elif current_entry:
-                    experience.append(' '.join(current_entry))
-                    current_entry = []
-        
-        if current_entry:
-            experience.append(' '.join(current_entry))
-        
-        return [exp for exp in experience if exp]
+    def extract_experience(self, text):
+        return [exp for exp in self._section_entries(as_document(text), 'experience') if exp]
 
     def extract_projects(self, text):
-        projects = []
-        lines = text.split('\n')
-        project_keywords = [
-            'projects', 'personal projects', 'academic projects', 'key projects',
-            'major projects', 'professional projects', 'project experience',
-            'relevant projects', 'featured projects','latest projects',
-            'top projects'
-        ]
-        in_project_section = False
-        current_entry = []
-
-        for line in lines:
-            line = line.strip()
-            if any(keyword.lower() in line.lower() for keyword in project_keywords):
-                if not any(keyword.lower() == line.lower() for keyword in project_keywords):
-                    current_entry.append(line)
-                in_project_section = True
-                continue
-            
-            if in_project_section:
-                if line and any(keyword.lower() in line.lower() for keyword in self.document_types['resume']):
-                    if not any(proj_key.lower() in line.lower() for proj_key in project_keywords):
-                        in_project_section = False
-                        if current_entry:
-                            projects.append(' '.join(current_entry))
-                            current_entry = []
-                        continue
-                
-                if line:
-                    current_entry.append(line)
-                elif current_entry:
-                    projects.append(' '.join(current_entry))
-                    current_entry = []
-        
-        if current_entry:
-            projects.append(' '.join(current_entry))
-        
-        return [proj for proj in projects if proj]
+        return [proj for proj in self._section_entries(as_document(text), 'projects') if proj]
 
     def extract_skills(self, text):
+        """Skills listed in the skills section(s), normalized to their
+        canonical names where SKILL_INDEX knows them"""
         skills = set()
-        lines = text.split('\n')
-        skills_keywords = [
-            'skills', 'technical skills', 'competencies', 'expertise',
-            'core competencies', 'professional skills', 'key skills',
-            'technical expertise', 'proficiencies', 'qualifications',
-            'top skills', 'key skill', 'major skill', 'personal skill',
-            'soft skills', 'soft skill', 'soft skillset'
-        ]
-        in_skills_section = False
-        current_entry = []
-
-        separators = [',', '•', '|', '/', '\\', '·', '>', '-', '–', '―']
-
-        for line in lines:
-            line = line.strip()
-            if any(keyword.lower() in line.lower() for keyword in skills_keywords):
-                if not any(keyword.lower() == line.lower() for keyword in skills_keywords):
-                    current_entry.append(line)
-                in_skills_section = True
-                continue
-            
-            if in_skills_section:
-                if line and any(keyword.lower() in line.lower() for keyword in self.document_types['resume']):
-                    if not any(skill_key.lower() in line.lower() for skill_key in skills_keywords):
-                        in_skills_section = False
-                        if current_entry:
-                            text_to_process = ' '.join(current_entry)
-                            for separator in separators:
-                                if separator in text_to_process:
-                                    skills.update(skill.strip() for skill in text_to_process.split(separator) if skill.strip())
-                            current_entry = []
-                        continue
-                
-                if line:
-                    current_entry.append(line)
-                elif current_entry:
-                    text_to_process = ' '.join(current_entry)
-                    for separator in separators:
-                        if separator in text_to_process:
-                            skills.update(skill.strip() for skill in text_to_process.split(separator) if skill.strip())
-                    current_entry = []
-        
-        if current_entry:
-            text_to_process = ' '.join(current_entry)
-            for separator in separators:
-                if separator in text_to_process:
-                    skills.update(skill.strip() for skill in text_to_process.split(separator) if skill.strip())
+        for text_to_process in self._section_entries(as_document(text), 'skills'):
+            if SKILL_SEPARATOR_RE.search(text_to_process) or SKILL_PART_SEPARATOR_RE.search(text_to_process):
+                for entry in SKILL_SEPARATOR_RE.split(text_to_process):
+                    skills.update(self._split_skill_entry(entry))
         
         return list(skills)
 
+    @staticmethod
+    def _split_skill_entry(entry):
+        """Canonical skills in one list entry. "CI/CD" or "PL/SQL" stay whole;
+        "Python/Django" splits because each part is a known skill and the
+        whole is not."""
+        entry = entry.strip()
+        if not entry:
+            return []
+        if SKILL_INDEX.canonical_id(entry) is None:
+            parts = [part.strip() for part in SKILL_PART_SEPARATOR_RE.split(entry) if part.strip()]
+            if len(parts) > 1 and all(SKILL_INDEX.canonical_id(part) is not None for part in parts):
+                return [SKILL_INDEX.canonical_name(part) for part in parts]
+        return [SKILL_INDEX.canonical_name(entry)]
+
     def extract_summary(self, text):
+        doc = as_document(text)
         summary = []
-        lines = text.split('\n')
-        summary_keywords = [
-            'summary', 'professional summary', 'career summary', 'objective',
-            'career objective', 'professional objective', 'about me', 'profile',
-            'professional profile', 'career profile', 'overview', 'skill summary'
-        ]
-        in_summary_section = False
-        current_entry = []
 
         # Check the first few non-empty lines for a potential summary
-        start_index = 0
-        while start_index < min(10, len(lines)) and not lines[start_index].strip():
-            start_index += 1
-
         first_lines = []
-        lines_checked = 0
-        for line in lines[start_index:]:
-            if line.strip():
-                first_lines.append(line.strip())
-                lines_checked += 1
-                if lines_checked >= 5:
+        for line in doc.iter_stripped_lines():
+            if line:
+                first_lines.append(line)
+                if len(first_lines) >= 5:
                     break
 
-        if first_lines and not any(keyword in first_lines[0].lower() for keyword in summary_keywords):
+        if first_lines and not SECTION_RES['summary'].search(first_lines[0].lower()):
             potential_summary = ' '.join(first_lines)
             if len(potential_summary.split()) > 10:
-                if not re.search(r'\b(?:email|phone|address|tel|mobile|linkedin)\b', potential_summary.lower()):
+                if not CONTACT_WORDS_RE.search(potential_summary.lower()):
                     summary.append(potential_summary)
 
-        for line in lines:
-            line = line.strip()
-            if any(keyword.lower() in line.lower() for keyword in summary_keywords):
-                if not any(keyword.lower() == line.lower() for keyword in summary_keywords):
-                    current_entry.append(line)
-                in_summary_section = True
-                continue
-            
-            if in_summary_section:
-                if line and any(keyword.lower() in line.lower() for keyword in self.document_types['resume']):
-                    if not any(sum_key.lower() in line.lower() for sum_key in summary_keywords):
-                        in_summary_section = False
-                        if current_entry:
-                            summary.append(' '.join(current_entry))
-                            current_entry = []
-                        continue
-                
-                if line:
-                    current_entry.append(line)
-                elif current_entry:
-                    summary.append(' '.join(current_entry))
-                    current_entry = []
-        
-        if current_entry:
-            summary.append(' '.join(current_entry))
+        summary.extend(self._section_entries(doc, 'summary'))
         
         return ' '.join(summary) if summary else ''
 
-    def analyze_resume(self, resume_data, job_requirements):
-        text = resume_data.get('raw_text', '')
-        if not text:
-            return {
-                'ats_score': 0,
-                'document_type': 'unknown',
-                'keyword_match': {'score': 0, 'found_skills': [], 'missing_skills': []},
-                'section_score': 0,
-                'format_score': 0,
-                'suggestions': ["No text provided for analysis. Please upload a valid resume."]
-            }
-            
-        personal_info = self.extract_personal_info(text)
-        
-        doc_type = self.detect_document_type(text)
-        if doc_type != 'resume':
-            return {
-                'ats_score': 0,
-                'document_type': doc_type,
-                'keyword_match': {'score': 0, 'found_skills': [], 'missing_skills': []},
-                'section_score': 0,
-                'format_score': 0,
-                'suggestions': [f"This appears to be a {doc_type} document. Please upload a resume for ATS analysis."]
-            }
-            
-        required_skills = job_requirements.get('required_skills', [])
-        keyword_match = self.calculate_keyword_match(text, required_skills)
-        
-        education = self.extract_education(text)
-        experience = self.extract_experience(text)
-        projects = self.extract_projects(text)
-        skills = self.extract_skills(text)
-        summary = self.extract_summary(text)
-        
-        section_score = self.check_resume_sections(text)
-        
-        format_score, format_deductions = self.check_formatting(text)
-        
+    def _stage_contact_suggestions(self, session, personal_info):
         contact_suggestions = []
         if not personal_info.get('email'):
             contact_suggestions.append("Add your email address")
@@ -425,7 +358,9 @@ class ResumeAnalyzer:
             contact_suggestions.append("Add your phone number")
         if not personal_info.get('linkedin'):
             contact_suggestions.append("Add your LinkedIn profile URL")
-        
+        return contact_suggestions
+
+    def _stage_summary_suggestions(self, session, summary):
         summary_suggestions = []
         if not summary:
             summary_suggestions.append("Add a professional summary to highlight your key qualifications")
@@ -433,7 +368,9 @@ class ResumeAnalyzer:
             summary_suggestions.append("Expand your professional summary to better highlight your experience and goals")
         elif len(summary.split()) > 100:
             summary_suggestions.append("Consider making your summary more concise (aim for 50-75 words)")
-        
+        return summary_suggestions
+
+    def _stage_skills_suggestions(self, session, skills, keyword_match):
         skills_suggestions = []
         if not skills:
             skills_suggestions.append("Add a dedicated skills section")
@@ -441,93 +378,154 @@ class ResumeAnalyzer:
             skills_suggestions.append("List more relevant technical and soft skills")
         if keyword_match['score'] < 70:
             skills_suggestions.append("Add more skills that match the job requirements")
-        
+        return skills_suggestions
+
+    def _stage_experience_suggestions(self, session, experience):
         experience_suggestions = []
         if not experience:
             experience_suggestions.append("Add your work experience section")
         else:
-            has_dates = any(re.search(r'\b(19|20)\d{2}\b', exp) for exp in experience)
-            has_bullets = any(re.search(r'[•\-\*]', exp) for exp in experience)
-            has_action_verbs = any(re.search(r'\b(developed|managed|created|implemented|designed|led|improved)\b', 
-                                           exp.lower()) for exp in experience)
+            features = entry_features(experience, {'date', 'bullet', 'action_verb'})
             
-            if not has_dates:
+            if 'date' not in features:
                 experience_suggestions.append("Include dates for each work experience")
-            if not has_bullets:
+            if 'bullet' not in features:
                 experience_suggestions.append("Use bullet points to list your achievements and responsibilities")
-            if not has_action_verbs:
+            if 'action_verb' not in features:
                 experience_suggestions.append("Start bullet points with strong action verbs")
-        
+        return experience_suggestions
+
+    def _stage_education_suggestions(self, session, education):
         education_suggestions = []
         if not education:
             education_suggestions.append("Add your educational background")
         else:
-            has_dates = any(re.search(r'\b(19|20)\d{2}\b', edu) for edu in education)
-            has_degree = any(re.search(r'\b(bachelor|master|phd|b\.|m\.|diploma)\b', 
-                                     edu.lower()) for edu in education)
-            has_gpa = any(re.search(r'\b(gpa|cgpa|grade|percentage)\b', 
-                                  edu.lower()) for edu in education)
+            features = entry_features(education, {'date', 'degree', 'gpa'})
             
-            if not has_dates:
+            if 'date' not in features:
                 education_suggestions.append("Include graduation dates")
-            if not has_degree:
+            if 'degree' not in features:
                 education_suggestions.append("Specify your degree type")
-            if not has_gpa and job_requirements.get('require_gpa', False):
+            if 'gpa' not in features and session.job_requirements.get('require_gpa', False):
                 education_suggestions.append("Include your GPA if it's above 3.0")
-        
-        format_suggestions = format_deductions
-        
-        contact_score = 100 - (len(contact_suggestions) * 25)
-        summary_score = 100 - (len(summary_suggestions) * 33)
-        skills_score = keyword_match['score']
-        experience_score = 100 - (len(experience_suggestions) * 25)
-        education_score = 100 - (len(education_suggestions) * 25)
-        
-        ats_score = (
-            int(round(contact_score * 0.1)) +
-            int(round(summary_score * 0.1)) +
-            int(round(skills_score * 0.3)) +
-            int(round(experience_score * 0.2)) +
-            int(round(education_score * 0.1)) +
-            int(round(format_score * 0.2))
-        )
-        
+        return education_suggestions
+
+    def _stage_section_scores(self, session, contact_suggestions, summary_suggestions, keyword_match,
+                              experience_suggestions, education_suggestions, formatting):
+        return {
+            'contact': 100 - (len(contact_suggestions) * 25),
+            'summary': 100 - (len(summary_suggestions) * 33),
+            'skills': keyword_match['score'],
+            'experience': 100 - (len(experience_suggestions) * 25),
+            'education': 100 - (len(education_suggestions) * 25),
+            'format': formatting[0]
+        }
+
+    def _stage_ats_score(self, session, section_scores):
+        # utils.rescoring applies the same formula to stored section scores
+        return sum(int(round(section_scores[section] * weight))
+                   for section, weight in zip(SCORE_SECTIONS, self.scoring_weights))
+
+    def _stage_suggestions(self, session, contact_suggestions, summary_suggestions, skills_suggestions,
+                           experience_suggestions, education_suggestions, formatting):
         suggestions = []
         suggestions.extend(contact_suggestions)
         suggestions.extend(summary_suggestions)
         suggestions.extend(skills_suggestions)
         suggestions.extend(experience_suggestions)
         suggestions.extend(education_suggestions)
-        suggestions.extend(format_suggestions)
+        suggestions.extend(formatting[1])
         
         if not suggestions:
             suggestions.append("Your resume is well-optimized for ATS systems")
-        
-        return {
-            **personal_info,
-            'ats_score': ats_score,
-            'document_type': 'resume',
-            'keyword_match': keyword_match,
-            'section_score': section_score,
-            'format_score': format_score,
-            'education': education,
-            'experience': experience,
-            'projects': projects,
-            'skills': skills,
-            'summary': summary,
-            'suggestions': suggestions,
-            'contact_suggestions': contact_suggestions,
-            'summary_suggestions': summary_suggestions,
-            'skills_suggestions': skills_suggestions,
-            'experience_suggestions': experience_suggestions,
-            'education_suggestions': education_suggestions,
-            'format_suggestions': format_suggestions,
-            'section_scores': {
-                'contact': contact_score,
-                'summary': summary_score,
-                'skills': skills_score,
-                'experience': experience_score,
-                'education': education_score,
-                'format': format_score
-            }
-        }
\ No newline at end of file
+        return suggestions
+
+    def _build_pipeline(self):
+        """Stage name -> (dependencies, function); see AnalysisPipeline"""
+        return AnalysisPipeline({
+            'document_type': ((), lambda s: self.detect_document_type(s.document)),
+            'personal_info': ((), lambda s: self.extract_personal_info(s.document)),
+            'keyword_match': ((), lambda s: self.calculate_keyword_match(
+                s.document, s.job_requirements.get('required_skills', []))),
+            'education': ((), lambda s: self.extract_education(s.document)),
+            'experience': ((), lambda s: self.extract_experience(s.document)),
+            'projects': ((), lambda s: self.extract_projects(s.document)),
+            'skills': ((), lambda s: self.extract_skills(s.document)),
+            'summary': ((), lambda s: self.extract_summary(s.document)),
+            'section_score': ((), lambda s: self.check_resume_sections(s.document)),
+            'format_features': ((), lambda s: self.scan_formatting(s.document)),
+            'role_similarity': ((), lambda s: self.role_similarity.rank(s.document.lower)),
+            'formatting': (('format_features',), lambda s, features: self.check_formatting(s.document, features)),
+            'contact_suggestions': (('personal_info',), self._stage_contact_suggestions),
+            'summary_suggestions': (('summary',), self._stage_summary_suggestions),
+            'skills_suggestions': (('skills', 'keyword_match'), self._stage_skills_suggestions),
+            'experience_suggestions': (('experience',), self._stage_experience_suggestions),
+            'education_suggestions': (('education',), self._stage_education_suggestions),
+            'section_scores': (('contact_suggestions', 'summary_suggestions', 'keyword_match',
+                                'experience_suggestions', 'education_suggestions', 'formatting'),
+                               self._stage_section_scores),
+            'ats_score': (('section_scores',), self._stage_ats_score),
+            'suggestions': (('contact_suggestions', 'summary_suggestions', 'skills_suggestions',
+                             'experience_suggestions', 'education_suggestions', 'formatting'),
+                            self._stage_suggestions),
+        })
+
+    def analyze_resume(self, resume_data, job_requirements, fields=None):
+        """Analyze resume text against a role's requirements.
+
+        With `fields` (an iterable of ANALYSIS_FIELDS names) only the stages
+        those fields depend on are run, and the result holds just those
+        fields plus `document_type`. Stage results are cached per upload, so
+        asking for more fields later reuses the work already done.
+        """
+        if fields is not None:
+            fields = list(dict.fromkeys(fields))
+            unknown = [field for field in fields if field not in ANALYSIS_FIELDS]
+            if unknown:
+                raise ValueError(f"Unknown analysis fields: {', '.join(unknown)}. "
+                                 f"Available fields: {', '.join(ANALYSIS_FIELDS)}")
+
+        text = resume_data.get('raw_text', '')
+        if not text:
+            return self._select_fields({
+                'ats_score': 0,
+                'document_type': 'unknown',
+                'keyword_match': {'score': 0, 'found_skills': [], 'missing_skills': []},
+                'section_score': 0,
+                'format_score': 0,
+                'suggestions': ["No text provided for analysis. Please upload a valid resume."]
+            }, fields)
+
+        session = self.pipeline.session_for(text, job_requirements)
+        doc_type = self.pipeline.run(session, 'document_type')
+        if doc_type != 'resume':
+            return self._select_fields({
+                'ats_score': 0,
+                'document_type': doc_type,
+                'keyword_match': {'score': 0, 'found_skills': [], 'missing_skills': []},
+                'section_score': 0,
+                'format_score': 0,
+                'suggestions': [f"This appears to be a {doc_type} document. Please upload a resume for ATS analysis."]
+            }, fields)
+
+        if fields is None:
+            personal_info = self.pipeline.run(session, 'personal_info')
+            result = {**personal_info, 'document_type': 'resume'}
+            for field, (stage, key) in ANALYSIS_FIELDS.items():
+                if stage != 'personal_info':
+                    value = self.pipeline.run(session, stage)
+                    result[field] = value if key is None else value[key]
+            return result
+
+        result = {'document_type': 'resume'}
+        for field in fields:
+            stage, key = ANALYSIS_FIELDS[field]
+            value = self.pipeline.run(session, stage)
+            result[field] = value if key is None else value[key]
+        return result
+
+    @staticmethod
+    def _select_fields(result, fields):
+        if fields is None:
+            return result
+        return {field: result[field] for field in ['document_type', *fields] if field in result}
@@ -0,0 +1,99 @@
+import re
+from array import array
+from bisect import bisect_right
+
+_WORD_RE = re.compile(r'\S+')
+
+
+def _line_spans(text):
+    """Return (line_offsets, starts, ends) for `text.split('\n')` numbering.
+
+    `line_offsets[i]` is where line i begins (with a final entry one past the
+    end), and `starts[i]:ends[i]` is the span of that line after `strip()`.
+    Lines are visited one at a time so no list of line strings is built.
+    """
+    offsets = array('L')
+    starts = array('L')
+    ends = array('L')
+    position = 0
+    while True:
+        newline = text.find('\n', position)
+        end = len(text) if newline == -1 else newline
+        line = text[position:end]
+        stripped_left = line.lstrip()
+        offsets.append(position)
+        if stripped_left:
+            starts.append(end - len(stripped_left))
+            ends.append(position + len(line.rstrip()))
+        else:
+            starts.append(position)
+            ends.append(position)
+        if newline == -1:
+            break
+        position = newline + 1
+    offsets.append(len(text) + 1)
+    return offsets, starts, ends
+
+
+class ResumeDocument:
+    """Text views shared by every analyzer stage, derived once per document.
+
+    Holds the text, its lowercased copy, the word count and integer arrays
+    describing each line (numbered as `text.split('\n')` would); per-line
+    strings are only sliced out when a stage asks for them.
+    """
+    __slots__ = ('text', 'lower', 'word_count', 'line_offsets', 'line_starts', 'line_ends',
+                 'lower_offsets', 'lower_starts', 'lower_ends')
+
+    def __init__(self, text):
+        self.text = text
+        self.lower = text.lower()
+        self.word_count = sum(1 for _ in _WORD_RE.finditer(text))
+        self.line_offsets, self.line_starts, self.line_ends = _line_spans(text)
+        if len(self.lower) == len(text):
+            self.lower_offsets, self.lower_starts, self.lower_ends = (
+                self.line_offsets, self.line_starts, self.line_ends)
+        else:
+            # A few characters lowercase to more than one code point
+            self.lower_offsets, self.lower_starts, self.lower_ends = _line_spans(self.lower)
+
+    def __len__(self):
+        return len(self.text)
+
+    @property
+    def line_count(self):
+        return len(self.line_starts)
+
+    def line(self, index):
+        """Raw line `index`, without its trailing newline"""
+        return self.text[self.line_offsets[index]:self.line_offsets[index + 1] - 1]
+
+    def stripped_line(self, index):
+        return self.text[self.line_starts[index]:self.line_ends[index]]
+
+    def lower_line(self, index):
+        return self.lower[self.lower_starts[index]:self.lower_ends[index]]
+
+    def is_blank(self, index):
+        return self.line_starts[index] == self.line_ends[index]
+
+    def lines_matching(self, pattern):
+        """Indices of lines whose lowercased text matches `pattern`, found in
+        one pass over the lowercased document (patterns must not span lines)"""
+        offsets = self.lower_offsets
+        return {bisect_right(offsets, match.start()) - 1 for match in pattern.finditer(self.lower)}
+
+    def iter_stripped_lines(self):
+        text = self.text
+        for start, end in zip(self.line_starts, self.line_ends):
+            yield text[start:end]
+
+    def iter_lower_lines(self):
+        lower = self.lower
+        for start, end in zip(self.lower_starts, self.lower_ends):
+            yield lower[start:end]
+
+
+def as_document(text):
+    """Return `text` as a ResumeDocument, reusing it if it already is one"""
+    return text if isinstance(text, ResumeDocument) else ResumeDocument(text)
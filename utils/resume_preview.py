@@ -0,0 +1,195 @@
+"""Section-by-section HTML preview of builder form data.
+
+Each section (header, summary, experience, projects, education, skills) is
+rendered to its own small HTML fragment and cached under a hash of the
+template, section name and section content. While the user types only the
+section being edited changes hash, so a preview request re-renders just that
+section and serves the rest from the cache.
+
+A section whose data has the wrong shape (say, a list where the skills
+object belongs) renders as an error fragment for that section alone.
+"""
+import hashlib
+import json
+from html import escape
+from utils.render_cache import RenderCache
+from utils.render_plan import format_list_items
+
+SECTION_ORDER = ('header', 'summary', 'experience', 'projects', 'education', 'skills')
+
+SKILL_CATEGORIES = (
+    ('technical', 'Technical Skills'),
+    ('soft', 'Soft Skills'),
+    ('languages', 'Languages'),
+    ('tools', 'Tools & Technologies'),
+)
+
+
+# What each section's content must be when it is not empty
+SECTION_SHAPES = {
+    'header': (dict, 'an object'),
+    'summary': (str, 'a string'),
+    'experience': (list, 'a list of objects'),
+    'projects': (list, 'a list of objects'),
+    'education': (list, 'a list of objects'),
+    'skills': (dict, 'an object'),
+}
+
+
+def section_error(section, content):
+    """Why `content` cannot be rendered as `section`, or None if it can"""
+    if not content:
+        return None
+    expected, description = SECTION_SHAPES[section]
+    valid = isinstance(content, expected)
+    if valid and expected is list:
+        valid = all(isinstance(entry, dict) for entry in content)
+    return None if valid else f'{section} must be {description}'
+
+
+def _bullets(items, css_class):
+    items = format_list_items(items)
+    if not items:
+        return ''
+    return f'<ul class="{css_class}">' + ''.join(f'<li>{escape(item)}</li>' for item in items) + '</ul>'
+
+
+def _text(value):
+    return escape(str(value)) if value else ''
+
+
+def _render_header(personal_info):
+    name = _text(personal_info.get('full_name'))
+    if not name:
+        return ''
+    parts = [f'<h1 class="resume-name">{name}</h1>']
+    if personal_info.get('title'):
+        parts.append(f'<p class="resume-title">{_text(personal_info["title"])}</p>')
+    contact = [_text(personal_info.get(field)) for field in ('email', 'phone', 'location') if personal_info.get(field)]
+    if contact:
+        parts.append(f'<p class="resume-contact">{" | ".join(contact)}</p>')
+    links = [f'{label}: {_text(personal_info.get(field))}'
+             for field, label in (('linkedin', 'LinkedIn'), ('portfolio', 'Portfolio')) if personal_info.get(field)]
+    if links:
+        parts.append(f'<p class="resume-links">{" | ".join(links)}</p>')
+    return ''.join(parts)
+
+
+def _render_summary(summary):
+    if not summary:
+        return ''
+    return f'<h2>Professional Summary</h2><p>{_text(summary)}</p>'
+
+
+def _render_experience(experience):
+    entries = []
+    for exp in experience or []:
+        entries.append(
+            '<div class="resume-entry">'
+            f'<h3>{_text(exp.get("position"))} at {_text(exp.get("company"))}</h3>'
+            f'<p class="resume-dates">{_text(exp.get("start_date"))} - {_text(exp.get("end_date"))}</p>'
+            + (f'<p>{_text(exp["description"])}</p>' if exp.get('description') else '')
+            + _bullets(exp.get('responsibilities'), 'resume-responsibilities')
+            + _bullets(exp.get('achievements'), 'resume-achievements')
+            + '</div>'
+        )
+    return '<h2>Experience</h2>' + ''.join(entries) if entries else ''
+
+
+def _render_projects(projects):
+    entries = []
+    for proj in projects or []:
+        entries.append(
+            '<div class="resume-entry">'
+            f'<h3>{_text(proj.get("name"))}</h3>'
+            + (f'<p class="resume-technologies">{_text(proj["technologies"])}</p>' if proj.get('technologies') else '')
+            + (f'<p>{_text(proj["description"])}</p>' if proj.get('description') else '')
+            + _bullets(proj.get('responsibilities'), 'resume-responsibilities')
+            + _bullets(proj.get('achievements'), 'resume-achievements')
+            + (f'<p class="resume-link">{_text(proj["link"])}</p>' if proj.get('link') else '')
+            + '</div>'
+        )
+    return '<h2>Projects</h2>' + ''.join(entries) if entries else ''
+
+
+def _render_education(education):
+    entries = []
+    for edu in education or []:
+        details = f'Graduation: {_text(edu.get("graduation_date"))}'
+        if edu.get('gpa'):
+            details += f' | GPA: {_text(edu["gpa"])}'
+        entries.append(
+            '<div class="resume-entry">'
+            f'<h3>{_text(edu.get("school"))}</h3>'
+            f'<p>{_text(edu.get("degree"))} in {_text(edu.get("field"))}</p>'
+            f'<p class="resume-dates">{details}</p>'
+            + _bullets(edu.get('achievements'), 'resume-achievements')
+            + '</div>'
+        )
+    return '<h2>Education</h2>' + ''.join(entries) if entries else ''
+
+
+def _render_skills(skills):
+    rows = []
+    for category, title in SKILL_CATEGORIES:
+        items = format_list_items((skills or {}).get(category))
+        if items:
+            rows.append(f'<p><strong>{escape(title)}:</strong> {" • ".join(escape(item) for item in items)}</p>')
+    return '<h2>Skills</h2>' + ''.join(rows) if rows else ''
+
+
+SECTION_RENDERERS = {
+    'header': _render_header,
+    'summary': _render_summary,
+    'experience': _render_experience,
+    'projects': _render_projects,
+    'education': _render_education,
+    'skills': _render_skills,
+}
+
+
+def section_content(form_data, section):
+    """The part of builder form data a section is rendered from"""
+    if section == 'header':
+        return form_data.get('personal_info') or {}
+    if section == 'skills':
+        return form_data.get('skills_categories') or form_data.get('skills') or {}
+    return form_data.get(section)
+
+
+def section_key(template, section, content):
+    canonical = json.dumps(content, sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=str)
+    digest = hashlib.sha1(f'{template.lower()}\0{section}\0'.encode('utf-8'))
+    digest.update(canonical.encode('utf-8', 'surrogatepass'))
+    return digest.hexdigest()
+
+
+class SectionPreview:
+    """Renders builder form data section by section, caching each fragment
+    by section_key"""
+
+    def __init__(self, max_bytes=8 * 1024 * 1024):
+        self.cache = RenderCache(max_bytes=max_bytes)
+
+    def render(self, form_data, template):
+        """[{'name', 'hash', 'html'}] in SECTION_ORDER; 'html' is '' for an
+        empty section. A malformed section also has 'error', and its 'html'
+        is an error fragment."""
+        template_class = escape(template.lower())
+        sections = []
+        for section in SECTION_ORDER:
+            content = section_content(form_data, section)
+            key = section_key(template, section, content)
+            error = section_error(section, content)
+            if error is not None:
+                html = (f'<section class="resume-{section} template-{template_class} preview-error">'
+                        f'<p class="preview-error">{escape(error)}</p></section>')
+                sections.append({'name': section, 'hash': key, 'html': html, 'error': error})
+                continue
+            html = self.cache.get(key)
+            if html is None:
+                body = SECTION_RENDERERS[section](content)
+                html = f'<section class="resume-{section} template-{template_class}">{body}</section>' if body else ''
+                self.cache.put(key, html)
+            sections.append({'name': section, 'hash': key, 'html': html})
+        return sections
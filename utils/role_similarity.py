@@ -0,0 +1,53 @@
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+from utils.skill_index import SKILL_INDEX
+
+_WORDS = TfidfVectorizer(stop_words='english').build_analyzer()
+
+
+def role_terms(text):
+    """Terms of `text`: its words minus stop words, plus one `skill:<name>`
+    term per canonical skill mentioned, so aliases ("k8s", "Kubernetes")
+    count as the same term. Terms only depend on the text and the canonical
+    names, so they are stable enough to hash into persisted vectors."""
+    names = SKILL_INDEX.names
+    return _WORDS(text) + [f'skill:{names[skill_id]}' for skill_id in SKILL_INDEX.find_ids(text)]
+
+
+def role_document(info):
+    """Text a JOB_ROLES entry is represented by"""
+    recommended = info.get('recommended_skills', {})
+    return '\n'.join([
+        info.get('description', ''),
+        ', '.join(info.get('required_skills', [])),
+        ', '.join(recommended.get('technical', [])),
+        ', '.join(recommended.get('soft', [])),
+    ])
+
+
+class RoleSimilarity:
+    """TF-IDF model over JOB_ROLES, fitted once and kept as a sparse matrix.
+
+    Role vectors are L2-normalized rows of `role_matrix`, so scoring a resume
+    against every role is a single sparse matrix-vector product.
+    """
+
+    def __init__(self, job_roles):
+        self.roles = [(category, role) for category, roles in job_roles.items() for role in roles]
+        documents = [role_document(job_roles[category][role]) for category, role in self.roles]
+        self.vectorizer = TfidfVectorizer(analyzer=role_terms, sublinear_tf=True)
+        self.role_matrix = self.vectorizer.fit_transform(documents).tocsr()
+
+    def similarities(self, text):
+        """Cosine similarity of `text` to every role, in `self.roles` order"""
+        vector = self.vectorizer.transform([text])
+        return np.asarray((self.role_matrix @ vector.T).todense()).ravel()
+
+    def rank(self, text, limit=None):
+        """Roles ordered by similarity to `text`, best first"""
+        scores = self.similarities(text)
+        order = np.argsort(-scores, kind='stable')[:limit]
+        return [
+            {'category': self.roles[i][0], 'role': self.roles[i][1], 'score': round(float(scores[i]) * 100, 2)}
+            for i in order
+        ]
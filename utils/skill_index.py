@@ -0,0 +1,98 @@
+import re
+from collections import Counter
+from config.skills import SKILL_ALIASES
+
+# Lowercased words as skills are written: "c++", "c#", "node.js" and "r&d"
+# are single tokens, while "-", "/" and whitespace separate tokens.
+_TOKEN_RE = re.compile(r'[a-z0-9+#&]+(?:\.[a-z0-9+#&]+)*')
+
+# Trie key holding the skill ID of the alias that ends at a node
+_END = None
+
+
+def skill_tokens(phrase):
+    """Tokens of `phrase` as the index compares them"""
+    return tuple(_TOKEN_RE.findall(phrase.lower()))
+
+
+class SkillIndex:
+    """Canonical skills compiled into a token trie with interned integer IDs.
+
+    Skill IDs index `names`; `alias_ids` maps every alias (as a token tuple)
+    straight to its ID, and the trie finds every alias occurring in a text in
+    one pass over its tokens.
+    """
+
+    def __init__(self, aliases):
+        self.names = []
+        self.alias_ids = {}
+        self.trie = {}
+        for name, variants in aliases.items():
+            skill_id = len(self.names)
+            self.names.append(name)
+            for alias in (name, *variants):
+                tokens = skill_tokens(alias)
+                if not tokens:
+                    continue
+                existing = self.alias_ids.setdefault(tokens, skill_id)
+                if existing != skill_id:
+                    raise ValueError(f"Skill alias '{alias}' is listed under both "
+                                     f"'{self.names[existing]}' and '{name}'")
+                node = self.trie
+                for token in tokens:
+                    node = node.setdefault(token, {})
+                node[_END] = skill_id
+
+    def canonical_id(self, phrase):
+        """ID of the skill `phrase` names, or None if it is not a known alias"""
+        return self.alias_ids.get(skill_tokens(phrase))
+
+    def canonical_name(self, phrase):
+        """Canonical spelling of `phrase`, or `phrase` stripped if it is unknown"""
+        skill_id = self.canonical_id(phrase)
+        return phrase.strip() if skill_id is None else self.names[skill_id]
+
+    def find_ids(self, text):
+        """IDs of every skill with an alias occurring in `text` as whole words.
+
+        Tokens are streamed and matched against every partial alias still
+        open, so no token list or (for lowercase input) copy of `text` is built.
+        """
+        if not text.islower():
+            text = text.lower()
+        trie = self.trie
+        found = set()
+        open_nodes = []
+        for match in _TOKEN_RE.finditer(text):
+            token = match.group()
+            next_nodes = []
+            for node in open_nodes + [trie]:
+                node = node.get(token)
+                if node is not None:
+                    skill_id = node.get(_END)
+                    if skill_id is not None:
+                        found.add(skill_id)
+                    next_nodes.append(node)
+            open_nodes = next_nodes
+        return found
+
+    def count_skills(self, skills):
+        """Counter of canonical skill name -> occurrences in `skills`.
+
+        Known skills are tallied by ID, so every alias counts towards its
+        canonical name; unknown skills are counted under their stripped text.
+        """
+        by_id = Counter()
+        counts = Counter()
+        for skill in skills:
+            skill_id = self.canonical_id(skill)
+            if skill_id is not None:
+                by_id[skill_id] += 1
+            elif skill.strip():
+                counts[skill.strip()] += 1
+        for skill_id, count in by_id.items():
+            counts[self.names[skill_id]] += count
+        return counts
+
+
+SKILL_INDEX = SkillIndex(SKILL_ALIASES)
@@ -0,0 +1,290 @@
+"""Similar-resume search over the stored resume_data rows.
+
+Resumes are embedded with a HashingVectorizer, which needs no fitted
+vocabulary, so a new resume can be added without touching existing vectors.
+Vectors live in immutable segment files, each a CSC matrix (one row per
+resume, one column per hashed feature) plus the resume IDs of its rows. A
+query only reads the columns of the features it contains, so its cost
+tracks the postings of those features rather than the size of the index.
+
+Every add writes a small segment; once there are more than `max_segments`
+the small ones are merged, and `compact()` merges everything into one.
+Several processes (web workers, the CLI below) can share one directory:
+changes are made under an exclusive lock on its LOCK file, after re-reading
+the segments on disk, so sequence numbers come from the directory rather
+than from any one process, and queries pick up segments other processes
+added or merged. Run
+`python -m utils.vector_index rebuild` to index the resumes already in
+resumes.db, or `python -m utils.vector_index compact` from a periodic job.
+"""
+import contextlib
+import os
+import re
+import sqlite3
+import sys
+import threading
+import numpy as np
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import HashingVectorizer
+from utils.role_similarity import role_terms
+
+try:
+    import fcntl
+except ImportError:  # Windows: a single process owns the index
+    fcntl = None
+
+VECTOR_INDEX_DIR = 'vector_index'
+
+# resume_data columns a resume is indexed by, in order
+INDEX_FIELDS = ('target_role', 'summary', 'skills', 'experience', 'projects', 'education')
+
+_SEGMENT_RE = re.compile(r'segment-(\d+)-(\d+)\.npz$')
+LOCK_FILE = 'LOCK'
+
+
+def resume_index_text(resume_data):
+    """Text indexed for a resume, from a resume_data row or the dict saved as one.
+
+    Lists and dicts are rendered with str(), exactly as save_resume_data
+    stores them, so a live add and a rebuild from the database agree.
+    """
+    return '\n'.join(str(resume_data[field]) for field in INDEX_FIELDS
+                     if field in resume_data.keys() and resume_data[field])
+
+
+class Segment:
+    """One immutable slice of the index: resume IDs and their CSC row vectors"""
+
+    def __init__(self, first, last, ids, matrix):
+        self.first = first
+        self.last = last
+        self.ids = ids
+        self.matrix = matrix
+
+    def __len__(self):
+        return len(self.ids)
+
+    @property
+    def filename(self):
+        return f'segment-{self.first:08d}-{self.last:08d}.npz'
+
+    @classmethod
+    def load(cls, path):
+        first, last = (int(part) for part in _SEGMENT_RE.search(path).groups())
+        with np.load(path) as arrays:
+            matrix = sp.csc_matrix((arrays['data'], arrays['indices'], arrays['indptr']),
+                                   shape=tuple(arrays['shape']))
+            return cls(first, last, arrays['ids'], matrix)
+
+    def save(self, directory):
+        path = os.path.join(directory, self.filename)
+        temporary = path + '.tmp'
+        with open(temporary, 'wb') as f:
+            np.savez(f, ids=self.ids, data=self.matrix.data, indices=self.matrix.indices,
+                     indptr=self.matrix.indptr, shape=np.array(self.matrix.shape))
+        os.replace(temporary, path)
+        return path
+
+
+class VectorIndex:
+    """Persisted hashed-feature vectors of stored resumes with top-k cosine search"""
+
+    def __init__(self, directory=VECTOR_INDEX_DIR, n_features=2 ** 20, max_segments=8,
+                 small_segment=4096):
+        self.directory = directory
+        self.max_segments = max_segments
+        self.small_segment = small_segment
+        # L2-normalized rows, so a dot product is the cosine similarity
+        self.vectorizer = HashingVectorizer(analyzer=role_terms, n_features=n_features,
+                                            alternate_sign=False, norm='l2', dtype=np.float32)
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+        self._listing = None
+        self._publish(())
+        with self._lock, self._directory_lock(exclusive=True):
+            self._load(cleanup=True)
+
+    def __len__(self):
+        return len(self._snapshot[1])
+
+    @property
+    def _segments(self):
+        return self._snapshot[0]
+
+    def _publish(self, segments):
+        """Swap in a new segment list with the row-aligned resume IDs queries
+        need and, if a resume was re-added, a mask of its older rows"""
+        ids = np.concatenate([segment.ids for segment in segments]) if segments else np.empty(0, np.int64)
+        shadowed = None
+        if len(np.unique(ids)) != len(ids):
+            _, newest = np.unique(ids[::-1], return_index=True)
+            shadowed = np.ones(len(ids), dtype=bool)
+            shadowed[len(ids) - 1 - newest] = False
+        # Queries read this tuple once, so they never see a half-applied change
+        self._snapshot = (segments, ids, shadowed)
+
+    @contextlib.contextmanager
+    def _directory_lock(self, exclusive):
+        """Lock shared by every process using the directory: exclusive to
+        change segments, shared to read them"""
+        if fcntl is None:
+            yield
+            return
+        with open(os.path.join(self.directory, LOCK_FILE), 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _segment_files(self):
+        return tuple(sorted(name for name in os.listdir(self.directory) if _SEGMENT_RE.match(name)))
+
+    def _load(self, cleanup=False):
+        """Publish the segments on disk, reusing the ones already loaded
+        (caller holds both locks; `cleanup` needs the exclusive one)"""
+        listing = self._segment_files()
+        current = {segment.filename: segment for segment in self._segments}
+        loaded = [current.get(name) or Segment.load(os.path.join(self.directory, name)) for name in listing]
+        loaded.sort(key=lambda segment: (segment.first, -segment.last))
+        segments = []
+        for segment in loaded:
+            if segments and segment.last <= segments[-1].last:
+                # Covered by a merged segment: left over from an interrupted
+                # merge, or one another process is about to remove
+                if cleanup:
+                    self._remove_file(segment)
+                continue
+            segments.append(segment)
+        self._publish(tuple(segments))
+        self._listing = self._segment_files() if cleanup else listing
+
+    def _refresh(self):
+        """Reload if another process added, merged or removed segments"""
+        if self._segment_files() != self._listing:
+            with self._lock, self._directory_lock(exclusive=False):
+                self._load()
+
+    def _remove_file(self, segment):
+        try:
+            os.remove(os.path.join(self.directory, segment.filename))
+        except FileNotFoundError:
+            pass
+
+    def _next_sequence(self):
+        """Next segment number; only valid right after _load under the
+        exclusive directory lock"""
+        return self._segments[-1].last + 1 if self._segments else 0
+
+    def vectorize(self, texts):
+        return self.vectorizer.transform(texts)
+
+    def add_many(self, resume_ids, texts):
+        """Append resumes as one new segment, merging small segments if needed"""
+        if not resume_ids:
+            return
+        matrix = self.vectorize(texts).tocsc()
+        with self._lock, self._directory_lock(exclusive=True):
+            self._load(cleanup=True)
+            sequence = self._next_sequence()
+            segment = Segment(sequence, sequence, np.asarray(resume_ids, dtype=np.int64), matrix)
+            segment.save(self.directory)
+            self._publish(self._segments + (segment,))
+            if len(self._segments) > self.max_segments:
+                self._merge(lambda segment: len(segment) < self.small_segment)
+            self._listing = self._segment_files()
+
+    def add(self, resume_id, text):
+        self.add_many([resume_id], [text])
+
+    def compact(self):
+        """Merge every segment into one, keeping the newest vector of each resume"""
+        with self._lock, self._directory_lock(exclusive=True):
+            self._load(cleanup=True)
+            self._merge(lambda segment: True)
+            self._listing = self._segment_files()
+
+    def _merge(self, selected):
+        """Merge the longest run of adjacent selected segments (caller holds both locks)"""
+        runs = []
+        for position, segment in enumerate(self._segments):
+            if selected(segment):
+                if runs and runs[-1][1] == position:
+                    runs[-1][1] = position + 1
+                else:
+                    runs.append([position, position + 1])
+        # A lone segment is only rewritten to drop shadowed rows
+        runs = [run for run in runs if run[1] - run[0] > 1 or self._snapshot[2] is not None]
+        if not runs:
+            return
+        start, stop = max(runs, key=lambda run: run[1] - run[0])
+        inputs = self._segments[start:stop]
+
+        ids = np.concatenate([segment.ids for segment in inputs])
+        matrix = sp.vstack([segment.matrix for segment in inputs], format='csr')
+        # Keep only the newest row of each resume ID
+        reversed_ids = ids[::-1]
+        _, last_positions = np.unique(reversed_ids, return_index=True)
+        keep = np.sort(len(ids) - 1 - last_positions)
+        merged = Segment(inputs[0].first, inputs[-1].last, ids[keep], matrix[keep].tocsc())
+        merged.save(self.directory)
+        self._publish(self._segments[:start] + (merged,) + self._segments[stop:])
+        for segment in inputs:
+            if segment.filename != merged.filename:
+                self._remove_file(segment)
+
+    def query(self, text, k=10, exclude=()):
+        """Top `k` (resume_id, cosine similarity) pairs for `text`, best first"""
+        if k < 1:
+            return []
+        self._refresh()
+        vector = self.vectorize([text])
+        columns, weights = vector.indices, vector.data
+        if not len(columns):
+            return []
+        segments, ids, shadowed = self._snapshot
+        if not len(ids):
+            return []
+        scores = np.concatenate([segment.matrix[:, columns] @ weights for segment in segments])
+        if shadowed is not None:
+            scores[shadowed] = 0
+        if exclude:
+            scores[np.isin(ids, list(exclude))] = 0
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind='stable')]
+        return [(int(ids[i]), float(scores[i])) for i in top if scores[i] > 0]
+
+    def rebuild(self, rows, batch_size=1000):
+        """Replace the index with `rows` (resume_data rows with an `id` column)"""
+        with self._lock, self._directory_lock(exclusive=True):
+            self._load(cleanup=True)
+            for segment in self._segments:
+                self._remove_file(segment)
+            self._publish(())
+            self._listing = self._segment_files()
+        batch_ids, batch_texts = [], []
+        for row in rows:
+            batch_ids.append(row['id'])
+            batch_texts.append(resume_index_text(row))
+            if len(batch_ids) >= batch_size:
+                self.add_many(batch_ids, batch_texts)
+                batch_ids, batch_texts = [], []
+        self.add_many(batch_ids, batch_texts)
+        self.compact()
+
+
+if __name__ == '__main__':
+    command = sys.argv[1] if len(sys.argv) > 1 else ''
+    if command not in ('rebuild', 'compact'):
+        print("Usage: python -m utils.vector_index rebuild|compact")
+        sys.exit(2)
+    index = VectorIndex()
+    if command == 'rebuild':
+        conn = sqlite3.connect('resumes.db')
+        conn.row_factory = sqlite3.Row
+        index.rebuild(conn.execute(f"SELECT id, {', '.join(INDEX_FIELDS)} FROM resume_data ORDER BY id"))
+        conn.close()
+    else:
+        index.compact()
+    print(f"{len(index)} resumes in {len(index._segments)} segment(s)")